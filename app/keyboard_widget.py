@@ -7,14 +7,18 @@ used for velocity, mod, and pitch wheels.
 """
 
 from PySide6.QtWidgets import QWidget, QPushButton, QGridLayout, QHBoxLayout, QVBoxLayout, QLabel, QSlider, QApplication, QSizePolicy, QCheckBox, QFrame
-from PySide6.QtCore import Qt, QSize, QEvent, QPropertyAnimation, QEasingCurve, QRectF, QTimer, QMimeData
-from PySide6.QtGui import QPainter, QColor, QDrag
+from PySide6.QtCore import Qt, QSize, QEvent, QRect, QRectF, QTimer, QMimeData, QKeyCombination
+from PySide6.QtGui import QPainter, QColor, QDrag, QPixmap, QLinearGradient, QBrush, QPen, QShortcut, QKeySequence
+from enum import IntEnum
 from typing import Optional
 import random
+from collections import OrderedDict
+from bisect import bisect_right
+from functools import lru_cache
 from .models import Layout, KeyDef
-from .midi_io import MidiOut
-from .scale import quantize
+from .midi_io import MidiOut, send_queue
 from .chord_selector import detect_chord, NOTES
+from .themes import KEYBOARD_HEADER_STYLES, KEYBOARD_KEY_STYLES
 
 
 class ChordDropTarget(QFrame):
@@ -108,18 +112,15 @@ class ChordDropTarget(QFrame):
                 # First, turn off any currently latched notes
                 self.keyboard_widget._perform_all_notes_off()
                 
-                # Calculate the total octave offset (base_octave + user octave_offset)
-                total_octave_offset = (
-                    self.keyboard_widget.layout_model.base_octave + 
-                    self.keyboard_widget.octave_offset
-                )
+                # Semitone shift from base to effective notes (base_octave + user octave_offset)
+                note_shift = self.keyboard_widget._note_shift
                 
                 # Latch each note from the chord
                 for note in actual_notes:
                     # Find the base note (without octave offset) for this MIDI note
                     # effective_note = base_note + 12 * (base_octave + octave_offset)
                     # So: base_note = effective_note - 12 * (base_octave + octave_offset)
-                    base_note = note - (12 * total_octave_offset)
+                    base_note = note - note_shift
                     ch = self.keyboard_widget.midi_channel
                     
                     # Check if this note is already active
@@ -127,11 +128,12 @@ class ChordDropTarget(QFrame):
                         # Turn on the note
                         vel = self.keyboard_widget._compute_velocity(100)
                         try:
-                            self.keyboard_widget.midi.note_on(note, vel, ch)
+                            self.keyboard_widget._post_midi('note_on', note, vel, ch)
                         except Exception:
                             pass
                         self.keyboard_widget.active_notes.add((note, ch))
-                        self.keyboard_widget._voice_order.append((note, ch, base_note))
+                        self.keyboard_widget._voice_order[(note, ch)] = base_note
+                        self.keyboard_widget._voice_order.move_to_end((note, ch))
                         self.keyboard_widget._last_played_note = note
                         
                         # Apply held visual to the key if it exists
@@ -239,23 +241,151 @@ class KeyboardChordCard(QFrame):
         """Reset cursor on release."""
         self.setCursor(Qt.OpenHandCursor)
 
-def velocity_curve(v_in: int, curve: str) -> int:
+
+# Size policies shared by every keyboard (setSizePolicy copies the value)
+_SP_FIXED = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+_SP_PREF_FIXED = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+_SP_EXP_FIXED = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+# Unscaled left-panel width indexed by the number of visible wheels (0, 1 or 2)
+_LEFT_PANEL_BASE_W = (0, 44, 80)
+
+# Shared groove/handle look for the velocity slider and the mod/pitch wheels.
+# Filled with pixel sizes derived from the UI scale by KeyboardWidget._slider_qss_for.
+_SLIDER_QSS_TEMPLATE = (
+    "QSlider::groove:horizontal {"
+    "  height: %(gh)dpx;"
+    "  background: #3a3f46;"
+    "  border: 1px solid #2a2f35;"
+    "  border-radius: 3px;"
+    "}"
+    "QSlider::sub-page:horizontal {"
+    "  background: #61b3ff;"
+    "  border: 1px solid #2f82e6;"
+    "  border-radius: 3px;"
+    "}"
+    "QSlider::add-page:horizontal {"
+    "  background: transparent;"
+    "}"
+    "QSlider::handle:horizontal {"
+    "  width: %(hw)dpx;"
+    "  height: %(hh)dpx;"
+    "  background: #eaeaea;"
+    "  border: 1px solid #5a5f66;"
+    "  border-radius: 3px;"
+    "  margin: -%(m)dpx 0; /* extend handle vertically to overlap groove */"
+    "}"
+    "QSlider::groove:vertical {"
+    "  width: %(vmw)dpx;"
+    "  background: #3a3f46;"
+    "  border: 1px solid #2a2f35;"
+    "  border-radius: 3px;"
+    "}"
+    "QSlider::sub-page:vertical {"
+    "  background: transparent;"
+    "}"
+    "QSlider::add-page:vertical {"
+    "  background: #61b3ff;"
+    "  border: 1px solid #2f82e6;"
+    "  border-radius: 3px;"
+    "}"
+    "QSlider::handle:vertical {"
+    "  height: %(vhh)dpx;"
+    "  width: %(vhw)dpx;"
+    "  background: #eaeaea;"
+    "  border: 1px solid #5a5f66;"
+    "  border-radius: 3px;"
+    "  margin: 0 -%(m)dpx; /* extend handle horizontally to overlap groove */"
+    "}"
+    "border: 1px solid #444; border-radius: 3px;"
+)
+
+def _install_header_styles():
+    """Append the shared keyboard header styles to the application stylesheet once."""
+    app = QApplication.instance()
+    if app is None:
+        return
+    try:
+        qss = app.styleSheet()
+        if KEYBOARD_HEADER_STYLES not in qss:
+            app.setStyleSheet(qss + KEYBOARD_HEADER_STYLES)
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=128)
+def _black_key_def(note: int) -> KeyDef:
+    """Return the shared :class:`KeyDef` for a black key.
+
+    Black keys are not part of the layout model, so they are synthesized
+    here once per note and reused across rebuilds and keyboards.
+    """
+    return KeyDef(
+        label="",
+        note=note,
+        color="black",
+        width=0.7,
+        height=1.0,
+        velocity=100,
+        channel=0,
+    )
+
+
+def _piano_key_geometry(white_keys, scale: float):
+    """Compute key rectangles for a row of white keys at the given UI scale.
+
+    Black keys are placed after C, D, F, G and A; none is placed after the
+    last white key so the keyboard never ends on a black key.
+
+    Returns:
+        ``(whites, blacks, row_width)`` where each entry of ``whites`` and
+        ``blacks`` is ``(x, width, height, KeyDef)`` and ``row_width`` is the
+        summed white-key width including spacers.
+    """
+    whites = []
+    x_pos = 0
+    white_h = int(134 * scale)
+    for white_key in white_keys:
+        w = int(44 * scale * white_key.width)
+        if white_key.note >= 0:  # Skip spacer keys
+            whites.append((x_pos, w, white_h, white_key))
+        # advance by full width (no -1; gaps are visual only)
+        x_pos += w
+    blacks = []
+    black_dx = int(32 * scale)  # centered between adjacent whites
+    black_w, black_h = int(28 * scale), int(68 * scale)
+    for white_x, _, _, white_key in whites[:-1]:
+        if white_key.note % 12 in (0, 2, 5, 7, 9):
+            blacks.append((white_x + black_dx, black_w, black_h, _black_key_def(white_key.note + 1)))
+    return whites, blacks, x_pos
+
+class VelCurve(IntEnum):
+    """Velocity response curves; values index the ``_VEL_LUT`` tables."""
+
+    LINEAR = 0
+    SOFT = 1
+    HARD = 2
+
+
+# Per-curve output velocity indexed by clamped input velocity (index 0 unused)
+_VEL_LUT = (
+    bytes(range(128)),                                         # LINEAR
+    bytes(int((v / 127) ** 0.7 * 127) for v in range(128)),   # SOFT
+    bytes(int((v / 127) ** 1.5 * 127) for v in range(128)),   # HARD
+)
+
+def velocity_curve(v_in: int, curve: VelCurve) -> int:
     """Apply a velocity response curve.
 
     Args:
         v_in: Raw input velocity, clamped into ``[1, 127]``.
-        curve: ``"soft"`` raises to a 0.7 power, ``"hard"`` to 1.5; any
-            other value is treated as linear.
+        curve: ``SOFT`` raises to a 0.7 power, ``HARD`` to 1.5, ``LINEAR``
+            passes the clamped value through.
 
     Returns:
         The shaped velocity in ``[1, 127]``.
     """
-    v = max(1, min(127, v_in))
-    if curve == "soft":
-        return int((v / 127) ** 0.7 * 127)
-    if curve == "hard":
-        return int((v / 127) ** 1.5 * 127)
-    return v
+    return _VEL_LUT[curve][max(1, min(127, v_in))]
 
 class ClickAnywhereSlider(QSlider):
     """QSlider variant where clicking the groove jumps the handle and starts a drag."""
@@ -265,14 +395,15 @@ class ClickAnywhereSlider(QSlider):
         if event.button() == Qt.LeftButton:
             # Map click position to value range immediately
             if self.orientation() == Qt.Vertical:
-                h = max(1, self.height())
+                span = max(1, self.height())
                 # Invert because top is max
-                frac = 1.0 - min(1.0, max(0.0, event.position().y() / h))
+                px = span - min(span, max(0, int(event.position().y())))
             else:
-                w = max(1, self.width())
-                frac = min(1.0, max(0.0, event.position().x() / w))
+                span = max(1, self.width())
+                px = min(span, max(0, int(event.position().x())))
             vmin, vmax = self.minimum(), self.maximum()
-            new_val = int(round(vmin + frac * (vmax - vmin)))
+            # Integer rounding: vmin + round(px / span * range)
+            new_val = vmin + (px * (vmax - vmin) + span // 2) // span
             try:
                 self.setSliderDown(True)
             except Exception:
@@ -294,7 +425,7 @@ class DragReferenceSlider(QSlider):
         """Construct the slider and clear drag-tracking state."""
         super().__init__(orientation, parent)
         self._drag_active = False
-        self._press_pos = None
+        self._press_px: int | None = None  # press coordinate along the slider axis
         self._press_value = None
 
     def mousePressEvent(self, event):  # type: ignore[override]
@@ -302,7 +433,8 @@ class DragReferenceSlider(QSlider):
         if event.button() != Qt.LeftButton:
             return super().mousePressEvent(event)
         self._drag_active = True
-        self._press_pos = event.position()
+        pos = event.position()
+        self._press_px = int(pos.y() if self.orientation() == Qt.Vertical else pos.x())
         try:
             self._press_value = int(self.value())
         except Exception:
@@ -314,27 +446,31 @@ class DragReferenceSlider(QSlider):
 
     def mouseMoveEvent(self, event):  # type: ignore[override]
         """Translate cursor delta into a value delta proportional to slider span."""
-        if not self._drag_active or self._press_pos is None or self._press_value is None:
+        if not self._drag_active or self._press_px is None or self._press_value is None:
             return super().mouseMoveEvent(event)
-        rng = max(1, int(self.maximum()) - int(self.minimum()))
+        vmin, vmax = self.minimum(), self.maximum()
+        rng = max(1, vmax - vmin)
         # Determine pixel span
         if self.orientation() == Qt.Vertical:
-            span = max(1.0, self.height() - 8.0)
-            delta_px = self._press_pos.y() - event.position().y()  # up increases value
+            span = max(1, self.height() - 8)
+            delta_px = self._press_px - int(event.position().y())  # up increases value
+        else:
+            span = max(1, self.width() - 8)
+            delta_px = int(event.position().x()) - self._press_px
+        # Map pixels to value delta (1 full span = full range), rounding half away from zero
+        half = span // 2
+        if delta_px >= 0:
+            dv = (delta_px * rng + half) // span
         else:
-            span = max(1.0, self.width() - 8.0)
-            delta_px = event.position().x() - self._press_pos.x()
-        # Map pixels to value delta; 1 full span = full range
-        dv = int(round((delta_px / span) * rng))
-        new_val = int(self._press_value) + dv
-        new_val = max(int(self.minimum()), min(int(self.maximum()), new_val))
-        self.setValue(new_val)
+            dv = -((-delta_px * rng + half) // span)
+        new_val = self._press_value + dv
+        self.setValue(vmin if new_val < vmin else vmax if new_val > vmax else new_val)
 
     def mouseReleaseEvent(self, event):  # type: ignore[override]
         """End the relative-drag session and clear the cached reference state."""
         if self._drag_active:
             self._drag_active = False
-            self._press_pos = None
+            self._press_px = None
             self._press_value = None
             try:
                 self.setSliderDown(False)
@@ -349,6 +485,14 @@ class RangeSlider(QWidget):
     to slide the whole range; clicks outside the range are ignored.
     """
 
+    # Fixed paint colors, built once instead of parsed from hex on every paint
+    _GROOVE_BRUSH = QBrush(QColor('#3a3f46'))
+    _GROOVE_PEN = QPen(QColor('#2a2f35'))
+    _SEL_BRUSH = QBrush(QColor('#61b3ff'))
+    _SEL_PEN = QPen(QColor('#2f82e6'))
+    _HANDLE_BRUSH = QBrush(QColor('#eaeaea'))
+    _HANDLE_PEN = QPen(QColor('#5a5f66'))
+
     def __init__(self, minimum=1, maximum=127, low=64, high=100, parent=None):
         """Build the range slider with the given bounds and initial selection."""
         super().__init__(parent)
@@ -364,13 +508,30 @@ class RangeSlider(QWidget):
         self._init_high = None
         self.setMinimumHeight(22)
         self.setMouseTracking(True)
+        self._refresh_scale()
+
+    def _refresh_scale(self):
+        """Cache the value<->pixel mapping constants for the current width and range."""
+        self._usable_w = max(1, self.width() - 10)
+        self._inv_rng = 1.0 / max(1, self._max - self._min)
+        # Value units per pixel for _pos_to_value; pixels per value for _value_to_pos
+        self._val_per_px = (self._max - self._min) / self._usable_w
+        self._px_per_val = self._inv_rng * (self.width() - 10)
+
+    def resizeEvent(self, ev):  # type: ignore[override]
+        """Refresh cached mapping constants when the widget width changes."""
+        self._refresh_scale()
+        super().resizeEvent(ev)
 
     def setRange(self, minimum: int, maximum: int):
         """Update the slider's value bounds and re-clamp the current selection."""
+        if (int(minimum), int(maximum)) == (self._min, self._max):
+            return
         self._min = int(minimum)
         self._max = int(maximum)
         self._low = max(self._min, min(self._low, self._max))
         self._high = max(self._min, min(self._high, self._max))
+        self._refresh_scale()
         self.update()
 
     def setValues(self, low: int, high: int):
@@ -378,9 +539,11 @@ class RangeSlider(QWidget):
         low, high = int(low), int(high)
         if low > high:
             low, high = high, low
+        old = (self._low, self._high)
         self._low = max(self._min, min(low, self._max))
         self._high = max(self._min, min(high, self._max))
-        self.update()
+        if (self._low, self._high) != old:
+            self.update()
 
     def values(self):
         """Return ``(low, high)`` for the current selection as integers."""
@@ -388,15 +551,12 @@ class RangeSlider(QWidget):
 
     def _pos_to_value(self, x: float) -> int:
         """Map a widget x-coordinate to a clamped integer value."""
-        w = max(1, self.width() - 10)
-        frac = min(1.0, max(0.0, (x - 5) / w))
-        return int(round(self._min + frac * (self._max - self._min)))
+        px = min(self._usable_w, max(0.0, x - 5))
+        return int(round(self._min + px * self._val_per_px))
 
     def _value_to_pos(self, v: int) -> float:
         """Map an integer value to its x-coordinate in widget space."""
-        rng = max(1, self._max - self._min)
-        frac = (int(v) - self._min) / rng
-        return 5 + frac * (self.width() - 10)
+        return 5 + (int(v) - self._min) * self._px_per_val
 
     def paintEvent(self, _):  # type: ignore[override]
         """Render the groove, the highlighted selection band, and both handles."""
@@ -405,25 +565,32 @@ class RangeSlider(QWidget):
         # Groove (thicker)
         groove_h = 8
         groove = QRectF(5, self.height() / 2 - groove_h/2, max(1, self.width() - 10), groove_h)
-        p.setBrush(QColor('#3a3f46'))
-        p.setPen(QColor('#2a2f35'))
+        p.setBrush(self._GROOVE_BRUSH)
+        p.setPen(self._GROOVE_PEN)
         p.drawRoundedRect(groove, 3, 3)
         # Range selection
         x1 = self._value_to_pos(self._low)
         x2 = self._value_to_pos(self._high)
         sel = QRectF(min(x1, x2), groove.top(), max(2.0, abs(x2 - x1)), groove_h)
-        p.setBrush(QColor('#61b3ff'))
-        p.setPen(QColor('#2f82e6'))
+        p.setBrush(self._SEL_BRUSH)
+        p.setPen(self._SEL_PEN)
         p.drawRoundedRect(sel, 3, 3)
         # Handles
         handle_w, handle_h = 12, 20
+        p.setBrush(self._HANDLE_BRUSH)
+        p.setPen(self._HANDLE_PEN)
         for xv in (x1, x2):
             handle = QRectF(xv - handle_w/2, self.height() / 2 - handle_h/2, handle_w, handle_h)
-            p.setBrush(QColor('#eaeaea'))
-            p.setPen(QColor('#5a5f66'))
             p.drawRoundedRect(handle, 3, 3)
         p.end()
 
+    def _band_rect(self, low: int, high: int) -> QRect:
+        """Return the widget rect covered by the selection ``low..high`` and its handles."""
+        x1 = self._value_to_pos(low)
+        x2 = self._value_to_pos(high)
+        left = int(min(x1, x2)) - 7  # half handle width plus antialiasing margin
+        return QRect(left, 0, int(abs(x2 - x1)) + 15, self.height())
+
     def _handle_rects(self):
         """Return (low_rect, high_rect) in widget coordinates."""
         handle_w, handle_h = 12, 20
@@ -464,6 +631,7 @@ class RangeSlider(QWidget):
         if self._dragging is None:
             return super().mouseMoveEvent(ev)
         v = self._pos_to_value(ev.position().x())
+        old = (self._low, self._high)
         if self._dragging == 'low':
             self._low = max(self._min, min(v, self._high))
         elif self._dragging == 'high':
@@ -481,7 +649,10 @@ class RangeSlider(QWidget):
                 new_high = self._max
                 new_low = new_high - width
             self._low, self._high = int(new_low), int(new_high)
-        self.update()
+        # Sub-step motion maps to the same values; skip the repaint
+        if (self._low, self._high) != old:
+            # Repaint only the band covering the old and new selection/handles
+            self.update(self._band_rect(*old).united(self._band_rect(self._low, self._high)))
 
     def mouseReleaseEvent(self, ev):  # type: ignore[override]
         """End any active drag and clear the cached drag-start values."""
@@ -491,6 +662,62 @@ class RangeSlider(QWidget):
         self._init_high = None
         return super().mouseReleaseEvent(ev)
 
+class PianoContainer(QWidget):
+    """Absolute-positioning parent for the key buttons.
+
+    Paints the dark instrument-panel gradient from a pixmap rendered once per
+    size instead of re-evaluating a stylesheet gradient on every repaint, and
+    hands its mouse moves/releases straight to the owning keyboard's hover
+    and drag-glide handling.
+    """
+
+    def __init__(self, keyboard: "KeyboardWidget", parent=None):
+        """Create the container for ``keyboard`` with no cached background yet."""
+        super().__init__(parent)
+        self._keyboard = keyboard
+        self._bg_pix: QPixmap | None = None
+
+    def mouseMoveEvent(self, ev):  # type: ignore[override]
+        """Update key hover and, while dragging, glide to the key under the cursor."""
+        kb = self._keyboard
+        kb._update_hover(ev)
+        if kb.dragging:
+            kb._drag_mouse_event(ev)
+        super().mouseMoveEvent(ev)
+
+    def mouseReleaseEvent(self, ev):  # type: ignore[override]
+        """End an in-progress drag-glide on release."""
+        kb = self._keyboard
+        if kb.dragging:
+            kb._drag_mouse_event(ev)
+        super().mouseReleaseEvent(ev)
+
+    def resizeEvent(self, ev):  # type: ignore[override]
+        """Drop the cached background so it is rebuilt at the new size."""
+        self._bg_pix = None
+        super().resizeEvent(ev)
+
+    def _background(self) -> QPixmap:
+        """Return the background pixmap, rendering it on first use after a resize."""
+        if self._bg_pix is None or self._bg_pix.size() != self.size():
+            pix = QPixmap(self.size())
+            grad = QLinearGradient(0, 0, max(1, self.width()), 0)
+            grad.setColorAt(0.0, QColor('#1b1b1b'))
+            grad.setColorAt(0.5, QColor('#202020'))
+            grad.setColorAt(1.0, QColor('#1b1b1b'))
+            p = QPainter(pix)
+            p.fillRect(pix.rect(), QBrush(grad))
+            p.end()
+            self._bg_pix = pix
+        return self._bg_pix
+
+    def paintEvent(self, ev):  # type: ignore[override]
+        """Blit the cached gradient for the exposed region."""
+        p = QPainter(self)
+        r = ev.rect()
+        p.drawPixmap(r, self._background(), r)
+        p.end()
+
 class KeyboardWidget(QWidget):
     """Interactive piano keyboard with sustain, latch, polyphony cap, and CC wheels.
 
@@ -500,7 +727,15 @@ class KeyboardWidget(QWidget):
     follows the active chord when chord-monitoring is on.
     """
 
-    def __init__(self, layout_model: Layout, midi_out: MidiOut, title: str = "", show_header: bool = True, compact_controls: bool = True, scale: float = 1.0):
+    # Slider stylesheet per UI scale, shared by every keyboard instance
+    _slider_qss_cache: dict[float, str] = {}
+    # Random velocities drawn per refill when randomized velocity is on
+    _RND_BATCH = 4096
+    # Smallest pitch-bend change (of 16384 steps) worth sending; center and extremes always go out
+    _PB_MIN_DELTA = 32
+
+    def __init__(self, layout_model: Layout, midi_out: MidiOut, title: str = "", show_header: bool = True, compact_controls: bool = True, scale: float = 1.0,
+                 strict_noteoff: bool = False):
         """Build the keyboard from a precomputed :class:`Layout`.
 
         Args:
@@ -511,6 +746,8 @@ class KeyboardWidget(QWidget):
             show_header: Whether to display the on-keyboard control header.
             compact_controls: Use the compact button styling preset.
             scale: UI scale factor applied to fonts, padding, and key size.
+            strict_noteoff: Always release notes one by one in
+                :meth:`all_notes_off`, for devices that ignore CC 123.
         """
         super().__init__()
         self.layout_model = layout_model
@@ -518,25 +755,58 @@ class KeyboardWidget(QWidget):
         self.port_name: str | None = None
         self.midi_channel: int = 0  # 0-15, shown as 1-16
         self.octave_offset = 0
+        # Semitones added to a base note by effective_note; refreshed by change_octave
+        self._note_shift = 12 * self.layout_model.base_octave
         self.sustain = False
         self.latch = False
         self.chord_monitor = True  # Enable chord detection and display by default
         self.visual_hold_on_sustain = False  # whether sustained notes keep visual down state
         self.drag_while_sustain = True  # whether to allow dragging while sustain is active
         self.right_click_latch = True  # whether right-click acts as latch toggle (enabled by default)
-        self.vel_curve = "linear"
+        self.strict_noteoff = bool(strict_noteoff)  # per-note Note Off instead of CC 123 in all_notes_off
+        self.vel_curve = VelCurve.LINEAR
+        # Keyboard shortcuts (Z/X octave, 1/2/3 curve, Q quantize, Esc panic).
+        # Qt's shortcut map dispatches these while focus is on this widget or
+        # its children, so other keys never reach Python.
+        self._key_dispatch = {
+            Qt.Key_Z: lambda: self.change_octave(-1),
+            Qt.Key_X: lambda: self.change_octave(+1),
+            Qt.Key_1: lambda: self._set_vel_curve(VelCurve.LINEAR),
+            Qt.Key_2: lambda: self._set_vel_curve(VelCurve.SOFT),
+            Qt.Key_3: lambda: self._set_vel_curve(VelCurve.HARD),
+            Qt.Key_Q: self._toggle_quantize,
+            Qt.Key_Escape: self.all_notes_off,
+        }
+        # Keys act whatever modifiers are held, as they did when handled in
+        # keyPressEvent, so bind every Shift/Ctrl/Alt/Meta combination too
+        mod_masks = [Qt.KeyboardModifier.NoModifier]
+        for mod in (Qt.ShiftModifier, Qt.ControlModifier, Qt.AltModifier, Qt.MetaModifier):
+            mod_masks += [mask | mod for mask in mod_masks]
+        for key, fn in self._key_dispatch.items():
+            for mods in mod_masks:
+                shortcut = QShortcut(QKeySequence(QKeyCombination(mods, key)), self)
+                shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+                shortcut.activated.connect(fn)
         self.active_notes: set[tuple[int,int]] = set()
         self._right_click_latched: set[tuple[int,int]] = set()  # Notes latched via right-click
         # Polyphony control
         self.polyphony_enabled: bool = False
         self.polyphony_max: int = 8
-        self._voice_order: list[tuple[int,int,int]] = []  # (note, ch, base_note)
+        self._voice_order: OrderedDict[tuple[int,int], int] = OrderedDict()  # (note, ch) -> base_note, oldest first
         self._last_played_note: int | None = None  # Track most recently played note for sustain display
         self.dragging = False
         self.last_drag_key = None
         self.last_drag_button: QPushButton | None = None
         self._last_drag_note_base: int | None = None  # Track last dragged raw base note (key pitch class)
         self.key_buttons = {}  # Map from note to button
+        # Base notes whose key currently shows the active or held visual
+        self._lit_notes: set[int] = set()
+        # Key buttons currently showing the explicit hovered visual
+        self._hovered_btns: set[QPushButton] = set()
+        # Key buttons awaiting a deferred visual clear (see _schedule_visual_cleanup)
+        self._pending_visual_cleanup: set[QPushButton] = set()
+        # Drag target last swept by _clear_all_key_visuals_except (False: none yet)
+        self._drag_swept_btn: QPushButton | None | bool = False
         self.setWindowTitle(title or layout_model.name)
         # UI scale factor (zoom). Used for key geometry and certain panel widths.
         try:
@@ -547,10 +817,7 @@ class KeyboardWidget(QWidget):
         # Event filter will be installed on the piano container after it is created
         root = QVBoxLayout(self)
         # Do not allow vertical expansion; we'll size exactly to header + keys
-        try:
-            self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-        except Exception:
-            pass
+        self.setSizePolicy(_SP_PREF_FIXED)
         # Eliminate extra gaps around keyboard
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
@@ -566,32 +833,20 @@ class KeyboardWidget(QWidget):
         # First row: Octave controls, chord card, and action buttons
         header_row1 = QHBoxLayout()
         header_row1.setContentsMargins(0, 0, 0, 0)
-        try:
-            s = max(0.5, float(getattr(self, 'ui_scale', 1.0)))
-            header_row1.setSpacing(max(1, int(2 * s)))
-        except Exception:
-            header_row1.setSpacing(1)
         
         # Second row: Velocity controls
         header_row2 = QHBoxLayout()
         header_row2.setContentsMargins(0, 0, 0, 0)
-        try:
-            s = max(0.5, float(getattr(self, 'ui_scale', 1.0)))
-            header_row2.setSpacing(max(1, int(2 * s)))
-        except Exception:
-            header_row2.setSpacing(1)
+        # Row spacing scales with ui_scale (see _apply_ui_scale); the rows
+        # are only installed, and so only kept alive, when the header is shown
+        self._header_rows = (header_row1, header_row2) if self._show_header else ()
         self.oct_label = QLabel("Octave")
         # Octave +/- buttons
         self.oct_minus_btn = QPushButton("-")
         self.oct_plus_btn = QPushButton("+")
         for b in (self.oct_minus_btn, self.oct_plus_btn):
             b.setCursor(Qt.PointingHandCursor)
-            try:
-                b.setFixedWidth(int(20 * self.ui_scale))
-                b.setFixedHeight(int(18 * self.ui_scale))
-            except Exception:
-                pass
-            # Styling will be applied uniformly later via _apply_header_button_styles()
+            # Sized below with the other header controls
         self.oct_minus_btn.clicked.connect(lambda: self.change_octave(-1))
         self.oct_plus_btn.clicked.connect(lambda: self.change_octave(+1))
         
@@ -600,221 +855,53 @@ class KeyboardWidget(QWidget):
         self.sustain_btn.setCheckable(True)
         self.sustain_btn.clicked.connect(self.toggle_sustain)
         self.sustain_btn.setCursor(Qt.PointingHandCursor)
-        self.sustain_btn.setStyleSheet(
-            """
-            QPushButton {
-                padding: 1px 4px;
-                min-height: 0px;
-                border-radius: 3px;
-                border: 1px solid #888;
-                background-color: #f3f3f3;
-                color: #222;
-            }
-            QPushButton:checked {
-                background-color: #3498db; /* blue to match Latch */
-                color: white;
-                border: 1px solid #2980b9;
-            }
-            QPushButton:hover { background-color: #e9e9e9; }
-            QPushButton:pressed { background-color: #dcdcdc; }
-            QPushButton:checked:hover { background-color: #2f8ccc; }
-            QPushButton:checked:pressed { background-color: #2a7fb8; }
-            """
-        )
+        self.sustain_btn.setObjectName("kbSustainBtn")
         # Latch button (toggle)
         self.latch_btn = QPushButton("Latch: Off")
         self.latch_btn.setCheckable(True)
         self.latch_btn.clicked.connect(self.toggle_latch)
         self.latch_btn.setCursor(Qt.PointingHandCursor)
-        self.latch_btn.setStyleSheet(
-            """
-            QPushButton {
-                padding: 1px 4px;
-                min-height: 0px;
-                border-radius: 3px;
-                border: 1px solid #888;
-                background-color: #f3f3f3;
-                color: #222;
-            }
-            QPushButton:checked {
-                background-color: #3498db; /* blue */
-                color: white;
-                border: 1px solid #2980b9;
-            }
-            QPushButton:hover { background-color: #e9e9e9; }
-            QPushButton:pressed { background-color: #dcdcdc; }
-            QPushButton:checked:hover { background-color: #2f8ccc; }
-            QPushButton:checked:pressed { background-color: #2a7fb8; }
-            """
-        )
+        self.latch_btn.setObjectName("kbLatchBtn")
         self.all_off_btn = QPushButton("All Notes Off")
         self.all_off_btn.setCursor(Qt.PointingHandCursor)
         self.all_off_btn.clicked.connect(self.all_notes_off_clicked)
-        self.all_off_btn.setStyleSheet(
-            """
-            QPushButton {
-                padding: 1px 4px;
-                min-height: 0px;
-                border-radius: 3px;
-                border: 1px solid #888;
-                background-color: #fafafa;
-                color: #222;
-            }
-            QPushButton:hover { background-color: #f0f0f0; }
-            QPushButton:pressed { background-color: #e5e5e5; }
-            """
-        )
-        # Store base stylesheet for flash/revert behavior
-        try:
-            self._all_off_btn_base_qss = str(self.all_off_btn.styleSheet())
-        except Exception:
-            self._all_off_btn_base_qss = ""
+        self.all_off_btn.setObjectName("kbAllOffBtn")
+        # Header button look comes from the shared application-level sheet
+        _install_header_styles()
         
         self.vel_label = QLabel("Vel curve: linear")
         # Velocity controls: single slider and randomized range
         self.vel_random_chk = QCheckBox("Randomized Velocity")
         self.vel_random_chk.setToolTip("Randomize velocity within a range")
-        # Style checkbox to use the same blue as sliders, scaled by ui_scale
-        try:
-            s = max(0.5, float(getattr(self, 'ui_scale', 1.0)))
-            ind = int(14 * s)
-            sp = int(4 * s)
-            rad = max(2, int(3 * s))
-            font_px = max(9, int(11 * s))
-            self.vel_random_chk.setStyleSheet(
-                f"QCheckBox {{ color: #ddd; spacing: {sp}px; font-size: {font_px}px; }}"
-                "QCheckBox::indicator {"
-                f"  width: {ind}px; height: {ind}px;"
-                "  border: 1px solid #2a2f35;"
-                "  background: #2b2f36;"
-                f"  border-radius: {rad}px;"
-                "}"
-                "QCheckBox::indicator:hover { border: 1px solid #61b3ff; }"
-                "QCheckBox::indicator:checked {"
-                "  background: #61b3ff;"
-                "  border: 1px solid #2f82e6;"
-                "}"
-            )
-        except Exception:
-            pass
         self.vel_slider = QSlider(Qt.Horizontal)  # single value slider
         self.vel_slider.setMinimum(1)
         self.vel_slider.setMaximum(127)
         self.vel_slider.setValue(80)
+        # Fixed-velocity table indexed by key base velocity; rebuilt on slider/curve change
+        self._vel_lut = b""
+        self._curve_lut = b""
+        self._rebuild_vel_lut()
+        self.vel_slider.valueChanged.connect(self._rebuild_vel_lut)
         self.vel_range = RangeSlider(1, 127, low=64, high=88, parent=self)
+        # Batch of pre-drawn random velocities for the range above (see _next_random_velocity)
+        self._rnd_buf: list[int] = []
+        self._rnd_idx = 0
+        self._rnd_range: tuple[int, int] | None = None
         self.vel_range.setVisible(False)
         self.vel_random_chk.toggled.connect(self._toggle_vel_random)
         # Default to randomized velocity enabled
-        try:
-            self.vel_random_chk.setChecked(True)
-            # Ensure UI elements reflect the default state even if signal doesn't fire
-            self._toggle_vel_random(True)
-        except Exception:
-            pass
-        # Keep header small so small keyboards can shrink (but scale with ui_scale)
-        try:
-            self.vel_slider.setFixedWidth(int(200 * self.ui_scale))
-            self.vel_range.setFixedWidth(int(200 * self.ui_scale))
-            self.vel_slider.setFixedHeight(int(16 * self.ui_scale))
-            self.vel_range.setFixedHeight(int(20 * self.ui_scale))
-            self.vel_slider.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            self.vel_range.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            self.oct_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            self.vel_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            # Allow buttons to grow horizontally to avoid text clipping
-            self.sustain_btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-            self.latch_btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-            self.all_off_btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-            self.sustain_btn.setFixedHeight(int(18 * self.ui_scale))
-            self.latch_btn.setFixedHeight(int(18 * self.ui_scale))
-            self.all_off_btn.setFixedHeight(int(18 * self.ui_scale))
-            self.oct_label.setFixedHeight(int(16 * self.ui_scale))
-            self.vel_label.setFixedHeight(int(16 * self.ui_scale))
-        except Exception:
-            pass
-        # Apply unified slider styling to match RangeSlider look when visible
-        try:
-            s = max(0.5, float(getattr(self, 'ui_scale', 1.0)))
-            gh = int(8 * s)
-            hw = int(12 * s)
-            hh = int(20 * s)
-            vmw = int(8 * s)
-            vhh = int(12 * s)
-            vhw = int(20 * s)
-            m = int(6 * s)
-            slider_qss = (
-                f"QSlider::groove:horizontal {{"
-                f"  height: {gh}px;"
-                "  background: #3a3f46;"
-                "  border: 1px solid #2a2f35;"
-                "  border-radius: 3px;"
-                "}"
-                "QSlider::sub-page:horizontal {"
-                "  background: #61b3ff;"
-                "  border: 1px solid #2f82e6;"
-                "  border-radius: 3px;"
-                "}"
-                "QSlider::add-page:horizontal {"
-                "  background: transparent;"
-                "}"
-                f"QSlider::handle:horizontal {{"
-                f"  width: {hw}px;"
-                f"  height: {hh}px;"
-                "  background: #eaeaea;"
-                "  border: 1px solid #5a5f66;"
-                "  border-radius: 3px;"
-                f"  margin: -{m}px 0; /* extend handle vertically to overlap groove */"
-                "}"
-                f"QSlider::groove:vertical {{"
-                f"  width: {vmw}px;"
-                "  background: #3a3f46;"
-                "  border: 1px solid #2a2f35;"
-                "  border-radius: 3px;"
-                "}"
-                "QSlider::sub-page:vertical {"
-                "  background: transparent;"
-                "}"
-                "QSlider::add-page:vertical {"
-                "  background: #61b3ff;"
-                "  border: 1px solid #2f82e6;"
-                "  border-radius: 3px;"
-                "}"
-                f"QSlider::handle:vertical {{"
-                f"  height: {vhh}px;"
-                f"  width: {vhw}px;"
-                "  background: #eaeaea;"
-                "  border: 1px solid #5a5f66;"
-                "  border-radius: 3px;"
-                f"  margin: 0 -{m}px; /* extend handle horizontally to overlap groove */"
-                "}"
-                "border: 1px solid #444; border-radius: 3px;"
-            )
-            self._slider_qss = slider_qss
-            self.vel_slider.setStyleSheet(slider_qss)
-            try:
-                fs = max(8, int(9 * self.ui_scale))
-            except Exception:
-                fs = 9
-            self.vel_label.setStyleSheet(f"font-size: {fs}px;")
-        except Exception:
-            pass
-        
-        # Ensure header buttons/labels have adequate size at higher zoom
-        try:
-            s = max(0.5, float(getattr(self, 'ui_scale', 1.0)))
-            # Minimum widths to avoid text clipping (bumped again for 200%)
-            self.sustain_btn.setMinimumWidth(int(120 * s))
-            self.latch_btn.setMinimumWidth(int(100 * s))
-            self.all_off_btn.setMinimumWidth(int(160 * s))
-            # Octave label font size
-            self.oct_label.setStyleSheet(f"font-size: {max(9, int(11 * s))}px; color: #ddd;")
-            # Octave +/- buttons sized
-            self.oct_minus_btn.setFixedHeight(int(18 * s))
-            self.oct_plus_btn.setFixedHeight(int(18 * s))
-            self.oct_minus_btn.setFixedWidth(int(24 * s))
-            self.oct_plus_btn.setFixedWidth(int(24 * s))
-        except Exception:
-            pass
+        self.vel_random_chk.setChecked(True)
+        # Ensure UI elements reflect the default state even if signal doesn't fire
+        self._toggle_vel_random(True)
+        # Header controls are sized by _apply_ui_scale once every widget exists
+        self.vel_slider.setSizePolicy(_SP_FIXED)
+        self.vel_range.setSizePolicy(_SP_FIXED)
+        self.oct_label.setSizePolicy(_SP_FIXED)
+        self.vel_label.setSizePolicy(_SP_FIXED)
+        # Allow buttons to grow horizontally to avoid text clipping
+        self.sustain_btn.setSizePolicy(_SP_PREF_FIXED)
+        self.latch_btn.setSizePolicy(_SP_PREF_FIXED)
+        self.all_off_btn.setSizePolicy(_SP_PREF_FIXED)
         # Row 1: Octave controls, chord card, and action buttons
         header_row1.addWidget(self.oct_minus_btn)
         header_row1.addWidget(self.oct_label)
@@ -852,33 +939,14 @@ class KeyboardWidget(QWidget):
         elif self._compact_controls:
             # Add a compact controls bar (centered) with Sustain + All Notes Off
             controls_widget = QWidget()
-            try:
-                # Increase height to accommodate chord card (36px) with some padding
-                controls_widget.setFixedHeight(42)
-                controls_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            except Exception:
-                pass
+            # Increase height to accommodate chord card (36px) with some padding
+            controls_widget.setFixedHeight(42)
+            controls_widget.setSizePolicy(_SP_EXP_FIXED)
             self.controls_widget = controls_widget
             controls = QHBoxLayout(controls_widget)
             controls.setContentsMargins(0, 0, 0, 0)
             controls.setSpacing(6)
             controls.addStretch()
-            # Enlarge buttons a bit so text isn't clipped
-            try:
-                self.sustain_btn.setFixedHeight(int(22 * self.ui_scale))
-                self.latch_btn.setFixedHeight(int(22 * self.ui_scale))
-                self.all_off_btn.setFixedHeight(int(22 * self.ui_scale))
-                self.sustain_btn.setMinimumWidth(int(90 * self.ui_scale))
-                self.latch_btn.setMinimumWidth(int(70 * self.ui_scale))
-                self.all_off_btn.setMinimumWidth(int(110 * self.ui_scale))
-                # Keep original per-button styles
-                # Slightly larger octave buttons in compact bar
-                self.oct_minus_btn.setFixedHeight(int(22 * self.ui_scale))
-                self.oct_plus_btn.setFixedHeight(int(22 * self.ui_scale))
-                self.oct_minus_btn.setFixedWidth(int(24 * self.ui_scale))
-                self.oct_plus_btn.setFixedWidth(int(24 * self.ui_scale))
-            except Exception:
-                pass
             controls.addWidget(self.oct_minus_btn)
             controls.addWidget(self.oct_label)
             controls.addWidget(self.oct_plus_btn)
@@ -893,22 +961,17 @@ class KeyboardWidget(QWidget):
             root.addWidget(controls_widget)
 
         # Small vertical gap between controls and keys
-        try:
-            root.addSpacing(8)
-        except Exception:
-            pass
+        root.addSpacing(8)
 
         # --- Left-side wheels panel (Mod/Pitch) ---
         # Create once; visibility controlled by flags
         self.show_mod_wheel = False
         self.show_pitch_wheel = False
+        self._panel_update_pending = False
         self.left_panel = QWidget()
-        try:
-            # Start with single-wheel width; will grow if both wheels are shown
-            self.left_panel.setFixedWidth(int(44 * self.ui_scale))
-            self.left_panel.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        except Exception:
-            pass
+        # Start with single-wheel width; will grow if both wheels are shown
+        self.left_panel.setFixedWidth(int(44 * self.ui_scale))
+        self.left_panel.setSizePolicy(_SP_FIXED)
         # Horizontal layout to place Mod and Pitch next to each other
         lp_layout = QHBoxLayout(self.left_panel)
         lp_layout.setContentsMargins(6, 2, 6, 2)
@@ -919,37 +982,38 @@ class KeyboardWidget(QWidget):
         self.pitch_slider.setMaximum(8191)
         self.pitch_slider.setValue(0)
         self.pitch_slider.setTickPosition(QSlider.NoTicks)
-        self.pitch_slider.valueChanged.connect(lambda v: self._send_pitch_bend(v))
-        # Smooth auto-return to center on release
-        self._pitch_anim = None
-        try:
-            self.pitch_slider.sliderReleased.connect(self._animate_pitch_to_center)
-            self.pitch_slider.sliderPressed.connect(self._stop_pitch_anim)
-        except Exception:
-            pass
+        # Coalesce wheel MIDI output: keep only the latest value and flush on a short timer
+        self._pb_pending = None
+        self._pb_sent: int | None = None  # last value written per wheel on this channel
+        self._mod_sent: int | None = None
+        self._pb_timer = QTimer(self)
+        self._pb_timer.setSingleShot(True)
+        self._pb_timer.setInterval(8)
+        self._pb_timer.timeout.connect(self._flush_pb)
+        self._mod_pending = None
+        self._mod_timer = QTimer(self)
+        self._mod_timer.setSingleShot(True)
+        self._mod_timer.setInterval(8)
+        self._mod_timer.timeout.connect(self._flush_mod)
+        self.pitch_slider.valueChanged.connect(self._queue_pitch_bend)
+        # Smooth auto-return to center on release, driven by one reusable timer
+        self._pitch_return_timer = QTimer(self)
+        self._pitch_return_timer.setInterval(16)
+        self._pitch_return_timer.timeout.connect(self._step_pitch_return)
+        self.pitch_slider.sliderReleased.connect(self._animate_pitch_to_center)
+        self.pitch_slider.sliderPressed.connect(self._stop_pitch_anim)
         # Mod wheel (CC1)
         self.mod_slider = DragReferenceSlider(Qt.Vertical)
         self.mod_slider.setMinimum(0)
         self.mod_slider.setMaximum(127)
         self.mod_slider.setValue(0)
         self.mod_slider.setTickPosition(QSlider.NoTicks)
-        self.mod_slider.valueChanged.connect(lambda v: self._send_mod_cc(v))
-        try:
-            for s in (self.pitch_slider, self.mod_slider):
-                s.setFixedWidth(int(28 * self.ui_scale))
-                s.setStyleSheet(slider_qss)
-        except Exception:
-            pass
+        self.mod_slider.valueChanged.connect(self._queue_mod_cc)
         # Labels
         self.mod_lbl = QLabel("Mod")
         self.pitch_lbl = QLabel("Pitch")
-        try:
-            fs_lbl = max(8, int(9 * self.ui_scale))
-            for lbl in (self.mod_lbl, self.pitch_lbl):
-                lbl.setAlignment(Qt.AlignHCenter)
-                lbl.setStyleSheet(f"font-size: {fs_lbl}px; color: #ddd;")
-        except Exception:
-            pass
+        for lbl in (self.mod_lbl, self.pitch_lbl):
+            lbl.setAlignment(Qt.AlignHCenter)
         # Build two vertical columns: Mod column and Pitch column
         mod_col = QVBoxLayout()
         mod_col.setContentsMargins(0, 0, 0, 0)
@@ -972,269 +1036,343 @@ class KeyboardWidget(QWidget):
         keys_row.addWidget(self.left_panel)
 
         # Create a container widget for absolute positioning
-        piano_container = QWidget()
-        # Match or exceed white key height (134 * scale) to avoid bottom clipping at higher zoom
-        piano_container.setFixedHeight(int(140 * self.ui_scale))
-        # Dark instrument panel background under keys
-        piano_container.setStyleSheet(
-            """
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1b1b1b, stop:0.5 #202020, stop:1 #1b1b1b);
-            }
-            """
-        )
-        try:
-            # Do not allow horizontal expansion; keep width exactly to keys
-            piano_container.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        except Exception:
-            pass
+        # Container forwards its own mouse moves/releases here (no event filter on it)
+        piano_container = PianoContainer(self)
+        # Do not allow horizontal expansion; keep width exactly to keys
+        piano_container.setSizePolicy(_SP_FIXED)
         piano_container.setMouseTracking(True)  # Enable mouse tracking on container
         self.piano_container = piano_container  # Store reference for mouse events
-        # Scope the event filter to the piano container only (lower overhead than app-wide)
-        try:
-            self.piano_container.installEventFilter(self)
-        except Exception:
-            pass
         # Track last hovered key for explicit hover visuals
         self._last_hover_btn: QPushButton | None = None
+        self._apply_ui_scale()
         
-        # Create white keys first (they go in the background)
-        white_keys = self.layout_model.rows[0].keys
-        x_pos = 0
-        white_positions: list[tuple[int, int]] = []  # (white_note, x)
-
-        for white_key in white_keys:
-            w = int(44 * self.ui_scale * white_key.width)
-            if white_key.note >= 0:  # Skip spacer keys
-                btn = QPushButton("", piano_container)
-                # Use full width for reliable click/drag; separators are visual via borders
-                btn.setGeometry(x_pos, 0, w, int(134 * self.ui_scale))
-                # Enable per-button mouse tracking so :hover updates while dragging across keys
-                try:
-                    btn.setMouseTracking(True)
-                except Exception:
-                    pass
-                try:
-                    btn.setAttribute(Qt.WA_StyledBackground, True)
-                except Exception:
-                    pass
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #ffffff, stop:0.25 #fbfbfb, stop:0.55 #f3f3f3, stop:1 #e7e7e7);
-                        border-top: 1px solid #d8d8d8;
-                        border-left: 1px solid #dadada;
-                        border-right: 1px solid #cfcfcf; /* slightly darker right edge */
-                        border-bottom: 2px solid #bbbbbb; /* subtle bottom lip */
-                        border-radius: 0px;
-                    }}
-                    /* Explicit hover property, not Qt :hover, so we control it during drag */
-                    QPushButton[hovered="true"] {{
-                        /* Darken slightly on hover for white keys */
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #f2f2f2, stop:0.5 #e8e8e8, stop:1 #dddddd);
-                    }}
-                    QPushButton[active="true"] {{
-                        /* Fill entire key with activation blue */
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #6bb8ff, stop:1 #2f82e6);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #1b64c7;
-                    }}
-                    /* Keep active look even when hovered */
-                    QPushButton[active="true"]:hover {{
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #6bb8ff, stop:1 #2f82e6);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #1b64c7;
-                    }}
-                    QPushButton[held=\"true\"] {{
-                        /* Slightly different blue for held to differentiate subtly */
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #5fb1ff, stop:1 #2b7ade);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #1b64c7;
-                    }}
-                    /* Keep held look even when hovered */
-                    QPushButton[held=\"true\"]:hover {{
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #5fb1ff, stop:1 #2b7ade);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #1b64c7;
-                    }}
-                """)
-                btn.pressed.connect(lambda k=white_key: self.on_key_press(k))
-                btn.released.connect(lambda k=white_key: self.on_key_release(k))
-                btn.key_note = white_key.note
-                self.key_buttons[white_key.note] = btn
-                white_positions.append((white_key.note, x_pos))
-            # advance by full width (no -1; gaps are visual only)
-            x_pos += w
-
-        # Create black keys (in front), positioned between specific whites
-        for white_note, white_x in white_positions:
-            note_in_octave = white_note % 12
-            if note_in_octave in [0, 2, 5, 7, 9]:
-                black_note = white_note + 1
-                black_x = white_x + int(32 * self.ui_scale)  # centered between adjacent whites
-                btn = QPushButton("", piano_container)
-                btn.setGeometry(black_x, 0, int(28 * self.ui_scale), int(68 * self.ui_scale))
-                # Ensure hover state updates during press-drag transitions
-                try:
-                    btn.setMouseTracking(True)
-                except Exception:
-                    pass
-                try:
-                    btn.setAttribute(Qt.WA_StyledBackground, True)
-                except Exception:
-                    pass
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #3a3a3a, stop:0.12 #2a2a2a, stop:0.5 #121212, stop:1 #050505);
-                        border-top: 1px solid #3a3a3a;
-                        border-left: 1px solid #222;
-                        border-right: 1px solid #222;
-                        border-bottom: 2px solid #0b0b0b;
-                        border-radius: 3px;
-                    }
-                    /* Explicit hover property, not Qt :hover */
-                    QPushButton[hovered="true"] {
-                        /* Lighten slightly on hover for black keys */
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #484848, stop:0.5 #222222, stop:1 #0a0a0a);
-                    }
-                    QPushButton[active="true"] {
-                        /* Fill entire key with activation blue */
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #4aa3ff, stop:1 #2f82e6);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #0a0a0a;
-                    }
-                    /* Keep active look even when hovered */
-                    QPushButton[active="true"]:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #4aa3ff, stop:1 #2f82e6);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #0a0a0a;
-                    }
-                    QPushButton[held="true"] {
-                        /* Slightly darker blue for held */
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #3f9cff, stop:1 #2b7ade);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #0b0b0b;
-                    }
-                    /* Keep held look even when hovered */
-                    QPushButton[held="true"]:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #3f9cff, stop:1 #2b7ade);
-                        border-top: 1px solid #2f82e6;
-                        border-left: 1px solid #2f82e6;
-                        border-right: 1px solid #2f82e6;
-                        border-bottom: 2px solid #0b0b0b;
-                    }
-                """)
-                # Signals use KeyDef with the black note
-                black_key_def = KeyDef(
-                    label="",
-                    note=black_note,
-                    color="black",
-                    width=0.7,
-                    height=1.0,
-                    velocity=100,
-                    channel=0,
-                )
-                btn.pressed.connect(lambda k=black_key_def: self.on_key_press(k))
-                btn.released.connect(lambda k=black_key_def: self.on_key_release(k))
-                btn.raise_()
-                btn.key_note = black_note
-                self.key_buttons[black_note] = btn
-        
-        # If the highest key is black, remove it so the keyboard doesn't end with a black key
+        # Key rectangles are computed once, then one button is created per entry
+        x_pos = self._build_keys()
+
+        self._fit_width_to_keys(x_pos)
+        # Prefer fixed sizing so QMainWindow can shrink exactly to fit
+        self.setSizePolicy(_SP_FIXED)
+        # Align piano container to the left to avoid right-side blank expansion
         try:
-            if self.key_buttons:
-                max_note = max(self.key_buttons.keys())
-                if max_note % 12 in [1, 3, 6, 8, 10]:
-                    btn = self.key_buttons.pop(max_note)
-                    try:
-                        btn.hide()
-                        btn.deleteLater()
-                    except Exception:
-                        pass
+            keys_row.addWidget(piano_container, 0, Qt.AlignLeft)
         except Exception:
-            pass
+            keys_row.addWidget(piano_container)
+        # Add the row to root
+        root.addLayout(keys_row)
+
+    def _apply_ui_scale(self):
+        """Size the header, wheels and key area for the current ``ui_scale``.
 
-        # Install event filter on all key buttons for right-click latch support
+        Called once during construction and again by :meth:`set_ui_scale`;
+        the key buttons themselves are placed by ``_build_keys``/``_place_keys``.
+        """
+        ui = self.ui_scale
+        # Clamped scale used for header fonts/spacing
+        s = max(0.5, ui)
+        # White-key height reported by sizeHint
+        self._keys_h = int(134 * ui)
+        for row in self._header_rows:
+            row.setSpacing(max(1, int(2 * s)))
+        # Style checkbox to use the same blue as sliders, scaled by ui_scale
+        ind = int(14 * s)
+        sp = int(4 * s)
+        rad = max(2, int(3 * s))
+        font_px = max(9, int(11 * s))
+        self.vel_random_chk.setStyleSheet(
+            f"QCheckBox {{ color: #ddd; spacing: {sp}px; font-size: {font_px}px; }}"
+            "QCheckBox::indicator {"
+            f"  width: {ind}px; height: {ind}px;"
+            "  border: 1px solid #2a2f35;"
+            "  background: #2b2f36;"
+            f"  border-radius: {rad}px;"
+            "}"
+            "QCheckBox::indicator:hover { border: 1px solid #61b3ff; }"
+            "QCheckBox::indicator:checked {"
+            "  background: #61b3ff;"
+            "  border: 1px solid #2f82e6;"
+            "}"
+        )
+        # Keep header small so small keyboards can shrink (but scale with ui_scale)
+        self.vel_slider.setFixedWidth(int(200 * ui))
+        self.vel_range.setFixedWidth(int(200 * ui))
+        self.vel_slider.setFixedHeight(int(16 * ui))
+        self.vel_range.setFixedHeight(int(20 * ui))
+        self.oct_label.setFixedHeight(int(16 * ui))
+        self.vel_label.setFixedHeight(int(16 * ui))
+        # Apply unified slider styling to match RangeSlider look when visible
+        slider_qss = self._slider_qss_for(ui)
+        self.vel_slider.setStyleSheet(slider_qss)
+        self.vel_label.setStyleSheet(f"font-size: {max(8, int(9 * ui))}px;")
+        # Octave label font size
+        self.oct_label.setStyleSheet(f"font-size: {max(9, int(11 * s))}px; color: #ddd;")
+        if self._show_header or not self._compact_controls:
+            self.sustain_btn.setFixedHeight(int(18 * ui))
+            self.latch_btn.setFixedHeight(int(18 * ui))
+            self.all_off_btn.setFixedHeight(int(18 * ui))
+            # Minimum widths to avoid text clipping (bumped again for 200%)
+            self.sustain_btn.setMinimumWidth(int(120 * s))
+            self.latch_btn.setMinimumWidth(int(100 * s))
+            self.all_off_btn.setMinimumWidth(int(160 * s))
+            self.oct_minus_btn.setFixedHeight(int(18 * s))
+            self.oct_plus_btn.setFixedHeight(int(18 * s))
+            self.oct_minus_btn.setFixedWidth(int(24 * s))
+            self.oct_plus_btn.setFixedWidth(int(24 * s))
+        else:
+            # Compact bar: enlarge buttons a bit so text isn't clipped
+            self.sustain_btn.setFixedHeight(int(22 * ui))
+            self.latch_btn.setFixedHeight(int(22 * ui))
+            self.all_off_btn.setFixedHeight(int(22 * ui))
+            self.sustain_btn.setMinimumWidth(int(90 * ui))
+            self.latch_btn.setMinimumWidth(int(70 * ui))
+            self.all_off_btn.setMinimumWidth(int(110 * ui))
+            # Slightly larger octave buttons in compact bar
+            self.oct_minus_btn.setFixedHeight(int(22 * ui))
+            self.oct_plus_btn.setFixedHeight(int(22 * ui))
+            self.oct_minus_btn.setFixedWidth(int(24 * ui))
+            self.oct_plus_btn.setFixedWidth(int(24 * ui))
+        # Wheels and their labels
+        for wheel in (self.pitch_slider, self.mod_slider):
+            wheel.setFixedWidth(int(28 * ui))
+            wheel.setStyleSheet(slider_qss)
+        fs_lbl = max(8, int(9 * ui))
+        for lbl in (self.mod_lbl, self.pitch_lbl):
+            lbl.setStyleSheet(f"font-size: {fs_lbl}px; color: #ddd;")
+        # Match or exceed white key height (134 * scale) to avoid bottom clipping at higher zoom
+        self.piano_container.setFixedHeight(int(140 * ui))
+
+    def set_ui_scale(self, scale: float):
+        """Rescale the keyboard in place (no-op when unchanged).
+
+        Keys, header and wheels are resized on the existing widgets, so
+        sounding notes, sustain/latch and velocity settings carry over.
+
+        Args:
+            scale: Multiplier (e.g. ``1.0`` for 100%); non-positive values
+                are coerced to ``1.0``.
+        """
         try:
-            for btn in self.key_buttons.values():
-                btn.installEventFilter(self)
+            scale = float(scale)
         except Exception:
-            pass
+            scale = 1.0
+        if scale <= 0:
+            scale = 1.0
+        if abs(scale - self.ui_scale) < 1e-6:
+            return
+        self.ui_scale = scale
+        self._apply_ui_scale()
+        # The header sheet's min-height is applied at polish time; re-polish so
+        # it again overrides the fixed minimum, as on a freshly built keyboard
+        for btn in (self.sustain_btn, self.latch_btn, self.all_off_btn):
+            st = btn.style()
+            st.unpolish(btn)
+            st.polish(btn)
+        self._update_left_panel_width()
+        # Size to the keys as a freshly built keyboard would be; the window
+        # fit then takes the final width from sizeHint()
+        self._fit_width_to_keys(self._place_keys(), with_panel=False)
+        self.updateGeometry()
+        self.adjustSize()
+
+    @classmethod
+    def _slider_qss_for(cls, scale: float) -> str:
+        """Return the slider stylesheet for ``scale``, building it on first use."""
+        key = round(scale, 3)
+        qss = cls._slider_qss_cache.get(key)
+        if qss is None:
+            s = max(0.5, float(scale))
+            qss = _SLIDER_QSS_TEMPLATE % {
+                'gh': int(8 * s), 'hw': int(12 * s), 'hh': int(20 * s),
+                'vmw': int(8 * s), 'vhh': int(12 * s), 'vhw': int(20 * s),
+                'm': int(6 * s),
+            }
+            cls._slider_qss_cache[key] = qss
+        return qss
+
+    def _build_keys(self) -> int:
+        """Create the key buttons inside ``piano_container`` from the precomputed geometry.
 
-        # Set the container width to the exact right edge of remaining keys (no padding)
+        Returns:
+            The summed width of the white-key row in pixels.
+        """
+        piano_container = self.piano_container
+        # One sheet for every key; buttons only carry a keyrole property
+        if piano_container.styleSheet() != KEYBOARD_KEY_STYLES:
+            piano_container.setStyleSheet(KEYBOARD_KEY_STYLES)
+        self._white_rects, self._black_rects, x_pos = _piano_key_geometry(
+            self.layout_model.rows[0].keys, self.ui_scale
+        )
+
+        # Buttons from a previous layout are reused per role; extras are dropped below
+        pool: dict[str, list[QPushButton]] = {"white": [], "black": []}
+        for btn in self.key_buttons.values():
+            pool[btn.property("keyrole")].append(btn)
+        self.key_buttons = {}
+        self._lit_notes.clear()
+        self._hovered_btns.clear()
+        self._pending_visual_cleanup.clear()
+
+        # Suspend repaints while the children are created so the container is
+        # painted once, after every key is in place
+        piano_container.setUpdatesEnabled(False)
         try:
-            if self.key_buttons:
-                max_edge = 0
-                for btn in self.key_buttons.values():
-                    g = btn.geometry()
-                    edge = g.x() + g.width()  # precise right edge (exclusive)
-                    if edge > max_edge:
-                        max_edge = edge
-                piano_container.setFixedWidth(max_edge)
-            else:
-                piano_container.setFixedWidth(x_pos)
-        except Exception:
-            piano_container.setFixedWidth(x_pos)
+            # White keys first (they go in the background)
+            whites = pool["white"]
+            for wx, w, h, white_key in self._white_rects:
+                btn = whites.pop() if whites else self._new_key_button("white")
+                # Use full width for reliable click/drag; separators are visual via borders
+                btn.setGeometry(wx, 0, w, h)
+                btn.key_def = white_key
+                btn.key_note = white_key.note
+                self.key_buttons[white_key.note] = btn
+
+            # Black keys (in front), positioned between specific whites
+            blacks = pool["black"]
+            for black_x, bw, bh, black_key_def in self._black_rects:
+                btn = blacks.pop() if blacks else self._new_key_button("black")
+                btn.setGeometry(black_x, 0, bw, bh)
+                btn.raise_()
+                btn.key_def = black_key_def
+                btn.key_note = black_key_def.note
+                self.key_buttons[black_key_def.note] = btn
+
+            # Keys left over from a wider layout
+            for btn in whites + blacks:
+                btn.hide()
+                btn.deleteLater()
+        finally:
+            piano_container.setUpdatesEnabled(True)
+        self._index_key_edges()
+        return x_pos
+
+    def _place_keys(self) -> int:
+        """Move the existing key buttons to the geometry for the current ``ui_scale``.
+
+        Unlike :meth:`_build_keys` every button keeps its note and visual state.
+
+        Returns:
+            The summed width of the white-key row in pixels.
+        """
+        self._white_rects, self._black_rects, x_pos = _piano_key_geometry(
+            self.layout_model.rows[0].keys, self.ui_scale
+        )
+        buttons = self.key_buttons
+        piano_container = self.piano_container
+        piano_container.setUpdatesEnabled(False)
+        try:
+            for rects in (self._white_rects, self._black_rects):
+                for x, w, h, key in rects:
+                    buttons[key.note].setGeometry(x, 0, w, h)
+        finally:
+            piano_container.setUpdatesEnabled(True)
+        self._index_key_edges()
+        return x_pos
+
+    def _index_key_edges(self):
+        """Record sorted key edges and matching buttons for bisect hit-testing."""
+        self._white_edges = [x + w for x, w, _, _ in self._white_rects]
+        self._white_btns = [self.key_buttons[k.note] for _, _, _, k in self._white_rects]
+        self._black_lefts = [x for x, _, _, _ in self._black_rects]
+        self._black_btns = [self.key_buttons[k.note] for _, _, _, k in self._black_rects]
+
+    def _new_key_button(self, role: str) -> QPushButton:
+        """Create a key button of ``role`` (``"white"``/``"black"``) wired to the shared key slots."""
+        btn = QPushButton("", self.piano_container)
+        # Enable per-button mouse tracking so :hover updates while dragging across keys
+        btn.setMouseTracking(True)
+        btn.setAttribute(Qt.WA_StyledBackground, True)
+        btn.setProperty("keyrole", role)
+        btn.pressed.connect(self._on_key_btn_pressed)
+        btn.released.connect(self._on_key_btn_released)
+        # Event filter for right-click latch support
+        btn.installEventFilter(self)
+        btn.show()
+        return btn
+
+    def _fit_width_to_keys(self, x_pos: int, with_panel: bool = True):
+        """Fix the container and keyboard widths to the current key row.
+
+        ``with_panel=False`` leaves a visible wheel panel out of the width,
+        matching a keyboard that was built before its wheels were shown.
+        """
+        # Set the container width to the exact right edge of the keys (no padding),
+        # taken from the precomputed geometry rather than querying every button
+        max_edge = max(
+            self._white_edges[-1:] + [x + w for x, w, _, _ in self._black_rects],
+            default=0,
+        )
+        self.piano_container.setFixedWidth(max_edge or x_pos)
         # Ensure minimum width matches the actual key area (no extra padding)
         try:
             exact_w = int(self.piano_container.width())
             # Include left panel width if visible
-            if self.left_panel.isVisible():
+            if with_panel and self.left_panel.isVisible():
                 try:
                     exact_w += int(self.left_panel.width()) + 4
                 except Exception:
                     exact_w += 48
-            self.setMinimumWidth(exact_w)
-            self.setMaximumWidth(exact_w)
+            # setFixedWidth sets both the minimum and maximum width
             self.setFixedWidth(exact_w)
             # Match compact controls width to piano to avoid pushing layout wider
             if hasattr(self, 'controls_widget') and self.controls_widget is not None:
                 try:
                     self.controls_widget.setFixedWidth(exact_w)
-                    self.controls_widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+                    self.controls_widget.setSizePolicy(_SP_FIXED)
                 except Exception:
                     pass
         except Exception:
             pass
-        # Prefer fixed sizing so QMainWindow can shrink exactly to fit
-        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        # Align piano container to the left to avoid right-side blank expansion
-        try:
-            keys_row.addWidget(piano_container, 0, Qt.AlignLeft)
-        except Exception:
-            keys_row.addWidget(piano_container)
-        # Add the row to root
-        root.addLayout(keys_row)
+
+    def set_layout(self, layout_model: Layout):
+        """Switch to another piano layout in place.
+
+        Sounding notes are released, then the key row is rebuilt reusing the
+        existing buttons; the header, wheels and settings are kept.
+        """
+        self._perform_all_notes_off()
+        self._right_click_latched.clear()
+        for btn in self.key_buttons.values():
+            self._apply_btn_visual(btn, False, False)
+            self._set_hover(btn, False)
+            if btn.property('hoveroff') == 'true':
+                btn.setProperty('hoveroff', 'false')
+                st = btn.style()
+                if st is not None:
+                    st.polish(btn)
+        self._last_hover_btn = None
+        self.layout_model = layout_model
+        self._note_shift = 12 * (layout_model.base_octave + self.octave_offset)
+        self._fit_width_to_keys(self._build_keys())
+        self.update_window_title()
+        self.updateGeometry()
+        self.adjustSize()
+
+    def _key_button_at(self, pos) -> QPushButton | None:
+        """Return the key button under a ``piano_container`` position, or ``None``.
+
+        Black keys sit in front, so they are checked first when ``pos`` is within
+        their height; both rows are resolved by bisecting precomputed edges.
+        """
+        x, y = pos.x(), pos.y()
+        if y < 0:
+            return None
+        blacks = self._black_rects
+        if blacks and y < blacks[0][2]:
+            idx = bisect_right(self._black_lefts, x) - 1
+            if idx >= 0:
+                bx, bw, _, _ = blacks[idx]
+                if x < bx + bw:
+                    return self._black_btns[idx]
+        idx = bisect_right(self._white_edges, x)
+        if idx >= len(self._white_rects):
+            return None
+        wx, _, wh, _ = self._white_rects[idx]
+        if x < wx or y >= wh:
+            return None
+        return self._white_btns[idx]
 
     def effective_note(self, base_note: int) -> int:
         """Return the effective MIDI note after octave offset."""
-        return int(base_note + 12 * (self.layout_model.base_octave + self.octave_offset))
+        return base_note + self._note_shift
 
     def change_octave(self, delta: int):
         """Shift the octave offset by ``delta``, clamped to ``[-5, 5]``."""
@@ -1242,17 +1380,15 @@ class KeyboardWidget(QWidget):
         new_off = max(-5, min(5, self.octave_offset + delta))
         if new_off != self.octave_offset:
             self.octave_offset = new_off
+            self._note_shift = 12 * (self.layout_model.base_octave + new_off)
             self._update_oct_label()
 
     # --- Left panel (Mod/Pitch wheels) visibility & sizing ---
     def _update_left_panel_width(self):
         """Adjust left panel width based on which wheels are visible and current ui_scale."""
-        try:
-            s = float(getattr(self, 'ui_scale', 1.0))
-        except Exception:
-            s = 1.0
-        show_mod = bool(getattr(self, 'show_mod_wheel', False))
-        show_pitch = bool(getattr(self, 'show_pitch_wheel', False))
+        s = self.ui_scale
+        show_mod = self.show_mod_wheel
+        show_pitch = self.show_pitch_wheel
         count = (1 if show_mod else 0) + (1 if show_pitch else 0)
         any_visible = count > 0
         # Toggle individual widgets
@@ -1273,18 +1409,20 @@ class KeyboardWidget(QWidget):
         except Exception:
             pass
         try:
-            base_single = 44
-            base_double = 80
-            target = 0
-            if count == 1:
-                target = int(base_single * s)
-            elif count >= 2:
-                target = int(base_double * s)
+            # Base panel width for zero, one or two wheels
+            target = int(_LEFT_PANEL_BASE_W[count] * s)
             self.left_panel.setFixedWidth(max(0, target))
             self.left_panel.updateGeometry()
         except Exception:
             pass
-        # Nudge layout sizing
+        # Nudge layout sizing once per event-loop pass, however many wheels toggled
+        if not self._panel_update_pending:
+            self._panel_update_pending = True
+            QTimer.singleShot(0, self._flush_panel_update)
+
+    def _flush_panel_update(self):
+        """Run the layout nudge coalesced by ``_update_left_panel_width``."""
+        self._panel_update_pending = False
         try:
             self.updateGeometry()
             self.adjustSize()
@@ -1292,13 +1430,19 @@ class KeyboardWidget(QWidget):
             pass
 
     def set_show_mod_wheel(self, show: bool):
-        """Toggle the mod-wheel slider visibility in the left panel."""
-        self.show_mod_wheel = bool(show)
+        """Toggle the mod-wheel slider visibility in the left panel (no-op when unchanged)."""
+        show = bool(show)
+        if show == self.show_mod_wheel:
+            return
+        self.show_mod_wheel = show
         self._update_left_panel_width()
 
     def set_show_pitch_wheel(self, show: bool):
-        """Toggle the pitch-wheel slider visibility in the left panel."""
-        self.show_pitch_wheel = bool(show)
+        """Toggle the pitch-wheel slider visibility in the left panel (no-op when unchanged)."""
+        show = bool(show)
+        if show == self.show_pitch_wheel:
+            return
+        self.show_pitch_wheel = show
         self._update_left_panel_width()
 
     # --- Sizing helpers ---
@@ -1308,13 +1452,13 @@ class KeyboardWidget(QWidget):
             width = int(self.piano_container.width())
         except Exception:
             width = 800
-        keys_h = int(134 * getattr(self, 'ui_scale', 1.0))
+        keys_h = self._keys_h
         # Add vertical extras for header/controls when present
-        if getattr(self, "_show_header", True):
+        if self._show_header:
             header_h = 48  # two-row header (24px per row)
             gap = 8  # spacer added between header and keys
             return QSize(width, keys_h + header_h + gap)
-        elif getattr(self, "_compact_controls", True):
+        elif self._compact_controls:
             try:
                 controls_h = int(self.controls_widget.height())
             except Exception:
@@ -1328,39 +1472,71 @@ class KeyboardWidget(QWidget):
         if btn is None:
             return
         try:
-            # Only touch properties when they actually change to avoid heavy restyles
-            # Use dynamic properties for visuals instead of the built-in :pressed state.
-            # 1) Active (pressed) state via [active="true"]
-            prev_active = btn.property('active')
-            new_active = 'true' if down else 'false'
+            # Only touch properties when they actually change to avoid heavy restyles.
+            # The last applied state lives on the button as plain Python bools so the
+            # common drag-over path never round-trips through QVariant; Qt matches the
+            # bool properties against [active="true"] / [held="true"] in the stylesheet.
+            down = bool(down)
+            held = bool(held)
+            changed = False
             # Do NOT sync Qt's internal pressed state for keys; rely solely on dynamic properties
-            if prev_active != new_active:
-                btn.setProperty('active', new_active)
-                st = btn.style()
-                if st is not None:
-                    st.unpolish(btn)
-                    st.polish(btn)
-
-            # 2) Held dynamic property (used by stylesheet selector [held="true"]) 
-            prev_held = btn.property('held')
-            new_held = 'true' if held else 'false'
-            if prev_held != new_held:
-                btn.setProperty('held', new_held)
-                st = btn.style()
-                if st is not None:
-                    st.unpolish(btn)
-                    st.polish(btn)
+            if getattr(btn, '_active_state', None) is not down:
+                btn._active_state = down  # type: ignore[attr-defined]
+                btn.setProperty('active', down)
+                changed = True
+            if getattr(btn, '_held_state', None) is not held:
+                btn._held_state = held  # type: ignore[attr-defined]
+                btn.setProperty('held', held)
+                changed = True
+            if not changed:
+                return
+            if down or held:
+                self._lit_notes.add(btn.key_note)
+            else:
+                self._lit_notes.discard(btn.key_note)
+            # polish() alone re-resolves the property selectors; the unpolish() that
+            # used to precede it only discarded state polish() rebuilds anyway
+            st = btn.style()
+            if st is not None:
+                st.polish(btn)
 
             # Request a paint; avoid synchronous repaint to keep UI responsive
             btn.update()
         except Exception:
             pass
 
+    def _schedule_visual_cleanup(self, btn: QPushButton | None):
+        """Clear ``btn``'s active/held visual again once pending events are processed.
+
+        Requests made within one event-loop pass share a single zero-delay timer.
+        """
+        if btn is None:
+            return
+        pending = self._pending_visual_cleanup
+        if not pending:
+            QTimer.singleShot(0, self._run_visual_cleanup)
+        pending.add(btn)
+
+    def _run_visual_cleanup(self):
+        """Apply the deferred visual clears queued by ``_schedule_visual_cleanup``."""
+        pending = self._pending_visual_cleanup
+        self._pending_visual_cleanup = set()
+        for btn in pending:
+            self._apply_btn_visual(btn, False, False)
+
     def _set_hover(self, btn: QPushButton | None, hovered: bool):
         """Set or clear the explicit hovered visual on a key button."""
         if btn is None:
             return
         try:
+            hovered = bool(hovered)
+            if getattr(btn, '_hover_state', False) is hovered:
+                return
+            btn._hover_state = hovered  # type: ignore[attr-defined]
+            if hovered:
+                self._hovered_btns.add(btn)
+            else:
+                self._hovered_btns.discard(btn)
             btn.setProperty('hovered', 'true' if hovered else 'false')
             st = btn.style()
             if st is not None:
@@ -1382,7 +1558,9 @@ class KeyboardWidget(QWidget):
         """Clear active/held visuals from every key except the provided one and right-click latched notes."""
         try:
             ch = self.midi_channel
-            for base_note, b in self.key_buttons.items():
+            # Keys that are not lit have nothing to clear
+            for base_note in list(self._lit_notes):
+                b = self.key_buttons.get(base_note)
                 if b is except_btn:
                     continue
                 # Don't clear visuals for right-click latched notes
@@ -1398,17 +1576,31 @@ class KeyboardWidget(QWidget):
         visuals remain for keys that aren't in active_notes.
         """
         try:
-            if getattr(self, 'sustain', False) or getattr(self, 'latch', False):
+            if self.sustain or self.latch:
                 return
-            ch = int(getattr(self, 'midi_channel', 0))
-            active = set(getattr(self, 'active_notes', set()))
-            for base_note, btn in list(self.key_buttons.items()):
-                eff = self.effective_note(base_note)
-                if (eff, ch) not in active:
-                    self._apply_btn_visual(btn, False, False)
+            ch = self.midi_channel
+            active = self.active_notes
+            # Only keys that are currently lit can be stray
+            for base_note in list(self._lit_notes):
+                if (self.effective_note(base_note), ch) not in active:
+                    self._apply_btn_visual(self.key_buttons.get(base_note), False, False)
         except Exception:
             pass
 
+    def _on_key_btn_pressed(self):
+        """Shared ``pressed`` slot for every key button; the key rides on the sender."""
+        btn = self.sender()
+        key = getattr(btn, 'key_def', None)
+        if key is not None:
+            self.on_key_press(key)
+
+    def _on_key_btn_released(self):
+        """Shared ``released`` slot for every key button."""
+        btn = self.sender()
+        key = getattr(btn, 'key_def', None)
+        if key is not None:
+            self.on_key_release(key)
+
     def on_key_press(self, key: KeyDef):
         """Handle a left-press on ``key`` honoring sustain, latch, and polyphony cap.
 
@@ -1420,65 +1612,61 @@ class KeyboardWidget(QWidget):
         note = self.effective_note(base_note)
         ch = self.midi_channel
         # Latch handling: toggle if already active
-        if getattr(self, 'latch', False):
+        if self.latch:
             if (note, ch) in self.active_notes:
                 # Note is already active - turn it off
                 try:
-                    self.midi.note_off(note, ch)
+                    self._post_midi('note_off', note, ch)
                 except Exception:
                     pass
                 self.active_notes.discard((note, ch))
-                try:
-                    # remove from voice order
-                    for i, (n, c, b) in enumerate(list(self._voice_order)):
-                        if n == note and c == ch:
-                            self._voice_order.pop(i)
-                            break
-                except Exception:
-                    pass
+                self._voice_order.pop((note, ch), None)
                 self._apply_note_visual(base_note, False, False)
                 # Update chord card after removing note (if chord monitor is on)
-                if getattr(self, 'chord_monitor', False):
+                if self.chord_monitor:
                     self._update_chord_card()
                 return
             # Note is not active yet - continue to add it below
-        # Polyphony enforce (steal oldest)
-        if getattr(self, 'polyphony_enabled', False):
+        # Polyphony enforce (steal oldest); the stolen key's visual is cleared after note_on
+        stolen_base = None
+        if self.polyphony_enabled:
             try:
                 current_voices = len(self.active_notes)
             except Exception:
                 current_voices = 0
-            if current_voices >= max(1, int(getattr(self, 'polyphony_max', 8))):
+            if current_voices >= self.polyphony_max:
                 if self._voice_order:
-                    old_note, old_ch, old_base = self._voice_order.pop(0)
+                    (old_note, old_ch), stolen_base = self._voice_order.popitem(last=False)
                     try:
-                        self.midi.note_off(old_note, old_ch)
+                        self._post_midi('note_off', old_note, old_ch)
                     except Exception:
                         pass
                     self.active_notes.discard((old_note, old_ch))
-                    self._apply_note_visual(old_base, False, False)
-        # Send note_on
+        # Send note_on before any restyling so visuals never delay the MIDI message
         vel = self._compute_velocity(int(getattr(key, 'velocity', 100)))
         try:
-            self.midi.note_on(note, vel, ch)
+            self._post_midi('note_on', note, vel, ch)
         except Exception:
             pass
         self.active_notes.add((note, ch))
-        self._voice_order.append((note, ch, base_note))
+        self._voice_order[(note, ch)] = base_note
+        self._voice_order.move_to_end((note, ch))
+        if stolen_base is not None:
+            self._apply_note_visual(stolen_base, False, False)
         # Track most recently played note for sustain display
         self._last_played_note = note
         # In latch mode, use held visual state, otherwise just active
-        if getattr(self, 'latch', False):
+        if self.latch:
             self._apply_note_visual(base_note, True, True)  # held state for latched notes
         else:
             self._apply_note_visual(base_note, True, False)
         # Update chord card if chord monitor is on
-        if getattr(self, 'chord_monitor', False):
+        if self.chord_monitor:
             self._update_chord_card()
         # Begin drag tracking if neither latch nor sustain (or sustain with drag_while_sustain enabled)
-        sustain_active = getattr(self, 'sustain', False)
-        drag_while_sustain_enabled = getattr(self, 'drag_while_sustain', False)
-        can_drag = not getattr(self, 'latch', False) and (not sustain_active or drag_while_sustain_enabled)
+        sustain_active = self.sustain
+        drag_while_sustain_enabled = self.drag_while_sustain
+        can_drag = not self.latch and (not sustain_active or drag_while_sustain_enabled)
         if can_drag:
             self.dragging = True
             self.last_drag_key = key
@@ -1497,6 +1685,8 @@ class KeyboardWidget(QWidget):
                 self.last_drag_button = sender
                 self._apply_btn_visual(self.last_drag_button, True, False)
                 self._clear_other_actives(self.last_drag_button)
+            # Force the first drag move to sweep stray visuals
+            self._drag_swept_btn = False
             try:
                 self.piano_container.grabMouse()
             except Exception:
@@ -1512,28 +1702,22 @@ class KeyboardWidget(QWidget):
         base_note = key.note
         note = self.effective_note(base_note)
         ch = self.midi_channel
-        if getattr(self, 'latch', False):
+        if self.latch:
             if (note, ch) in self.active_notes:
                 self._apply_note_visual(base_note, True, True)
             else:
                 self._apply_note_visual(base_note, False, False)
             return
-        if not getattr(self, 'sustain', False):
+        if not self.sustain:
             try:
-                self.midi.note_off(note, ch)
+                self._post_midi('note_off', note, ch)
             except Exception:
                 pass
             self.active_notes.discard((note, ch))
-            try:
-                for i, (n, c, b) in enumerate(list(self._voice_order)):
-                    if n == note and c == ch:
-                        self._voice_order.pop(i)
-                        break
-            except Exception:
-                pass
+            self._voice_order.pop((note, ch), None)
             self._apply_note_visual(base_note, False, False)
             # Update chord card if chord monitor is on (for tracking individual notes)
-            if getattr(self, 'chord_monitor', False):
+            if self.chord_monitor:
                 self._update_chord_card()
             self._sync_visuals_if_needed()
         else:
@@ -1541,7 +1725,7 @@ class KeyboardWidget(QWidget):
             self._apply_note_visual(base_note, False, False)
             self._clear_other_actives(None)
         # Stop basic click drag
-        if not getattr(self, 'latch', False):
+        if not self.latch:
             self.dragging = False
             self.last_drag_key = None
             self._last_drag_note_base = None
@@ -1555,42 +1739,39 @@ class KeyboardWidget(QWidget):
         if (note, ch) in self.active_notes:
             # Note is already active - turn it off
             try:
-                self.midi.note_off(note, ch)
+                self._post_midi('note_off', note, ch)
             except Exception:
                 pass
             self.active_notes.discard((note, ch))
             self._right_click_latched.discard((note, ch))  # Remove from right-click latched set
-            try:
-                # remove from voice order
-                for i, (n, c, b) in enumerate(list(self._voice_order)):
-                    if n == note and c == ch:
-                        self._voice_order.pop(i)
-                        break
-            except Exception:
-                pass
+            self._voice_order.pop((note, ch), None)
             self._apply_note_visual(base_note, False, False)
         else:
             # Note is not active - turn it on and latch it
             vel = self._compute_velocity(100)
             try:
-                self.midi.note_on(note, vel, ch)
+                self._post_midi('note_on', note, vel, ch)
             except Exception:
                 pass
             self.active_notes.add((note, ch))
             self._right_click_latched.add((note, ch))  # Track as right-click latched
-            self._voice_order.append((note, ch, base_note))
+            self._voice_order[(note, ch)] = base_note
+            self._voice_order.move_to_end((note, ch))
             self._last_played_note = note
             self._apply_note_visual(base_note, True, True)  # held state for latched notes
         # Update chord card if chord monitor is on
-        if getattr(self, 'chord_monitor', False):
+        if self.chord_monitor:
             self._update_chord_card()
 
     def eventFilter(self, obj, event):
         """Global event filter to handle drag across child buttons reliably."""
+        # Only key buttons are filtered, but probe once in case another object is added
+        is_key = hasattr(obj, 'key_note')
+        etype = event.type()
         # If leaving a key while dragging, ensure its active visual is cleared immediately
         try:
-            if isinstance(obj, QPushButton) and hasattr(obj, 'key_note') and event.type() == QEvent.Leave:
-                if getattr(self, 'dragging', False):
+            if is_key and etype == QEvent.Leave:
+                if self.dragging:
                     # Clear this button's pressed/held visuals and explicit hover
                     self._apply_btn_visual(obj, False, False)
                     try:
@@ -1600,233 +1781,239 @@ class KeyboardWidget(QWidget):
         except Exception:
             pass
         # Handle right-click latch on key buttons
-        if getattr(self, 'right_click_latch', False):
+        if self.right_click_latch:
             try:
-                if event.type() == QEvent.MouseButtonPress and isinstance(obj, QPushButton) and hasattr(obj, 'key_note'):
+                if is_key and etype == QEvent.MouseButtonPress:
                     if event.button() == Qt.RightButton:
                         self.on_key_right_click(obj.key_note)
                         return True  # consume the event
             except Exception:
                 pass
-        # Maintain explicit hover state on the key under the cursor
+        # Even when not dragging: if sustain is on, ensure a click release clears visuals
+        if is_key and etype == QEvent.MouseButtonRelease and self.sustain:
+            try:
+                self._apply_btn_visual(obj, False, False)
+                self._clear_other_actives(None)
+                # Reinforce after event processing to avoid any transient re-activation
+                self._schedule_visual_cleanup(obj)
+            except Exception:
+                pass
+        if self.dragging:
+            if etype in (QEvent.MouseMove, QEvent.MouseButtonRelease):
+                return self._drag_mouse_event(event)
+        return super().eventFilter(obj, event)
+
+    def _update_hover(self, event):
+        """Maintain explicit hover state on the key under the cursor."""
         try:
-            if obj is getattr(self, 'piano_container', None) and event.type() == QEvent.MouseMove:
-                try:
-                    gp = event.globalPosition().toPoint()
-                except AttributeError:
-                    gp = event.globalPos()
-                pos = self.piano_container.mapFromGlobal(gp)
-                w = self.piano_container.childAt(pos)
-                if isinstance(w, QPushButton) and hasattr(w, 'key_note'):
-                    if w is not self._last_hover_btn:
-                        # Clear previous hover
-                        if self._last_hover_btn is not None:
-                            self._set_hover(self._last_hover_btn, False)
-                        # Set new hover
-                        self._set_hover(w, True)
-                        self._last_hover_btn = w
-                else:
-                    # Not over any key: clear previous hover
+            try:
+                gp = event.globalPosition().toPoint()
+            except AttributeError:
+                gp = event.globalPos()
+            pos = self.piano_container.mapFromGlobal(gp)
+            w = self._key_button_at(pos)
+            if w is not None:
+                if w is not self._last_hover_btn:
+                    # Clear previous hover
                     if self._last_hover_btn is not None:
                         self._set_hover(self._last_hover_btn, False)
-                        self._last_hover_btn = None
+                    # Set new hover
+                    self._set_hover(w, True)
+                    self._last_hover_btn = w
+            else:
+                # Not over any key: clear previous hover
+                if self._last_hover_btn is not None:
+                    self._set_hover(self._last_hover_btn, False)
+                    self._last_hover_btn = None
         except Exception:
             pass
-        # Even when not dragging: if sustain is on, ensure a click release clears visuals
-        if event.type() == QEvent.MouseButtonRelease and getattr(self, 'sustain', False):
+
+    def _drag_mouse_event(self, event) -> bool:
+        """Handle a mouse move or release while a drag-glide is in progress.
+
+        Called for events on the piano container (via :class:`PianoContainer`)
+        and on key buttons (via :meth:`eventFilter`). Never consumes the event.
+        """
+        # Handle mouse move while dragging
+        if event.type() == QEvent.MouseMove:
+            if self.latch:
+                return False  # ignore drag changes while in latch mode
+            # Map global position to the piano container and find the child under cursor
             try:
-                if isinstance(obj, QPushButton) and hasattr(obj, 'key_note'):
-                    self._apply_btn_visual(obj, False, False)
-                    self._clear_other_actives(None)
-                    # Reinforce after event processing to avoid any transient re-activation
-                    QTimer.singleShot(0, lambda b=obj: self._apply_btn_visual(b, False, False))
-            except Exception:
-                pass
-        if self.dragging:
-            # Handle mouse move while dragging
-            if event.type() == QEvent.MouseMove:
-                if getattr(self, 'latch', False):
-                    return False  # ignore drag changes while in latch mode
-                # Map global position to the piano container and find the child under cursor
+                # Qt6: globalPosition() returns QPointF
+                gp = event.globalPosition().toPoint()
+            except AttributeError:
+                gp = event.globalPos()
+            container_pos = self.piano_container.mapFromGlobal(gp)
+            widget_under = self._key_button_at(container_pos)
+            # Fail-safe: clear all other actives up-front based on current pointer target,
+            # once per target change (moves within the same key cannot add strays)
+            if widget_under is not self._drag_swept_btn:
+                self._clear_all_key_visuals_except(widget_under)
+                self._drag_swept_btn = widget_under
+            # If we're no longer over the previously pressed button, clear its pressed visual immediately
+            if self.last_drag_button is not None and widget_under is not self.last_drag_button:
+                self._apply_btn_visual(self.last_drag_button, False, False)
+                # Keep previous key's hover suppressed while dragging over a different key (e.g., black over white)
                 try:
-                    # Qt6: globalPosition() returns QPointF
-                    gp = event.globalPosition().toPoint()
-                except AttributeError:
-                    gp = event.globalPos()
-                container_pos = self.piano_container.mapFromGlobal(gp)
-                widget_under = self.piano_container.childAt(container_pos)
-                # Fail-safe: clear all other actives up-front based on current pointer target
-                if isinstance(widget_under, QPushButton) and hasattr(widget_under, 'key_note'):
-                    self._clear_all_key_visuals_except(widget_under)
-                else:
-                    self._clear_all_key_visuals_except(None)
-                # If we're no longer over the previously pressed button, clear its pressed visual immediately
-                if self.last_drag_button is not None and widget_under is not self.last_drag_button:
-                    self._apply_btn_visual(self.last_drag_button, False, False)
-                    # Keep previous key's hover suppressed while dragging over a different key (e.g., black over white)
-                    try:
-                        self.last_drag_button.setProperty('hoveroff', 'true')
-                        st = self.last_drag_button.style()
-                        if st is not None:
-                            st.unpolish(self.last_drag_button)
-                            st.polish(self.last_drag_button)
-                        self.last_drag_button.update()
-                    except Exception:
-                        pass
-                    # Also ensure its explicit hover is cleared
-                    if self._last_hover_btn is self.last_drag_button:
-                        self._set_hover(self.last_drag_button, False)
-                        self._last_hover_btn = None
-
-                # Only suppress switching if the cursor is still within the original button
-                # AND there isn't a different key under the cursor. Otherwise, switch notes/visuals.
-                if isinstance(widget_under, QPushButton) and hasattr(widget_under, 'key_note'):
-                    base = widget_under.key_note
-                    current_note = self.effective_note(base)
-                    prev_eff = self.effective_note(self._last_drag_note_base) if self._last_drag_note_base is not None else None
-                    if prev_eff is None or current_note != prev_eff:
-                        # Stop previous note if any (but not if it's a right-click latched note)
-                        if self._last_drag_note_base is not None and not self.sustain and not getattr(self, 'latch', False):
-                            prev_note = prev_eff  # computed above
-                            ch = self.midi_channel
-                            # Don't turn off right-click latched notes
-                            if (prev_note, ch) not in self._right_click_latched:
-                                self.midi.note_off(prev_note, ch)
-                                self.active_notes.discard((prev_note, ch))
-                        # Update previous button visual (but preserve right-click latched visuals)
-                        if self.last_drag_button is not None and self.last_drag_button is not widget_under:
-                            prev_base = getattr(self.last_drag_button, 'key_note', None)
-                            if prev_base is not None:
-                                prev_eff_note = self.effective_note(prev_base)
-                                ch = self.midi_channel
-                                if (prev_eff_note, ch) not in self._right_click_latched:
-                                    self._apply_btn_visual(self.last_drag_button, False, False)
-                            try:
-                                self.last_drag_button.setProperty('hoveroff', 'true')
-                                st3 = self.last_drag_button.style()
-                                if st3 is not None:
-                                    st3.unpolish(self.last_drag_button)
-                                    st3.polish(self.last_drag_button)
-                                self.last_drag_button.update()
-                            except Exception:
-                                pass
-                            # Clear explicit hover on previous key
-                            if self._last_hover_btn is self.last_drag_button:
-                                self._set_hover(self.last_drag_button, False)
-                                self._last_hover_btn = None
-
-                        # Start new
-                        vel = self._compute_velocity(100)
-                        ch = self.midi_channel
-                        if not getattr(self, 'latch', False):
-                            self.midi.note_on(current_note, vel, ch)
-                            self.active_notes.add((current_note, ch))
-                        # Update current button visual and references
-                        self._apply_btn_visual(widget_under, True, False)
-                        self.last_drag_button = widget_under
-                        self._last_drag_note_base = base
-                        self.last_drag_key = None  # no heavy KeyDef allocation
-                        # Ensure no other keys remain visually active
-                        self._clear_other_actives(self.last_drag_button)
-                        # Update chord display during drag
-                        if getattr(self, 'chord_monitor', False):
-                            self._update_chord_card()
-                else:
-                    # Not over any key: release previous note and clear visual, keep dragging
-                    if self._last_drag_note_base is not None and not self.sustain and not getattr(self, 'latch', False):
-                        prev_note = self.effective_note(self._last_drag_note_base)
+                    self.last_drag_button.setProperty('hoveroff', 'true')
+                    st = self.last_drag_button.style()
+                    if st is not None:
+                        st.unpolish(self.last_drag_button)
+                        st.polish(self.last_drag_button)
+                    self.last_drag_button.update()
+                except Exception:
+                    pass
+                # Also ensure its explicit hover is cleared
+                if self._last_hover_btn is self.last_drag_button:
+                    self._set_hover(self.last_drag_button, False)
+                    self._last_hover_btn = None
+
+            # Only suppress switching if the cursor is still within the original button
+            # AND there isn't a different key under the cursor. Otherwise, switch notes/visuals.
+            if widget_under is not None:
+                base = widget_under.key_note
+                current_note = self.effective_note(base)
+                prev_eff = self.effective_note(self._last_drag_note_base) if self._last_drag_note_base is not None else None
+                if prev_eff is None or current_note != prev_eff:
+                    # Stop previous note if any (but not if it's a right-click latched note)
+                    if self._last_drag_note_base is not None and not self.sustain and not self.latch:
+                        prev_note = prev_eff  # computed above
                         ch = self.midi_channel
                         # Don't turn off right-click latched notes
                         if (prev_note, ch) not in self._right_click_latched:
-                            self.midi.note_off(prev_note, ch)
+                            self._post_midi('note_off', prev_note, ch)
                             self.active_notes.discard((prev_note, ch))
-                    if self.last_drag_button is not None:
-                        # Clear visual during drag when not over any key (but preserve right-click latched)
+                    # Update previous button visual (but preserve right-click latched visuals)
+                    if self.last_drag_button is not None and self.last_drag_button is not widget_under:
                         prev_base = getattr(self.last_drag_button, 'key_note', None)
                         if prev_base is not None:
                             prev_eff_note = self.effective_note(prev_base)
                             ch = self.midi_channel
                             if (prev_eff_note, ch) not in self._right_click_latched:
                                 self._apply_btn_visual(self.last_drag_button, False, False)
-                        # Keep hover suppressed during drag to avoid ghost hover until drag end
                         try:
                             self.last_drag_button.setProperty('hoveroff', 'true')
-                            st4 = self.last_drag_button.style()
-                            if st4 is not None:
-                                st4.unpolish(self.last_drag_button)
-                                st4.polish(self.last_drag_button)
+                            st3 = self.last_drag_button.style()
+                            if st3 is not None:
+                                st3.unpolish(self.last_drag_button)
+                                st3.polish(self.last_drag_button)
                             self.last_drag_button.update()
                         except Exception:
                             pass
-                    # And clear explicit hover
-                    if self._last_hover_btn is self.last_drag_button:
-                        self._set_hover(self.last_drag_button, False)
-                        self._last_hover_btn = None
-
-                    self._last_drag_note_base = None
-                    self.last_drag_key = None
-                    self.last_drag_button = None
-                    # Ensure no keys remain visually active when off any key
-                    self._clear_all_key_visuals_except(None)
-                return False
-            # Ensure release anywhere stops dragging and releases note
-            if event.type() == QEvent.MouseButtonRelease:
-                self.dragging = False
-                if self._last_drag_note_base is not None and not self.sustain and not getattr(self, 'latch', False):
-                    note = self.effective_note(self._last_drag_note_base)
+                        # Clear explicit hover on previous key
+                        if self._last_hover_btn is self.last_drag_button:
+                            self._set_hover(self.last_drag_button, False)
+                            self._last_hover_btn = None
+
+                    # Start new
+                    vel = self._compute_velocity(100)
+                    ch = self.midi_channel
+                    if not self.latch:
+                        self._post_midi('note_on', current_note, vel, ch)
+                        self.active_notes.add((current_note, ch))
+                    # Update current button visual and references
+                    self._apply_btn_visual(widget_under, True, False)
+                    self.last_drag_button = widget_under
+                    self._last_drag_note_base = base
+                    self.last_drag_key = None  # no heavy KeyDef allocation
+                    # Ensure no other keys remain visually active
+                    self._clear_other_actives(self.last_drag_button)
+                    # Update chord display during drag
+                    if self.chord_monitor:
+                        self._update_chord_card()
+            else:
+                # Not over any key: release previous note and clear visual, keep dragging
+                if self._last_drag_note_base is not None and not self.sustain and not self.latch:
+                    prev_note = self.effective_note(self._last_drag_note_base)
                     ch = self.midi_channel
                     # Don't turn off right-click latched notes
-                    if (note, ch) not in self._right_click_latched:
-                        self.midi.note_off(note, ch)
-                        self.active_notes.discard((note, ch))
-                # On drag-release: only latch keeps visuals held; sustain clears visuals
-                # But always preserve right-click latched visuals
+                    if (prev_note, ch) not in self._right_click_latched:
+                        self._post_midi('note_off', prev_note, ch)
+                        self.active_notes.discard((prev_note, ch))
                 if self.last_drag_button is not None:
-                    last_base = getattr(self.last_drag_button, 'key_note', None)
-                    is_right_click_latched = False
-                    if last_base is not None:
-                        last_eff = self.effective_note(last_base)
+                    # Clear visual during drag when not over any key (but preserve right-click latched)
+                    prev_base = getattr(self.last_drag_button, 'key_note', None)
+                    if prev_base is not None:
+                        prev_eff_note = self.effective_note(prev_base)
                         ch = self.midi_channel
-                        is_right_click_latched = (last_eff, ch) in self._right_click_latched
-                    
-                    if getattr(self, 'latch', False) or is_right_click_latched:
-                        self._apply_btn_visual(self.last_drag_button, True, True)
-                    else:
-                        self._apply_btn_visual(self.last_drag_button, False, False)
-                        # Reinforce after event processing to avoid any transient re-activation
-                        try:
-                            btn_ref = self.last_drag_button
-                            QTimer.singleShot(0, lambda b=btn_ref: self._apply_btn_visual(b, False, False))
-                        except Exception:
-                            pass
-                # Clear hover suppression and visuals on whichever button was last
-                if self.last_drag_button is not None:
+                        if (prev_eff_note, ch) not in self._right_click_latched:
+                            self._apply_btn_visual(self.last_drag_button, False, False)
+                    # Keep hover suppressed during drag to avoid ghost hover until drag end
                     try:
-                        self.last_drag_button.setProperty('hoveroff', 'false')
-                        st5 = self.last_drag_button.style()
-                        if st5 is not None:
-                            st5.unpolish(self.last_drag_button)
-                            st5.polish(self.last_drag_button)
+                        self.last_drag_button.setProperty('hoveroff', 'true')
+                        st4 = self.last_drag_button.style()
+                        if st4 is not None:
+                            st4.unpolish(self.last_drag_button)
+                            st4.polish(self.last_drag_button)
                         self.last_drag_button.update()
                     except Exception:
                         pass
-                # Clear any explicit hover state on release
-                if self._last_hover_btn is not None:
-                    self._set_hover(self._last_hover_btn, False)
+                # And clear explicit hover
+                if self._last_hover_btn is self.last_drag_button:
+                    self._set_hover(self.last_drag_button, False)
                     self._last_hover_btn = None
+
                 self._last_drag_note_base = None
                 self.last_drag_key = None
                 self.last_drag_button = None
-
-                # Normalize visuals in case of missed transitions
-                self._sync_visuals_if_needed()
-                # Release mouse capture
+                # Ensure no keys remain visually active when off any key
+                self._clear_all_key_visuals_except(None)
+            return False
+        # Ensure release anywhere stops dragging and releases note
+        if event.type() == QEvent.MouseButtonRelease:
+            self.dragging = False
+            if self._last_drag_note_base is not None and not self.sustain and not self.latch:
+                note = self.effective_note(self._last_drag_note_base)
+                ch = self.midi_channel
+                # Don't turn off right-click latched notes
+                if (note, ch) not in self._right_click_latched:
+                    self._post_midi('note_off', note, ch)
+                    self.active_notes.discard((note, ch))
+            # On drag-release: only latch keeps visuals held; sustain clears visuals
+            # But always preserve right-click latched visuals
+            if self.last_drag_button is not None:
+                last_base = getattr(self.last_drag_button, 'key_note', None)
+                is_right_click_latched = False
+                if last_base is not None:
+                    last_eff = self.effective_note(last_base)
+                    ch = self.midi_channel
+                    is_right_click_latched = (last_eff, ch) in self._right_click_latched
+                    
+                if self.latch or is_right_click_latched:
+                    self._apply_btn_visual(self.last_drag_button, True, True)
+                else:
+                    self._apply_btn_visual(self.last_drag_button, False, False)
+                    # Reinforce after event processing to avoid any transient re-activation
+                    self._schedule_visual_cleanup(self.last_drag_button)
+            # Clear hover suppression and visuals on whichever button was last
+            if self.last_drag_button is not None:
                 try:
-                    self.piano_container.releaseMouse()
+                    self.last_drag_button.setProperty('hoveroff', 'false')
+                    st5 = self.last_drag_button.style()
+                    if st5 is not None:
+                        st5.unpolish(self.last_drag_button)
+                        st5.polish(self.last_drag_button)
+                    self.last_drag_button.update()
                 except Exception:
                     pass
-                return False
-        return super().eventFilter(obj, event)
+            # Clear any explicit hover state on release
+            if self._last_hover_btn is not None:
+                self._set_hover(self._last_hover_btn, False)
+                self._last_hover_btn = None
+            self._last_drag_note_base = None
+            self.last_drag_key = None
+            self.last_drag_button = None
+
+            # Normalize visuals in case of missed transitions
+            self._sync_visuals_if_needed()
+            # Release mouse capture
+            try:
+                self.piano_container.releaseMouse()
+            except Exception:
+                pass
+            return False
+        return False
 
     # ---- Velocity helpers ----
     def _toggle_vel_random(self, checked: bool):
@@ -1842,27 +2029,55 @@ class KeyboardWidget(QWidget):
         """Compute outgoing velocity from UI.
         base is the key's default velocity (e.g., KeyDef.velocity or 100 during drag).
         """
-        if getattr(self, 'vel_random_chk', None) and self.vel_random_chk.isChecked():
-            low, high = self.vel_range.values()
-            raw = random.randint(min(low, high), max(low, high))
+        if self.vel_random_chk.isChecked():
+            raw = self._next_random_velocity()
         else:
-            raw = int(self.vel_slider.value())
-        # Apply per-key scaling then curve
-        scaled = int(raw * (base / 127))
-        return max(1, min(127, velocity_curve(scaled, self.vel_curve)))
+            # Fixed slider velocity: per-key scaling and curve are baked into the table
+            return self._vel_lut[max(0, min(127, int(base)))]
+        # Apply per-key scaling, then the clamped curve table
+        return self._curve_lut[(raw * max(0, min(127, int(base)))) // 127]
+
+    def _next_random_velocity(self) -> int:
+        """Return the next pre-drawn random velocity for the current range.
+
+        Values are drawn in batches of ``_RND_BATCH`` with ``random.choices``;
+        the batch is redrawn when used up or when the range slider moves.
+        """
+        rng = self.vel_range.values()
+        if rng != self._rnd_range or self._rnd_idx >= len(self._rnd_buf):
+            low, high = rng
+            self._rnd_buf = random.choices(range(min(low, high), max(low, high) + 1), k=self._RND_BATCH)
+            self._rnd_range = rng
+            self._rnd_idx = 0
+        v = self._rnd_buf[self._rnd_idx]
+        self._rnd_idx += 1
+        return v
+
+    def _rebuild_vel_lut(self, *_):
+        """Rebuild the 128-entry fixed-velocity table for the current slider value and curve.
+
+        Entry ``kv`` holds the velocity sent for a key whose base velocity is
+        ``kv``, so the note-on path is a single byte index instead of a
+        scale-then-curve computation per press.
+        """
+        sv = int(self.vel_slider.value())
+        # Curve output per scaled input, clamped to a valid note-on velocity
+        curve_lut = bytes(max(1, min(127, velocity_curve(v, self.vel_curve))) for v in range(128))
+        self._curve_lut = curve_lut
+        self._vel_lut = bytes(curve_lut[(sv * kv) // 127] for kv in range(128))
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to stop dragging"""
         if self.dragging:
             self.dragging = False
-            if self._last_drag_note_base is not None and not self.sustain and not getattr(self, 'latch', False):
+            if self._last_drag_note_base is not None and not self.sustain and not self.latch:
                 note = self.effective_note(self._last_drag_note_base)
                 ch = self.midi_channel
-                self.midi.note_off(note, ch)
+                self._post_midi('note_off', note, ch)
                 self.active_notes.discard((note, ch))
             # Clear visuals and restore hover
             if self.last_drag_button is not None:
-                if not getattr(self, 'latch', False):
+                if not self.latch:
                     # Always clear visuals on release; sustain should not keep visuals held
                     self._apply_btn_visual(self.last_drag_button, False, False)
                 # Restore normal hover behavior
@@ -1885,8 +2100,11 @@ class KeyboardWidget(QWidget):
                 pass
 
     def set_sustain(self, checked: bool):
-        """Set sustain state and synchronize UI/notes."""
-        self.sustain = bool(checked)
+        """Set sustain state and synchronize UI/notes (no-op when unchanged)."""
+        checked = bool(checked)
+        if checked == self.sustain:
+            return
+        self.sustain = checked
         try:
             self.sustain_btn.blockSignals(True)
             self.sustain_btn.setChecked(self.sustain)
@@ -1905,9 +2123,12 @@ class KeyboardWidget(QWidget):
         self.set_sustain(self.sustain_btn.isChecked())
 
     def set_latch(self, checked: bool):
-        """Enable/disable latch mode and sync UI."""
-        prev = getattr(self, 'latch', False)
-        self.latch = bool(checked)
+        """Enable/disable latch mode and sync UI (no-op when unchanged)."""
+        prev = self.latch
+        checked = bool(checked)
+        if checked == prev:
+            return
+        self.latch = checked
         try:
             self.latch_btn.blockSignals(True)
             self.latch_btn.setChecked(self.latch)
@@ -1935,35 +2156,44 @@ class KeyboardWidget(QWidget):
         # Update chord card when toggling
         self._update_chord_card()
 
-    def keyPressEvent(self, event):
-        """Handle the keyboard shortcuts (Z/X octave, 1/2/3 curve, Q quantize, Esc panic)."""
-        k = event.key()
-        if k == Qt.Key_Z:
-            self.change_octave(-1)
-        elif k == Qt.Key_X:
-            self.change_octave(+1)
-        elif k == Qt.Key_1:
-            self.vel_curve = "linear"; self.vel_label.setText("Vel curve: linear")
-        elif k == Qt.Key_2:
-            self.vel_curve = "soft"; self.vel_label.setText("Vel curve: soft")
-        elif k == Qt.Key_3:
-            self.vel_curve = "hard"; self.vel_label.setText("Vel curve: hard")
-        elif k == Qt.Key_Q:
-            q = self.layout_model.quantize_scale or "chromatic"
-            self.layout_model.quantize_scale = "chromatic" if q != "chromatic" else "major"
-        elif k == Qt.Key_Escape:
-            self.all_notes_off()
-
-    def all_notes_off(self):
-        """Send Note Off for every active voice, clear visuals, and refresh the chord card."""
-        for note, ch in list(self.active_notes):
-            self.midi.note_off(note, ch)
+    def _set_vel_curve(self, curve: VelCurve):
+        """Select the velocity curve, update its label, and rebuild the tables."""
+        self.vel_curve = curve
+        self.vel_label.setText(f"Vel curve: {curve.name.lower()}")
+        self._rebuild_vel_lut()
+
+    def _toggle_quantize(self):
+        """Toggle scale quantization between chromatic and major."""
+        q = self.layout_model.quantize_scale or "chromatic"
+        self.layout_model.quantize_scale = "chromatic" if q != "chromatic" else "major"
+
+    def all_notes_off(self, per_note: bool = False):
+        """Send Note Off for every active voice, clear visuals, and refresh the chord card.
+
+        Args:
+            per_note: Release each voice with its own Note Off even on a
+                private output, where one CC 123 per channel is used otherwise.
+        """
+        if per_note or self.strict_noteoff or getattr(self.midi, 'is_shared', False):
+            # Per-note Note Off: other windows on a shared port may be sounding
+            # on the same channels, and some devices ignore CC 123
+            for note, ch in list(self.active_notes):
+                self._post_midi('note_off', note, ch)
+        else:
+            # One All Notes Off (CC 123) per channel in use
+            for ch in {ch for _, ch in self.active_notes}:
+                self._post_midi('cc', 123, 0, ch)
+        # Panic path: deliver the Note Offs now rather than waiting on the sender thread
+        try:
+            send_queue(self.midi).drain()
+        except Exception:
+            pass
         self.active_notes.clear()
         self._voice_order.clear()
-        # Clear all pressed visuals
+        # Clear all pressed visuals (only lit keys can carry one)
         try:
-            for btn in self.key_buttons.values():
-                self._apply_btn_visual(btn, False, False)
+            for base_note in list(self._lit_notes):
+                self._apply_btn_visual(self.key_buttons.get(base_note), False, False)
         except Exception:
             pass
         # Hide chord card
@@ -1992,7 +2222,7 @@ class KeyboardWidget(QWidget):
                         item.widget().deleteLater()
             
             # Only show if chord monitor is on and we have active notes
-            if not getattr(self, 'chord_monitor', False):
+            if not self.chord_monitor:
                 # Keep container visible but empty
                 return
             
@@ -2003,7 +2233,7 @@ class KeyboardWidget(QWidget):
                 return
             
             # When sustain is on, only show the most recently played note
-            if getattr(self, 'sustain', False) and self._last_played_note is not None:
+            if self.sustain and self._last_played_note is not None:
                 note = self._last_played_note
                 root_pc = note % 12
                 card = KeyboardChordCard(root_pc, "Note", [note], self.chord_card_container)
@@ -2039,23 +2269,23 @@ class KeyboardWidget(QWidget):
         """Ensure only except_btn (if any) is visually active. Clear all others except right-click latched."""
         try:
             ch = self.midi_channel
-            for base_note, b in self.key_buttons.items():
+            # Ensure it stays active
+            if except_btn is not None and getattr(except_btn, '_active_state', None) is not True:
+                self._apply_btn_visual(except_btn, True, False)
+            # Only lit keys can need clearing
+            for base_note in list(self._lit_notes):
+                b = self.key_buttons.get(base_note)
                 if b is except_btn:
-                    # Ensure it stays active
-                    if b.property('active') != 'true':
-                        self._apply_btn_visual(b, True, False)
                     continue
                 # Don't clear right-click latched notes
-                eff = self.effective_note(base_note)
-                if (eff, ch) in self._right_click_latched:
+                if (self.effective_note(base_note), ch) in self._right_click_latched:
                     continue
                 # Clear both active and held for all others
                 self._apply_btn_visual(b, False, False)
-                # Also clear any explicit hovered state on others
-                try:
+            # Also clear any explicit hovered state on others
+            for b in list(self._hovered_btns):
+                if b is not except_btn:
                     self._set_hover(b, False)
-                except Exception:
-                    pass
         except Exception:
             pass
 
@@ -2074,9 +2304,9 @@ class KeyboardWidget(QWidget):
         # If over the limit right now, steal oldest until compliant
         try:
             while len(self.active_notes) > self.polyphony_max and self._voice_order:
-                old_note, old_ch, old_base = self._voice_order.pop(0)
+                (old_note, old_ch), old_base = self._voice_order.popitem(last=False)
                 try:
-                    self.midi.note_off(old_note, old_ch)
+                    self._post_midi('note_off', old_note, old_ch)
                 except Exception:
                     pass
                 self.active_notes.discard((old_note, old_ch))
@@ -2085,10 +2315,19 @@ class KeyboardWidget(QWidget):
             pass
 
     # ---- MIDI and title helpers ----
+    def _post_midi(self, method: str, *args):
+        """Queue ``self.midi.<method>(*args)`` on the output's background sender.
+
+        Note and controller messages share one FIFO per output, so they keep
+        their relative order while the GUI thread never blocks on port I/O.
+        """
+        send_queue(self.midi).post(method, *args)
+
     def set_midi_out(self, midi_out: MidiOut, port_name: str | None = None):
         """Swap the MIDI output device for this keyboard and update title."""
-        # Stop any currently sounding notes before switching (no flash)
-        self._perform_all_notes_off()
+        # Stop any currently sounding notes before switching (no flash); the
+        # old port's synth may not honour CC 123, so release each note
+        self._perform_all_notes_off(per_note=True)
         self.midi = midi_out
         if port_name is not None:
             self.port_name = port_name
@@ -2109,9 +2348,12 @@ class KeyboardWidget(QWidget):
             pass
         self._perform_all_notes_off()
 
-    def _perform_all_notes_off(self):
-        """Clear all active notes, pressed visuals, and any drag state (no flash)."""
-        self.all_notes_off()
+    def _perform_all_notes_off(self, per_note: bool = False):
+        """Clear all active notes, pressed visuals, and any drag state (no flash).
+
+        ``per_note`` is passed on to :meth:`all_notes_off`.
+        """
+        self.all_notes_off(per_note)
         if self.last_drag_button is not None:
             self._apply_btn_visual(self.last_drag_button, False, False)
         self.last_drag_button = None
@@ -2124,47 +2366,43 @@ class KeyboardWidget(QWidget):
             pass
 
     def _flash_all_off_button(self, duration_ms: int = 150):
-        """Temporarily set All Notes Off button to blue to indicate action, then revert."""
-        btn = getattr(self, 'all_off_btn', None)
-        if not isinstance(btn, QPushButton):
-            return
-        try:
-            base_qss = getattr(self, '_all_off_btn_base_qss', str(btn.styleSheet()))
-        except Exception:
-            base_qss = ""
-        # Blue flash style matching Sustain/Latch blue
-        flash_qss = (
-            "QPushButton {"
-            "  padding: 1px 4px;"
-            "  min-height: 0px;"
-            "  border-radius: 3px;"
-            "  color: white;"
-            "  background-color: #3498db;"
-            "  border: 1px solid #2980b9;"
-            "}"
-            "QPushButton:hover { background-color: #2f8ccc; }"
-            "QPushButton:pressed { background-color: #2a7fb8; }"
-        )
-        try:
-            btn.setStyleSheet(flash_qss)
-        except Exception:
-            return
+        """Temporarily set All Notes Off button to blue to indicate action, then revert.
+
+        The blue look is the ``[flash="true"]`` rule of the shared header sheet,
+        so flashing only toggles a property instead of re-parsing a stylesheet.
+        """
+        self._set_all_off_flash(True)
         # Revert after delay
+        QTimer.singleShot(max(50, int(duration_ms)), self._end_all_off_flash)
+
+    def _end_all_off_flash(self):
+        """Timer slot restoring the All Notes Off button's normal look."""
+        self._set_all_off_flash(False)
+
+    def _set_all_off_flash(self, on: bool):
+        """Toggle the ``flash`` property on the All Notes Off button and repolish it."""
         try:
-            QTimer.singleShot(max(50, int(duration_ms)), lambda b=btn, q=base_qss: b.setStyleSheet(q))
+            btn = self.all_off_btn
+            btn.setProperty('flash', 'true' if on else 'false')
+            st = btn.style()
+            if st is not None:
+                st.polish(btn)
+            btn.update()
         except Exception:
-            # Fallback: immediate revert if timer unavailable
-            try:
-                btn.setStyleSheet(base_qss)
-            except Exception:
-                pass
+            pass
 
     def set_channel(self, channel_1_based: int):
         """Set MIDI channel (1-16). Sends All Notes Off and updates title."""
         channel_1_based = max(1, min(16, channel_1_based))
         if self.midi_channel == channel_1_based - 1:
             return
-        self._perform_all_notes_off()
+        # Release each note so nothing hangs on a synth that ignores CC 123
+        self._perform_all_notes_off(per_note=True)
+        # Deliver any coalesced wheel values on the channel they were played on
+        self._flush_pb()
+        self._flush_mod()
+        # The new channel has not heard either wheel yet
+        self._pb_sent = self._mod_sent = None
         self.midi_channel = channel_1_based - 1
         self.update_window_title()
 
@@ -2172,55 +2410,78 @@ class KeyboardWidget(QWidget):
     def _send_mod_cc(self, value: int):
         """Send Modulation (CC1) on current channel."""
         try:
-            v = max(0, min(127, int(value)))
+            v = int(value)
         except Exception:
             v = 0
+        v = 0 if v < 0 else (127 if v > 127 else v)
+        # Written by the output's background sender so the GUI thread never blocks on I/O
         try:
-            self.midi.cc(1, v, self.midi_channel)
+            send_queue(self.midi).post('cc', 1, v, self.midi_channel)
         except Exception:
             pass
 
     def _send_pitch_bend(self, value: int):
         """Send pitch bend value in [-8192, 8191] on current channel."""
         try:
-            self.midi.pitch_bend(int(value), self.midi_channel)
+            v = int(value)
+        except Exception:
+            v = 0
+        v = -8192 if v < -8192 else (8191 if v > 8191 else v)
+        try:
+            send_queue(self.midi).post('pitch_bend', v, self.midi_channel)
         except Exception:
             pass
 
+    def _queue_pitch_bend(self, value: int):
+        """Record the latest pitch-wheel value and schedule a coalesced send."""
+        self._pb_pending = value
+        if not self._pb_timer.isActive():
+            self._pb_timer.start()
+
+    def _flush_pb(self):
+        """Send the most recent pending pitch-bend value, if any."""
+        v, self._pb_pending = self._pb_pending, None
+        if v is None:
+            return
+        # Drop sub-threshold moves; always deliver center and the extremes exactly
+        last = self._pb_sent
+        if last is not None and v not in (0, -8192, 8191) and abs(v - last) < self._PB_MIN_DELTA:
+            return
+        self._pb_sent = v
+        self._send_pitch_bend(v)
+
+    def _queue_mod_cc(self, value: int):
+        """Record the latest mod-wheel value and schedule a coalesced send."""
+        self._mod_pending = value
+        if not self._mod_timer.isActive():
+            self._mod_timer.start()
+
+    def _flush_mod(self):
+        """Send the most recent pending mod-wheel value, if any."""
+        v, self._mod_pending = self._mod_pending, None
+        if v is None or v == self._mod_sent:
+            return
+        self._mod_sent = v
+        self._send_mod_cc(v)
+
     def _stop_pitch_anim(self):
-        """Cancel the pitch-wheel return animation if one is running."""
-        anim = getattr(self, '_pitch_anim', None)
-        if anim is not None:
-            try:
-                anim.stop()
-            except Exception:
-                pass
-        self._pitch_anim = None
+        """Cancel the pitch-wheel return-to-center if one is running."""
+        self._pitch_return_timer.stop()
 
     def _animate_pitch_to_center(self):
-        """Smoothly animate pitch wheel back to center (0) on release."""
-        try:
-            self._stop_pitch_anim()
-            anim = QPropertyAnimation(self.pitch_slider, b"value")
-            anim.setDuration(160)
-            anim.setStartValue(int(self.pitch_slider.value()))
-            anim.setEndValue(0)
-            try:
-                anim.setEasingCurve(QEasingCurve.OutCubic)
-            except Exception:
-                pass
-            # Keep a reference so GC doesn't kill the animation
-            self._pitch_anim = anim
-            def _clear_anim():
-                self._pitch_anim = None
-            try:
-                anim.finished.connect(_clear_anim)
-            except Exception:
-                pass
-            anim.start()
-        except Exception:
-            # If animation fails, snap to center
-            try:
-                self.pitch_slider.setValue(0)
-            except Exception:
-                pass
+        """Ease the pitch wheel back to center (0) on release.
+
+        Each timer tick halves the distance to center, which settles from full
+        bend in roughly the same ~160 ms the wheel has always taken.
+        """
+        if self.pitch_slider.value() == 0:
+            return
+        self._pitch_return_timer.start()
+
+    def _step_pitch_return(self):
+        """Advance the pitch-wheel return by one tick; snap and stop near center."""
+        nv = int(self.pitch_slider.value() * 0.5)
+        if -4 < nv < 4:
+            self._pitch_return_timer.stop()
+            nv = 0
+        self.pitch_slider.setValue(nv)
@@ -8,6 +8,56 @@ from PySide6.QtGui import QIcon
 from pathlib import Path
 from typing import Optional, List, Any
 import sys
+import threading
+
+
+# Shared by both launch groups: the frame plus the buttons inside it
+_LAUNCH_GROUP_QSS = """
+    QGroupBox {
+        font-size: 16px;
+        font-weight: bold;
+        color: #fff;
+        border: 2px solid #3b4148;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QPushButton {
+        background-color: #2b2f36;
+        border: 2px solid #3b4148;
+        border-radius: 8px;
+        padding: 12px;
+        color: #fff;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        border: 2px solid #2f82e6;
+        background-color: #3a3f46;
+    }
+    QPushButton:pressed {
+        background-color: #2f82e6;
+    }
+"""
+
+# (attribute, label, launch) rows, laid out two per row in table order
+_KEYBOARD_LAUNCHERS = (
+    ("btn_piano_25", "25-Key Piano", lambda self: self._open_piano(25)),
+    ("btn_piano_49", "49-Key Piano", lambda self: self._open_piano(49)),
+    ("btn_piano_61", "61-Key Piano", lambda self: self._open_piano(61)),
+    ("btn_harmonic", "Harmonic Table", lambda self: self._open_piano(61, harmonic=True)),
+)
+_WINDOW_LAUNCHERS = (
+    ("btn_chord_monitor", "Chord Pad", lambda self: self._launch_chord_monitor()),
+    ("btn_pad_grid", "Pad Grid", lambda self: self._launch_pad_grid()),
+    ("btn_faders", "Faders", lambda self: self._launch_faders()),
+    ("btn_xy_fader", "XY Fader", lambda self: self._launch_xy_fader()),
+)
 
 
 class LauncherWindow(QMainWindow):
@@ -36,8 +86,10 @@ class LauncherWindow(QMainWindow):
         
         # Show available MIDI ports
         self._available_ports: list[str] = []
+        listed_ports: list[str] | None = None
         try:
             self._available_ports = list(mido.get_output_names())  # type: ignore[attr-defined]
+            listed_ports = self._available_ports
             if self._available_ports:
                 print(f"Available MIDI ports: {', '.join(self._available_ports)}")
             else:
@@ -60,13 +112,22 @@ class LauncherWindow(QMainWindow):
         self._current_port_name: str = initial_port or ""
         
         try:
-            self.shared_midi = MidiOut(port_name_contains=self._current_port_name, is_shared=True)
+            self.shared_midi = MidiOut(
+                port_name_contains=self._current_port_name,
+                is_shared=True,
+                available_ports=listed_ports,
+            )
             backend = "pygame" if self.shared_midi.use_pygame else "mido"
             print(f"✓ Launcher initialized with {backend} MIDI backend on port: {self._current_port_name}")
         except Exception as e:
             print(f"✗ Warning: Could not initialize MIDI output: {e}")
             self.shared_midi = None
         
+        # Import the window modules in the background while the launcher is
+        # on screen so the first launch click doesn't pay for them. A click
+        # that races the prewarm simply waits on Python's import lock.
+        threading.Thread(target=self._prewarm_imports, daemon=True).start()
+        
         self.setWindowTitle("Octavium Launcher")
         self.setMinimumSize(600, 500)
         
@@ -183,75 +244,9 @@ class LauncherWindow(QMainWindow):
         
         layout.addSpacing(10)
         
-        # Keyboards section
-        keyboards_group = QGroupBox("Keyboards")
-        keyboards_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #fff;
-                border: 2px solid #3b4148;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        keyboards_layout = QGridLayout()
-        keyboards_layout.setSpacing(10)
-        
-        # Keyboard buttons
-        self.btn_piano_25 = self._create_launch_button("25-Key Piano", self._launch_piano_25)
-        self.btn_piano_49 = self._create_launch_button("49-Key Piano", self._launch_piano_49)
-        self.btn_piano_61 = self._create_launch_button("61-Key Piano", self._launch_piano_61)
-        self.btn_harmonic = self._create_launch_button("Harmonic Table", self._launch_harmonic_table)
-        
-        keyboards_layout.addWidget(self.btn_piano_25, 0, 0)
-        keyboards_layout.addWidget(self.btn_piano_49, 0, 1)
-        keyboards_layout.addWidget(self.btn_piano_61, 1, 0)
-        keyboards_layout.addWidget(self.btn_harmonic, 1, 1)
-        
-        keyboards_group.setLayout(keyboards_layout)
-        layout.addWidget(keyboards_group)
-        
-        # Windows section
-        windows_group = QGroupBox("Windows")
-        windows_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #fff;
-                border: 2px solid #3b4148;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        windows_layout = QGridLayout()
-        windows_layout.setSpacing(10)
-        
-        # Window buttons
-        self.btn_chord_monitor = self._create_launch_button("Chord Pad", self._launch_chord_monitor)
-        self.btn_pad_grid = self._create_launch_button("Pad Grid", self._launch_pad_grid)
-        self.btn_faders = self._create_launch_button("Faders", self._launch_faders)
-        self.btn_xy_fader = self._create_launch_button("XY Fader", self._launch_xy_fader)
-        
-        windows_layout.addWidget(self.btn_chord_monitor, 0, 0)
-        windows_layout.addWidget(self.btn_pad_grid, 0, 1)
-        windows_layout.addWidget(self.btn_faders, 1, 0)
-        windows_layout.addWidget(self.btn_xy_fader, 1, 1)
-        
-        windows_group.setLayout(windows_layout)
-        layout.addWidget(windows_group)
+        # Keyboards and windows sections; one sheet per group styles its buttons
+        for title, launchers in (("Keyboards", _KEYBOARD_LAUNCHERS), ("Windows", _WINDOW_LAUNCHERS)):
+            layout.addWidget(self._create_launch_group(title, launchers))
         
         # Generative section (Modulune) — roadmap, hidden for now
         
@@ -268,29 +263,27 @@ class LauncherWindow(QMainWindow):
             }
         """)
     
+    def _create_launch_group(self, title: str, launchers) -> QGroupBox:
+        """Build a launch group laid out two buttons per row.
+
+        Each button is also stored on ``self`` under its table attribute name.
+        """
+        group = QGroupBox(title)
+        group.setStyleSheet(_LAUNCH_GROUP_QSS)
+        grid = QGridLayout()
+        grid.setSpacing(10)
+        for i, (attr, text, launch) in enumerate(launchers):
+            btn = self._create_launch_button(text, lambda _checked=False, f=launch: f(self))
+            setattr(self, attr, btn)
+            grid.addWidget(btn, i // 2, i % 2)
+        group.setLayout(grid)
+        return group
+    
     def _create_launch_button(self, text: str, callback) -> QPushButton:
-        """Create a styled launch button."""
+        """Create a launch button; its look comes from the group's sheet."""
         btn = QPushButton(text)
         btn.setMinimumHeight(60)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2b2f36;
-                border: 2px solid #3b4148;
-                border-radius: 8px;
-                padding: 12px;
-                color: #fff;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                border: 2px solid #2f82e6;
-                background-color: #3a3f46;
-            }
-            QPushButton:pressed {
-                background-color: #2f82e6;
-            }
-        """)
         btn.clicked.connect(callback)
         return btn
     
@@ -352,7 +345,8 @@ class LauncherWindow(QMainWindow):
         """Create a new shared MidiOut on port_name and propagate to all open windows."""
         from .midi_io import MidiOut
         try:
-            new_midi = MidiOut(port_name_contains=port_name, is_shared=True)
+            new_midi = MidiOut(port_name_contains=port_name, is_shared=True,
+                               available_ports=self._available_ports)
         except Exception as e:
             QMessageBox.critical(self, "MIDI Port Error", f"Could not open port '{port_name}':\n{e}")
             return
@@ -378,43 +372,25 @@ class LauncherWindow(QMainWindow):
                 pass
         self.opened_windows = alive
     
-    def _launch_piano_25(self):
-        """Launch 25-key piano window."""
-        from .main import MainWindow
-        if self.shared_midi:
-            window = MainWindow(self.app, size=25, midi=self.shared_midi)
-            window.show()
-            self.opened_windows.append(window)
-        else:
-            print("Error: No MIDI output available")
-    
-    def _launch_piano_49(self):
-        """Launch 49-key piano window."""
-        from .main import MainWindow
-        if self.shared_midi:
-            window = MainWindow(self.app, size=49, midi=self.shared_midi)
-            window.show()
-            self.opened_windows.append(window)
-        else:
-            print("Error: No MIDI output available")
-    
-    def _launch_piano_61(self):
-        """Launch 61-key piano window."""
-        from .main import MainWindow
-        if self.shared_midi:
-            window = MainWindow(self.app, size=61, midi=self.shared_midi)
-            window.show()
-            self.opened_windows.append(window)
-        else:
-            print("Error: No MIDI output available")
+    def _prewarm_imports(self):
+        """Import the heavy window modules off the GUI thread.
+
+        Only module-level imports happen here; no widgets are created.
+        Failures are ignored; the launch slot then re-raises on its own import.
+        """
+        try:
+            from . import main, standalone_windows, chord_monitor_window  # noqa: F401
+        except Exception:
+            pass
     
-    def _launch_harmonic_table(self):
-        """Launch harmonic table window."""
+    def _open_piano(self, size: int, harmonic: bool = False):
+        """Launch a keyboard window with ``size`` keys, optionally as a harmonic table."""
         from .main import MainWindow
         if self.shared_midi:
-            window = MainWindow(self.app, size=61, midi=self.shared_midi)
-            # Switch to harmonic table view
-            window.set_harmonic_table()
+            window = MainWindow(self.app, size=size, midi=self.shared_midi)
+            if harmonic:
+                # Switch to harmonic table view
+                window.set_harmonic_table()
             window.show()
             self.opened_windows.append(window)
         else:
@@ -493,6 +469,9 @@ class LauncherWindow(QMainWindow):
 def run():
     """Run the Octavium launcher."""
     app = QApplication(sys.argv)
+    # QSettings location for the per-window menu preferences
+    app.setOrganizationName("Octavium")
+    app.setApplicationName("Octavium")
     
     # Set application icon
     try:
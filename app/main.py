@@ -6,29 +6,21 @@ operate on it (zoom, channel, view switching, chord monitor, etc.).
 """
 
 import sys
-import traceback
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QMenu, QInputDialog, QMessageBox,
-    QDialog, QDialogButtonBox, QFormLayout, QComboBox, QLabel, QWidget,
+    QApplication, QMainWindow, QInputDialog, QMessageBox,
+    QDialog, QDialogButtonBox, QFormLayout, QComboBox, QLabel,
     QVBoxLayout, QScrollArea, QPushButton
 )
-from PySide6.QtGui import QAction, QActionGroup, QIcon, QPixmap, QShortcut, QKeySequence
+from PySide6.QtGui import QAction, QActionGroup, QIcon, QShortcut, QKeySequence
 from pathlib import Path
-from PySide6.QtCore import Qt, QTimer, QUrl
-import mido
-
-# Prefer RtMidi backend; silently fall back to pygame if unavailable
-try:
-    mido.set_backend('mido.backends.rtmidi')
-except Exception:
-    try:
-        mido.set_backend('mido.backends.pygame')
-    except Exception:
-        pass
+from PySide6.QtCore import Qt, QTimer, QUrl, QSettings, Signal, Slot
 
 from .keyboard_widget import KeyboardWidget
-from .midi_io import MidiOut, list_output_names
+from .midi_io import MidiOut, PendingMidiOut, list_output_names
 from .themes import APP_STYLES
 from .piano_layout import create_piano_by_size
 from .pad_grid import PadGridWidget, create_pad_grid_layout
@@ -38,6 +30,22 @@ from .harmonic_table import HarmonicTableWidget
 from .chord_monitor_window import ChordMonitorWindow
 
 
+@lru_cache(maxsize=1)
+def _about_logo_html() -> str:
+    """Return the centered logo ``<img>`` block for the About dialog.
+
+    The logo path is resolved and checked once; later dialogs reuse it.
+    """
+    try:
+        logo_path = Path(__file__).resolve().parent.parent / "Octavium logo.png"
+        if logo_path.exists():
+            logo_url = QUrl.fromLocalFile(str(logo_path)).toString()
+            return f"<div style='text-align:center; margin-bottom:10px'><img src='{logo_url}' width='320'></div>"
+    except Exception:
+        pass
+    return ""
+
+
 class MainWindow(QMainWindow):
     """Top-level window that swaps between piano, harmonic-table, and other surfaces.
 
@@ -46,6 +54,23 @@ class MainWindow(QMainWindow):
     replace it in place while preserving channel and zoom state.
     """
 
+    # Emitted by the port-opening thread with (MidiOut or None, port name)
+    _port_opened = Signal(object, str)
+    # Emitted by the port-listing thread with (monotonic time, names) or None
+    _ports_listed = Signal(object)
+    # Seconds a listed set of output ports is reused by select_midi_port
+    _PORTS_TTL_S = 2.0
+    # View/Voices menu preferences kept across launches (QSettings key -> default).
+    # Defaults match KeyboardWidget's own, so a first launch behaves as before.
+    _SAVED_PREFS = {
+        'show_mod': False,
+        'show_pitch': False,
+        'visual_hold_checked': False,
+        'drag_while_sustain_checked': True,
+        'right_click_latch_checked': True,
+        'voices_selected': 'Unlimited',
+    }
+
     def __init__(self, app_ref: QApplication, size: int = 49, port_hint: str = "loopMIDI Port 1", midi: MidiOut | None = None):
         """Build the main window with an initial piano keyboard.
 
@@ -53,13 +78,10 @@ class MainWindow(QMainWindow):
             app_ref: The owning :class:`QApplication`.
             size: Initial piano key count (25/49/61/73/76/88).
             port_hint: Substring used to pick a MIDI output port when one
-                is not provided explicitly.
+                is not provided explicitly. The port is opened in the
+                background; failure is reported in a message box.
             midi: Optional shared :class:`MidiOut`; when supplied the
                 window will not attempt to open or close the port itself.
-
-        Raises:
-            RuntimeError: Propagated from :class:`MidiOut` when no MIDI
-                output port can be opened.
         """
         super().__init__()
         self.app_ref = app_ref
@@ -73,16 +95,27 @@ class MainWindow(QMainWindow):
         self.current_size = size
         self.current_scale = 1.0
         self.current_channel = 1
+        # One deferred window fit per event-loop pass (see _schedule_resize)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._do_deferred_resize)
+        self._resize_layout = None
+        self._menubar = self.menuBar()
+        self._ports_cache: tuple[float, list[str]] | None = None
+        self._ports_prefetching = False
+        self._port_opened.connect(self._on_port_opened)
+        self._ports_listed.connect(self._on_ports_listed)
         self.chord_monitor_window: ChordMonitorWindow | None = None
         # Track if MIDI is shared (from launcher) to prevent port changes
         self.midi_is_shared = midi is not None
-        # Create or reuse MIDI
+        # Create or reuse MIDI. A port of our own is opened in the background
+        # (see _open_port_async) so the window paints before the driver binds;
+        # anything played meanwhile is recorded and replayed once it is open.
+        open_port = None
         if midi is None:
-            try:
-                midi = MidiOut(port_name_contains=port_hint)
-            except Exception as e:
-                QMessageBox.critical(self, "MIDI Error", f"Failed to open MIDI output (hint '{port_hint}'):\n{e}")
-                raise
+            midi = PendingMidiOut()
+            open_port = port_hint
         # Build initial widget
         self.current_layout_type = 'piano'
         layout = create_piano_by_size(size)
@@ -93,12 +126,7 @@ class MainWindow(QMainWindow):
         self.keyboard.set_channel(self.current_channel)
         self.setCentralWidget(self.keyboard)
         self._update_window_title()
-        self._resize_for_layout(self.keyboard.layout_model)
-        QTimer.singleShot(0, lambda: (
-            self.keyboard.adjustSize(),
-            self._resize_for_layout(None),
-            self.adjustSize()
-        ))
+        self._schedule_resize(self.keyboard.layout_model)
         # Ensure MIDI closes on exit
         try:
             self.app_ref.aboutToQuit.connect(lambda: self._safe_close_midi())
@@ -106,6 +134,8 @@ class MainWindow(QMainWindow):
             pass
         # Build menus last
         self._build_menus()
+        if open_port is not None:
+            self._open_port_async(open_port)
 
     def set_harmonic_table(self):
         """Switch to the Harmonic Table widget."""
@@ -145,14 +175,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self._update_window_title()
-            self._resize_for_layout(None)
-            self.keyboard.adjustSize()
-            self.adjustSize()
-            QTimer.singleShot(0, lambda: (
-                self.keyboard.adjustSize(),
-                self._resize_for_layout(None),
-                self.adjustSize()
-            ))
+            self._schedule_resize()
         except Exception:
             pass
 
@@ -165,6 +188,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    @Slot()
     def open_xy_cc_dialog(self):
         """Show a modal dialog letting the user pick CC numbers for the XY axes."""
         try:
@@ -204,6 +228,7 @@ class MainWindow(QMainWindow):
     def _build_menus(self):
         """Construct the application menu bar (File / View / Keyboard / Help)."""
         menubar = self.menuBar()
+        self.menu_actions = self._load_prefs()
 
         # File menu
         file_menu = menubar.addMenu("&File")
@@ -217,101 +242,40 @@ class MainWindow(QMainWindow):
 
         # View menu (Mod/Pitch wheels) — place right after File
         view_menu = menubar.addMenu("&View")
-        self.menu_actions = getattr(self, 'menu_actions', {})
         show_mod = QAction("Show Mod Wheel", self)
         show_mod.setCheckable(True)
         show_mod.setChecked(bool(self.menu_actions.get('show_mod', False)))
-        show_mod.toggled.connect(lambda checked: (
-            self.menu_actions.__setitem__('show_mod', bool(checked)),
-            self._apply_show_mod_wheel(checked),
-            self._resize_for_layout(None),
-            QTimer.singleShot(0, lambda: (
-                self.keyboard.adjustSize(),
-                self._resize_for_layout(None),
-                self.adjustSize()
-            ))
-        ))
+        show_mod.toggled.connect(self._on_show_mod_toggled)
         view_menu.addAction(show_mod)
         show_pitch = QAction("Show Pitch Wheel", self)
         show_pitch.setCheckable(True)
         show_pitch.setChecked(bool(self.menu_actions.get('show_pitch', False)))
-        show_pitch.toggled.connect(lambda checked: (
-            self.menu_actions.__setitem__('show_pitch', bool(checked)),
-            self._apply_show_pitch_wheel(checked),
-            self._resize_for_layout(None),
-            QTimer.singleShot(0, lambda: (
-                self.keyboard.adjustSize(),
-                self._resize_for_layout(None),
-                self.adjustSize()
-            ))
-        ))
+        show_pitch.toggled.connect(self._on_show_pitch_toggled)
         view_menu.addAction(show_pitch)
         # Visual hold preference (keep visuals pressed during sustain): moved here; default unchecked
         visual_hold = QAction("Hold Visuals During Sustain", self)
         visual_hold.setCheckable(True)
         # default unchecked unless previously set
         visual_hold.setChecked(bool(self.menu_actions.get('visual_hold_checked', False)))
-        def _toggle_visual_hold(checked: bool):
-            try:
-                self.keyboard.visual_hold_on_sustain = checked  # type: ignore[attr-defined]
-                # Persist the checked state
-                self.menu_actions['visual_hold_checked'] = checked
-                # Re-sync visuals when toggled, without touching notes
-                try:
-                    st = self.keyboard.style()
-                    for btn in self.keyboard.key_buttons.values():  # type: ignore[attr-defined]
-                        st.unpolish(btn)
-                        st.polish(btn)
-                        btn.update()
-                except Exception:
-                    pass
-            except Exception:
-                pass
-        visual_hold.triggered.connect(_toggle_visual_hold)
+        visual_hold.triggered.connect(self._toggle_visual_hold)
         view_menu.addAction(visual_hold)
         # Chord Pad option (window only, inline display is always on)
         chord_monitor = QAction("Chord Pad", self)
         chord_monitor.setCheckable(True)
         chord_monitor.setChecked(bool(self.menu_actions.get('chord_monitor', False)))
-        def _toggle_chord_monitor(checked: bool):
-            try:
-                # The inline chord display is always on (keyboard.chord_monitor = True)
-                # This menu only controls the separate chord monitor window
-                self.menu_actions['chord_monitor'] = checked
-                # Open or close chord monitor window
-                if checked:
-                    self._open_chord_monitor_window()
-                else:
-                    self._close_chord_monitor_window()
-            except Exception:
-                pass
-        chord_monitor.triggered.connect(_toggle_chord_monitor)
+        chord_monitor.triggered.connect(self._toggle_chord_monitor)
         view_menu.addAction(chord_monitor)
         # Drag While Sustain option
         drag_while_sustain = QAction("Drag While Sustain", self)
         drag_while_sustain.setCheckable(True)
-        drag_while_sustain.setChecked(bool(self.menu_actions.get('drag_while_sustain_checked', False)))
-        def _toggle_drag_while_sustain(checked: bool):
-            try:
-                self.keyboard.drag_while_sustain = checked  # type: ignore[attr-defined]
-                # Persist the checked state
-                self.menu_actions['drag_while_sustain_checked'] = checked
-            except Exception:
-                pass
-        drag_while_sustain.triggered.connect(_toggle_drag_while_sustain)
+        drag_while_sustain.setChecked(bool(self.menu_actions.get('drag_while_sustain_checked', True)))
+        drag_while_sustain.triggered.connect(self._toggle_drag_while_sustain)
         view_menu.addAction(drag_while_sustain)
         # Right-Click Latch option (enabled by default)
         right_click_latch = QAction("Right-Click Latch", self)
         right_click_latch.setCheckable(True)
         right_click_latch.setChecked(bool(self.menu_actions.get('right_click_latch_checked', True)))
-        def _toggle_right_click_latch(checked: bool):
-            try:
-                self.keyboard.right_click_latch = checked  # type: ignore[attr-defined]
-                # Persist the checked state
-                self.menu_actions['right_click_latch_checked'] = checked
-            except Exception:
-                pass
-        right_click_latch.triggered.connect(_toggle_right_click_latch)
+        right_click_latch.triggered.connect(self._toggle_right_click_latch)
         view_menu.addAction(right_click_latch)
         # Persist
         self.menu_actions['show_mod'] = show_mod.isChecked()
@@ -336,31 +300,80 @@ class MainWindow(QMainWindow):
                 self.keyboard.right_click_latch = right_click_latch.isChecked()  # type: ignore[attr-defined]
             except Exception:
                 pass
-            # Inline chord display is always on by default (keyboard.chord_monitor = True)
-            # Don't open the chord monitor window automatically
-            # User can open it via View > Chord Monitor menu if desired
-            # Ensure styles reflect any change
             try:
-                st = self.keyboard.style()
-                for btn in self.keyboard.key_buttons.values():  # type: ignore[attr-defined]
-                    st.unpolish(btn)
-                    st.polish(btn)
-                    btn.update()
+                self.keyboard.drag_while_sustain = drag_while_sustain.isChecked()  # type: ignore[attr-defined]
             except Exception:
                 pass
-            # Ensure window reflects current selection after menus are built
-            self._resize_for_layout(None)
-            QTimer.singleShot(0, lambda: (
-                self.keyboard.adjustSize(),
-                self._resize_for_layout(None),
-                self.adjustSize()
-            ))
+            # Inline chord display is always on by default (keyboard.chord_monitor = True)
+            # Don't open the chord monitor window automatically
+            # User can open it via View > Chord Monitor menu if desired
+            # No key repolish: none of these preferences is a stylesheet property
+            # The window fit queued in __init__ runs after the menus are built
         except Exception:
             pass
 
         # Build the rest of the menus (Zoom, Keyboard, MIDI, Voices, Channel, Help)
         self._build_remaining_menus(menubar, view_menu)
 
+    @Slot(bool)
+    def _on_show_mod_toggled(self, checked: bool):
+        """Persist the Show Mod Wheel choice and refit the window."""
+        self.menu_actions['show_mod'] = bool(checked)
+        self._apply_show_mod_wheel(checked)
+        self._schedule_resize()
+
+    @Slot(bool)
+    def _on_show_pitch_toggled(self, checked: bool):
+        """Persist the Show Pitch Wheel choice and refit the window."""
+        self.menu_actions['show_pitch'] = bool(checked)
+        self._apply_show_pitch_wheel(checked)
+        self._schedule_resize()
+
+    @Slot(bool)
+    def _toggle_visual_hold(self, checked: bool):
+        """Hold key visuals pressed while sustain is on."""
+        self.keyboard.visual_hold_on_sustain = checked  # type: ignore[attr-defined]
+        # Persist the checked state
+        self.menu_actions['visual_hold_checked'] = checked
+        # No key repolish needed: the preference doesn't touch any
+        # key property the stylesheet selects on
+
+    @Slot(bool)
+    def _toggle_chord_monitor(self, checked: bool):
+        """Open or close the separate Chord Pad window."""
+        try:
+            # The inline chord display is always on (keyboard.chord_monitor = True)
+            # This menu only controls the separate chord monitor window
+            self.menu_actions['chord_monitor'] = checked
+            # Open or close chord monitor window
+            if checked:
+                self._open_chord_monitor_window()
+            else:
+                self._close_chord_monitor_window()
+        except Exception:
+            pass
+
+    @Slot(bool)
+    def _toggle_drag_while_sustain(self, checked: bool):
+        """Allow glissando drags while sustain is held."""
+        try:
+            self.keyboard.drag_while_sustain = checked  # type: ignore[attr-defined]
+            # Persist the checked state
+            self.menu_actions['drag_while_sustain_checked'] = checked
+        except Exception:
+            pass
+
+    @Slot(bool)
+    def _toggle_right_click_latch(self, checked: bool):
+        """Enable or disable right-click latching of keys."""
+        try:
+            self.keyboard.right_click_latch = checked  # type: ignore[attr-defined]
+            # Persist the checked state
+            self.menu_actions['right_click_latch_checked'] = checked
+        except Exception:
+            pass
+
+    @Slot()
     def set_xy_fader(self):
         """Switch to the XY Fader widget."""
         try:
@@ -398,14 +411,7 @@ class MainWindow(QMainWindow):
                 pass
             self._update_window_title()
             # use widget sizeHint for window sizing
-            self._resize_for_layout(None)
-            self.keyboard.adjustSize()
-            self.adjustSize()
-            QTimer.singleShot(0, lambda: (
-                self.keyboard.adjustSize(),
-                self._resize_for_layout(None),
-                self.adjustSize()
-            ))
+            self._schedule_resize()
         except Exception:
             pass
 
@@ -419,6 +425,8 @@ class MainWindow(QMainWindow):
                 ("50%", 0.50), ("75%", 0.75), ("90%", 0.90), ("100% (default)", 1.00),
                 ("110%", 1.10), ("125%", 1.25), ("150%", 1.50), ("200%", 2.00),
             ]
+            # Ascending scales for the Ctrl++ / Ctrl+- steps
+            self._zoom_presets = sorted(sc for _, sc in presets)
             prev_zoom = float(self.menu_actions.get('zoom_scale', self.current_scale))
             self.zoom_actions: list[QAction] = []
             for label, scale in presets:
@@ -427,10 +435,11 @@ class MainWindow(QMainWindow):
                 if abs(scale - prev_zoom) < 1e-6:
                     act.setChecked(True)
                     self.current_scale = scale
-                act.triggered.connect(lambda checked, sc=scale: self.set_zoom(sc))
+                act.setData(scale)
                 self.zoom_group.addAction(act)
                 zoom_menu.addAction(act)
                 self.zoom_actions.append(act)
+            self.zoom_group.triggered.connect(self._on_zoom_action)
             self.menu_actions['zoom_actions'] = self.zoom_actions
             self.menu_actions['zoom_group'] = self.zoom_group
             self.menu_actions['zoom_scale'] = self.current_scale
@@ -448,12 +457,15 @@ class MainWindow(QMainWindow):
         self.size_group = QActionGroup(self)
         self.size_group.setExclusive(True)
         self.size_actions = {}
+        # Piano sizes go through the group signal; the pad/faders/XY actions
+        # below carry no data and keep their own handlers.
+        self.size_group.triggered.connect(self._on_size_action)
         for size in [49, 61, 73, 76, 88]:
             act = QAction(f"{size} Keys", self)
             act.setCheckable(True)
             if size == self.current_size:
                 act.setChecked(True)
-            act.triggered.connect(lambda checked, s=size: self.set_keyboard_size(s))
+            act.setData(size)
             self.size_group.addAction(act)
             kb_menu.addAction(act)
             self.size_actions[size] = act
@@ -461,30 +473,32 @@ class MainWindow(QMainWindow):
         pad_act = QAction("4x4 Beat Grid", self)
         pad_act.setCheckable(True)
         pad_act.setChecked(False)
-        pad_act.triggered.connect(lambda checked: self.set_pad_grid())
+        pad_act.triggered.connect(self.set_pad_grid)
         self.size_group.addAction(pad_act)
         kb_menu.addAction(pad_act)
         self.size_actions['pad4x4'] = pad_act
         faders_act = QAction("Faders", self)
         faders_act.setCheckable(True)
         faders_act.setChecked(False)
-        faders_act.triggered.connect(lambda checked: self.set_faders())
+        faders_act.triggered.connect(self.set_faders)
         self.size_group.addAction(faders_act)
         kb_menu.addAction(faders_act)
         self.size_actions['faders'] = faders_act
         xy_act = QAction("XY Fader", self)
         xy_act.setCheckable(True)
         xy_act.setChecked(False)
-        xy_act.triggered.connect(lambda checked: self.set_xy_fader())
+        xy_act.triggered.connect(self.set_xy_fader)
         self.size_group.addAction(xy_act)
         kb_menu.addAction(xy_act)
         self.size_actions['xy'] = xy_act
 
         # MIDI menu
         midi_menu = menubar.addMenu("&MIDI")
+        midi_menu.aboutToShow.connect(self._prefetch_output_names)
         select_port = QAction("Select Output Port", self)
         select_port.triggered.connect(self.select_midi_port)
         midi_menu.addAction(select_port)
+        self._select_port_action = select_port
         faders_cc_act = QAction("Configure Faders CCs…", self)
         faders_cc_act.setToolTip("Edit the 8 CC numbers used by the Faders surface (comma-separated)")
         faders_cc_act.triggered.connect(self.open_faders_cc_dialog)
@@ -498,72 +512,21 @@ class MainWindow(QMainWindow):
         self.menu_actions['xy_cc'] = xy_cc_act
         self._update_xy_menu_enabled()
 
-        # Voices (polyphony)
+        # Voices (polyphony); actions are created the first time the menu opens
         voices_menu = menubar.addMenu("&Voices")
-        self.voices_group = QActionGroup(self)
-        self.voices_group.setExclusive(True)
+        voices_menu.aboutToShow.connect(self._populate_voices_menu)
+        self._voices_menu = voices_menu
+        self.voices_group = None
         self.voices_actions = []
-        prev_sel = self.menu_actions.get('voices_selected', 'Unlimited')
-        unlimited_act = QAction("Unlimited", self)
-        unlimited_act.setCheckable(True)
-        unlimited_act.setChecked(prev_sel == 'Unlimited')
-        def _select_unlimited():
-            try:
-                self.keyboard.set_polyphony_enabled(False)  # type: ignore[attr-defined]
-            except Exception:
-                pass
-            self.menu_actions['voices_selected'] = 'Unlimited'
-        unlimited_act.triggered.connect(lambda checked: _select_unlimited())
-        self.voices_group.addAction(unlimited_act)
-        voices_menu.addAction(unlimited_act)
-        def _select_limited(n: int):
-            try:
-                self.keyboard.set_polyphony_enabled(True)  # type: ignore[attr-defined]
-                self.keyboard.set_polyphony_max(n)  # type: ignore[attr-defined]
-            except Exception:
-                pass
-            self.menu_actions['voices_selected'] = str(n)
-        for n in range(1,9):
-            act = QAction(f"{n}", self)
-            act.setCheckable(True)
-            act.setChecked(prev_sel == str(n))
-            act.triggered.connect(lambda checked, val=n: _select_limited(val))
-            self.voices_group.addAction(act)
-            voices_menu.addAction(act)
-            self.voices_actions.append(act)
-        try:
-            labels = [a.text() for a in self.voices_group.actions() if a.isChecked()]
-            if not labels:
-                unlimited_act.setChecked(True)
-                _select_unlimited()
-            else:
-                sel = labels[0]
-                if sel == 'Unlimited':
-                    _select_unlimited()
-                else:
-                    try:
-                        _select_limited(int(sel))
-                    except Exception:
-                        _select_unlimited()
-        except Exception:
-            pass
-        self.menu_actions['voices_actions'] = self.voices_actions
-        self.menu_actions['voices_group'] = self.voices_group
+        # Re-apply the saved voice limit now; the menu only reflects it
+        self._select_voices(self._saved_voices())
 
-        # Channel submenu
+        # Channel submenu, also populated on first open
         chan_menu = midi_menu.addMenu("Channel")
-        self.channel_group = QActionGroup(self)
-        self.channel_group.setExclusive(True)
+        chan_menu.aboutToShow.connect(self._populate_channel_menu)
+        self._chan_menu = chan_menu
+        self.channel_group = None
         self.channel_actions = []
-        for ch in range(1,17):
-            act = QAction(f"{ch}", self)
-            act.setCheckable(True)
-            if ch == self.current_channel:
-                act.setChecked(True)
-            act.triggered.connect(lambda checked, c=ch: self.set_channel(c))
-            self.channel_group.addAction(act)
-            chan_menu.addAction(act)
-            self.channel_actions.append(act)
 
         # Help menu
         help_menu = menubar.addMenu("&Help")
@@ -586,67 +549,142 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about_dialog)
         help_menu.addAction(about_action)
 
+    def _populate_voices_menu(self):
+        """Create the Voices menu actions on first open, checking the current limit."""
+        if self.voices_group is not None:
+            return
+        self.voices_group = QActionGroup(self)
+        self.voices_group.setExclusive(True)
+        sel = self._saved_voices()
+        matched = False
+        for n in range(0, 9):
+            act = QAction(f"{n}" if n else "Unlimited", self)
+            act.setCheckable(True)
+            if n == sel:
+                act.setChecked(True)
+                matched = True
+            act.setData(n)
+            self.voices_group.addAction(act)
+            self._voices_menu.addAction(act)
+            if n:
+                self.voices_actions.append(act)
+            else:
+                unlimited_act = act
+        self.voices_group.triggered.connect(self._on_voices_action)
+        if not matched:
+            unlimited_act.setChecked(True)
+        self.menu_actions['voices_actions'] = self.voices_actions
+        self.menu_actions['voices_group'] = self.voices_group
+
+    def _populate_channel_menu(self):
+        """Create the Channel submenu actions on first open, checking the current channel."""
+        if self.channel_group is not None:
+            return
+        self.channel_group = QActionGroup(self)
+        self.channel_group.setExclusive(True)
+        for ch in range(1, 17):
+            act = QAction(f"{ch}", self)
+            act.setCheckable(True)
+            act.setChecked(ch == self.current_channel)
+            act.setData(ch)
+            self.channel_group.addAction(act)
+            self._chan_menu.addAction(act)
+            self.channel_actions.append(act)
+        self.channel_group.triggered.connect(self._on_channel_action)
+
+    @Slot(QAction)
+    def _on_zoom_action(self, act: QAction):
+        """Zoom group slot; the preset scale is the action's data."""
+        self.set_zoom(float(act.data()))
+
+    @Slot(QAction)
+    def _on_size_action(self, act: QAction):
+        """Keyboard-size group slot; the size is the action's data."""
+        size = act.data()
+        if isinstance(size, int):
+            self.set_keyboard_size(size)
+
+    @Slot(QAction)
+    def _on_channel_action(self, act: QAction):
+        """Channel group slot; the 1-based channel is the action's data."""
+        self.set_channel(int(act.data()))
+
+    @Slot(QAction)
+    def _on_voices_action(self, act: QAction):
+        """Voices group slot; the action's data is the voice limit (0 = unlimited)."""
+        self._select_voices(int(act.data()))
+
+    def _saved_voices(self) -> int:
+        """Return the stored voice limit as a number, 0 meaning unlimited."""
+        sel = self.menu_actions.get('voices_selected', 'Unlimited')
+        if sel == 'Unlimited':
+            return 0
+        try:
+            return max(0, int(sel))
+        except (TypeError, ValueError):
+            return 0
+
+    def _select_voices(self, n: int):
+        """Apply a polyphony limit of ``n`` voices, or unlimited when ``n`` is 0."""
+        try:
+            if n > 0:
+                self.keyboard.set_polyphony_enabled(True)  # type: ignore[attr-defined]
+                self.keyboard.set_polyphony_max(n)  # type: ignore[attr-defined]
+            else:
+                self.keyboard.set_polyphony_enabled(False)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        self.menu_actions['voices_selected'] = str(n) if n > 0 else 'Unlimited'
+
+    @Slot(int)
     def set_keyboard_size(self, size: int):
         """Replace the central widget with a piano of ``size`` keys (49/61/73/76/88).
 
         Preserves the active channel, zoom, sustain, polyphony cap, and
         wheel-visibility preferences across the switch.
         """
-        if size == self.current_size and getattr(self, 'current_layout_type', 'piano') == 'piano':
+        was_piano = getattr(self, 'current_layout_type', 'piano') == 'piano'
+        if size == self.current_size and was_piano:
             return
         self.current_size = size
         self.current_layout_type = 'piano'
-        # Rebuild keyboard with same MIDI out
         layout = create_piano_by_size(size)
         # Show header only on 25-key keyboard
         show_header = (size == 25)
-        new_keyboard = KeyboardWidget(layout, self.keyboard.midi, show_header=show_header, scale=getattr(self.keyboard, 'ui_scale', 1.0))
-        new_keyboard.port_name = self.keyboard.port_name
-        new_keyboard.update_window_title()
-        self.setCentralWidget(new_keyboard)
-        self.keyboard.deleteLater()
-        self.keyboard = new_keyboard
+        if was_piano and isinstance(self.keyboard, KeyboardWidget) and self.keyboard._show_header == show_header:
+            # Same kind of keyboard: swap the key row in place, reusing its buttons
+            self.keyboard.set_layout(layout)
+        else:
+            # Rebuild keyboard with same MIDI out
+            new_keyboard = KeyboardWidget(layout, self.keyboard.midi, show_header=show_header, scale=getattr(self.keyboard, 'ui_scale', 1.0),
+                                          strict_noteoff=getattr(self.keyboard, 'strict_noteoff', False))
+            new_keyboard.port_name = self.keyboard.port_name
+            new_keyboard.update_window_title()
+            self.setCentralWidget(new_keyboard)
+            self.keyboard.deleteLater()
+            self.keyboard = new_keyboard
         self.keyboard.set_channel(self.current_channel)
         self._update_window_title()
-        # Preserve sustain and visual hold preferences
-        try:
-            if hasattr(self, 'menu_actions'):
-                # Visual hold
-                if 'visual_hold' in self.menu_actions:
-                    self.keyboard.visual_hold_on_sustain = self.menu_actions['visual_hold'].isChecked()
-                # Chord monitor
-                if 'chord_monitor' in self.menu_actions:
-                    chord_monitor_checked = self.menu_actions['chord_monitor'].isChecked() if hasattr(self.menu_actions['chord_monitor'], 'isChecked') else bool(self.menu_actions.get('chord_monitor', False))
-                    if hasattr(self.keyboard, 'set_chord_monitor'):
-                        self.keyboard.set_chord_monitor(chord_monitor_checked)
-                # Drag while sustain
-                if 'drag_while_sustain' in self.menu_actions:
-                    drag_while_sustain_checked = self.menu_actions['drag_while_sustain'].isChecked() if hasattr(self.menu_actions['drag_while_sustain'], 'isChecked') else bool(self.menu_actions.get('drag_while_sustain_checked', False))
-                    self.keyboard.drag_while_sustain = drag_while_sustain_checked
-                # Voices (polyphony): apply current selection (Unlimited or 1-8)
-                sel = self.menu_actions.get('voices_selected', 'Unlimited')
-                try:
-                    if sel == 'Unlimited':
-                        self.keyboard.set_polyphony_enabled(False)
-                    else:
-                        self.keyboard.set_polyphony_enabled(True)  # type: ignore[attr-defined]
-                        try:
-                            self.keyboard.set_polyphony_max(int(sel))
-                        except Exception:
-                            self.keyboard.set_polyphony_max(8)
-                except Exception:
-                    pass
-                # View menu: wheels visibility
-                try:
-                    # Prefer live QAction checked states if available
-                    mod_checked = bool(self.menu_actions['view_show_mod'].isChecked()) if 'view_show_mod' in self.menu_actions else bool(self.menu_actions.get('show_mod', False))
-                    pitch_checked = bool(self.menu_actions['view_show_pitch'].isChecked()) if 'view_show_pitch' in self.menu_actions else bool(self.menu_actions.get('show_pitch', False))
-                    self.keyboard.set_show_mod_wheel(mod_checked)
-                    self.keyboard.set_show_pitch_wheel(pitch_checked)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # Preserve sustain and visual hold preferences; the new keyboard is
+        # always a KeyboardWidget and the menus exist once __init__ has run
+        menu_actions = self.menu_actions
+        if 'visual_hold' in menu_actions:
+            self.keyboard.visual_hold_on_sustain = menu_actions['visual_hold'].isChecked()
+        # Chord monitor
+        if 'chord_monitor' in menu_actions:
+            chord_monitor_checked = menu_actions['chord_monitor'].isChecked() if hasattr(menu_actions['chord_monitor'], 'isChecked') else bool(menu_actions.get('chord_monitor', False))
+            self.keyboard.set_chord_monitor(chord_monitor_checked)
+        # Drag while sustain
+        if 'drag_while_sustain' in menu_actions:
+            drag_while_sustain_checked = menu_actions['drag_while_sustain'].isChecked() if hasattr(menu_actions['drag_while_sustain'], 'isChecked') else bool(menu_actions.get('drag_while_sustain_checked', True))
+            self.keyboard.drag_while_sustain = drag_while_sustain_checked
+        # Voices (polyphony): apply current selection (Unlimited or 1-8)
+        self._select_voices(self._saved_voices())
+        # View menu: wheels visibility; prefer live QAction checked states if available
+        mod_checked = bool(menu_actions['view_show_mod'].isChecked()) if 'view_show_mod' in menu_actions else bool(menu_actions.get('show_mod', False))
+        pitch_checked = bool(menu_actions['view_show_pitch'].isChecked()) if 'view_show_pitch' in menu_actions else bool(menu_actions.get('show_pitch', False))
+        self.keyboard.set_show_mod_wheel(mod_checked)
+        self.keyboard.set_show_pitch_wheel(pitch_checked)
         # Exclusive check is handled by QActionGroup, ensure correct one is checked
         if hasattr(self, 'size_actions') and size in self.size_actions:
             self.size_actions[size].setChecked(True)
@@ -661,18 +699,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         # Resize window for the new layout (immediate + deferred)
-        self._resize_for_layout(layout)
-        self.keyboard.adjustSize()
-        self.adjustSize()
-        QTimer.singleShot(0, lambda: (
-            self.keyboard.adjustSize(),
-            self._resize_for_layout(layout),
-            self.adjustSize()
-        ))
-
-        # Update checkmarks in menu
-        kb_menu: QMenu = self.menuBar().findChild(QMenu, None)  # type: ignore[arg-type,assignment]
-        # Not strictly necessary to update checks programmatically; actions will visually toggle by selection.
+        self._schedule_resize(layout)
 
     def _open_chord_monitor_window(self):
         """Open the chord monitor window."""
@@ -706,6 +733,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
     
+    @Slot()
     def select_midi_port(self):
         """Prompt for a new MIDI output port (no-op when sharing a launcher port)."""
         if self.midi_is_shared:
@@ -718,7 +746,7 @@ class MainWindow(QMainWindow):
             )
             return
         
-        ports = list_output_names()
+        ports = self._cached_output_names()
         if not ports:
             QMessageBox.warning(self, "MIDI", "No MIDI output ports found.")
             return
@@ -746,8 +774,114 @@ class MainWindow(QMainWindow):
         port = dlg.textValue()
         if not port:
             return
-        midi = MidiOut(port_name_contains=port)
+        self._open_port_async(port)
+
+    def _cached_output_names(self) -> list[str]:
+        """Return the MIDI output names, re-listing at most every ``_PORTS_TTL_S`` seconds."""
+        now = time.monotonic()
+        cached = self._ports_cache
+        if cached is not None and now - cached[0] < self._PORTS_TTL_S:
+            return cached[1]
+        names = list_output_names()
+        self._ports_cache = (now, names)
+        return names
+
+    @Slot()
+    def _prefetch_output_names(self):
+        """List the MIDI outputs on a worker thread while the MIDI menu is open.
+
+        By the time Select Output Port is chosen the list is usually in
+        ``_ports_cache``, so the dialog opens without enumerating devices.
+        The cache itself is only written on the GUI thread, by
+        :meth:`_on_ports_listed`.
+        """
+        if self.midi_is_shared or self._ports_prefetching:
+            return
+        cached = self._ports_cache
+        if cached is not None and time.monotonic() - cached[0] < self._PORTS_TTL_S:
+            return
+        self._ports_prefetching = True
+
+        def _list():
+            listed = None
+            try:
+                listed = (time.monotonic(), list_output_names())
+            except Exception as e:
+                print(f"Could not list MIDI ports: {e}")
+            try:
+                self._ports_listed.emit(listed)
+            except RuntimeError:
+                # Window was destroyed while the ports were listed
+                pass
+
+        threading.Thread(target=_list, name="midi-ports", daemon=True).start()
+
+    @Slot(object)
+    def _on_ports_listed(self, listed):
+        """Store a prefetched port list (runs on the GUI thread)."""
+        self._ports_prefetching = False
+        if listed is not None:
+            self._ports_cache = listed
+
+    def _open_port_async(self, port: str):
+        """Open ``port`` on a worker thread; :meth:`_on_port_opened` applies it.
+
+        Opening a device can block for tens of milliseconds in the driver,
+        so the menu action is disabled instead of freezing the window.
+        """
+        self._select_port_action.setEnabled(False)
+
+        def _open():
+            try:
+                midi = MidiOut(port_name_contains=port)
+            except Exception as e:
+                print(f"Could not open MIDI port '{port}': {e}")
+                midi = None
+            try:
+                self._port_opened.emit(midi, port)
+            except RuntimeError:
+                # Window was destroyed while the port was opening
+                if midi is not None:
+                    midi.close()
+
+        threading.Thread(target=_open, name="midi-open", daemon=True).start()
+
+    @Slot(object, str)
+    def _on_port_opened(self, midi, port: str):
+        """Apply a port opened by :meth:`_open_port_async` (runs on the GUI thread)."""
+        self._select_port_action.setEnabled(True)
+        pending = getattr(self.keyboard, 'midi', None)
+        if midi is None:
+            if isinstance(pending, PendingMidiOut):
+                # Nothing recorded so far would ever be played; stop buffering
+                pending.close()
+            QMessageBox.critical(self, "MIDI Port Error", f"Could not open port '{port}'.")
+            return
         self.keyboard.set_midi_out(midi, port_name=port)
+        if isinstance(pending, PendingMidiOut):
+            self._hand_off_pending(pending, midi, port)
+            pending.replay(midi)
+
+    def _hand_off_pending(self, pending: PendingMidiOut, midi, port: str):
+        """Give ``midi`` to every other window still holding the ``pending`` stub.
+
+        Sibling keyboards and chord monitors opened before the port was bound
+        were handed the stub; switch them now, before the stub's log is
+        replayed, so the Note Offs their switch sends are replayed too.
+        """
+        for win in list(getattr(self.app_ref, '_windows', [])):
+            try:
+                if win is not self and getattr(win.keyboard, 'midi', None) is pending:
+                    win.keyboard.set_midi_out(midi, port_name=port)
+                    win._update_window_title()
+            except Exception:
+                pass
+        for mon in list(getattr(self.app_ref, '_chord_monitor_windows', [])):
+            try:
+                if mon.replay_area.midi is pending:
+                    mon.update_midi_out(midi)
+            except Exception:
+                pass
 
     def update_midi_out(self, new_midi):
         """Update the shared MIDI output (called by the launcher when the port changes)."""
@@ -758,6 +892,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    @Slot()
     def new_keyboard_window(self):
         """Spawn a sibling :class:`MainWindow` sharing this window's MIDI output."""
         win = MainWindow(self.app_ref, size=self.current_size, port_hint=self.keyboard.port_name or "", midi=self.keyboard.midi)
@@ -782,9 +917,15 @@ class MainWindow(QMainWindow):
         # Keep reference on QApplication to prevent GC
         if not hasattr(self.app_ref, "_windows"):
             self.app_ref._windows = []  # type: ignore[attr-defined]
-        self.app_ref._windows.append(win)  # type: ignore[attr-defined]
+        windows = self.app_ref._windows  # type: ignore[attr-defined]
+        windows.append(win)
+        # Closed siblings are destroyed and forgotten rather than kept hidden,
+        # so their widgets and menus don't accumulate over a session
+        win.setAttribute(Qt.WA_DeleteOnClose, True)
+        win.destroyed.connect(lambda _obj=None, w=win: windows.remove(w) if w in windows else None)
         win.show()
 
+    @Slot(int)
     def set_channel(self, channel: int):
         """Set the global MIDI channel (1-16) and update the current keyboard widget and UI."""
         try:
@@ -795,6 +936,8 @@ class MainWindow(QMainWindow):
             ch = 1
         if ch > 16:
             ch = 16
+        if ch == self.current_channel:
+            return
         self.current_channel = ch
         # Apply to current keyboard widget
         try:
@@ -806,17 +949,18 @@ class MainWindow(QMainWindow):
         try:
             if hasattr(self, 'channel_group') and self.channel_group is not None:
                 for act in self.channel_group.actions():
-                    try:
-                        act.setChecked(int(act.text()) == ch)
-                    except Exception:
-                        pass
+                    act.setChecked(act.data() == ch)
         except Exception:
             pass
         # Refresh window title
         self._update_window_title()
 
+    @Slot(float)
     def set_zoom(self, scale: float):
-        """Rebuild the central widget at the new UI scale, preserving its state.
+        """Apply a new UI scale to the central widget.
+
+        Piano keyboards are rescaled in place; other surfaces are rebuilt
+        at the new scale with their state carried over.
 
         Args:
             scale: Multiplier (e.g. ``1.0`` for 100%, ``1.25`` for 125%).
@@ -835,7 +979,30 @@ class MainWindow(QMainWindow):
         if abs(curr - scale) < 1e-6:
             return
         self.current_scale = scale
-        # Rebuild central widget with same layout type and MIDI out, preserving state
+        if self.current_layout_type == 'piano' and isinstance(self.keyboard, KeyboardWidget):
+            # Pianos rescale in place; notes, sustain and velocity settings carry over
+            self.keyboard.set_ui_scale(scale)
+            layout = self.keyboard.layout_model
+        else:
+            layout = self._rebuild_at_scale(scale)
+        # Persist zoom selection
+        self.menu_actions['zoom_scale'] = self.current_scale
+        # Update checkmarks in menu; each action carries its scale as data
+        try:
+            if hasattr(self, 'zoom_group'):
+                for act in self.zoom_group.actions():
+                    act.setChecked(abs(float(act.data()) - scale) < 1e-6)
+        except Exception:
+            pass
+        # Resize window for new scale
+        self._schedule_resize(layout)
+
+    def _rebuild_at_scale(self, scale: float):
+        """Replace the central widget with one built at ``scale``, preserving its state.
+
+        Used by :meth:`set_zoom` for surfaces that cannot rescale in place.
+        Returns the layout passed on to :meth:`_schedule_resize`.
+        """
         if getattr(self, 'current_layout_type', 'piano') == 'pad4x4':
             layout = create_pad_grid_layout(4, 4)
             new_widget = PadGridWidget(layout, self.keyboard.midi, scale=scale)
@@ -899,7 +1066,8 @@ class MainWindow(QMainWindow):
             layout = create_piano_by_size(self.current_size)
             # Show header only on 25-key keyboard
             show_header = (self.current_size == 25)
-            new_widget = KeyboardWidget(layout, self.keyboard.midi, show_header=show_header, scale=scale)
+            new_widget = KeyboardWidget(layout, self.keyboard.midi, show_header=show_header, scale=scale,
+                                        strict_noteoff=getattr(self.keyboard, 'strict_noteoff', False))
             try:
                 new_widget.port_name = self.keyboard.port_name  # type: ignore[attr-defined]
             except Exception:
@@ -956,33 +1124,38 @@ class MainWindow(QMainWindow):
                     self.keyboard.set_polyphony_max(8)  # type: ignore[attr-defined]
         except Exception:
             pass
-        # Persist zoom selection
-        self.menu_actions['zoom_scale'] = self.current_scale
-        # Update checkmarks in menu
+        return layout
+
+    def _schedule_resize(self, layout=None):
+        """Queue a deferred fit of the window to the current central widget.
+
+        Requests made before the event loop next runs collapse into one
+        :meth:`_do_deferred_resize` pass; the latest ``layout`` wins.
+        """
+        self._resize_layout = layout
+        if not self._resize_timer.isActive():
+            self._resize_timer.start()
+
+    def _do_deferred_resize(self, settle: bool = True):
+        """Run the queued window fit (see :meth:`_schedule_resize`).
+
+        When the fit changes the window size, the central widget only takes
+        its final height once that new geometry has been laid out, so one
+        follow-up pass is queued for the next event-loop turn.
+        """
+        layout, self._resize_layout = self._resize_layout, None
+        before = self.size()
+        # Repaint once after the fit instead of at each intermediate geometry
+        self.setUpdatesEnabled(False)
         try:
-            if hasattr(self, 'zoom_group'):
-                for act in self.zoom_group.actions():
-                    txt = act.text()
-                    try:
-                        pct = 1.0
-                        if '%' in txt:
-                            pct = float(txt.split('%')[0]) / 100.0
-                        if 'default' in txt.lower():
-                            pct = 1.0
-                    except Exception:
-                        pct = 1.0
-                    act.setChecked(abs(pct - scale) < 1e-6)
+            self._resize_for_layout(layout)
+            self.adjustSize()
         except Exception:
             pass
-        # Resize window for new scale
-        self._resize_for_layout(layout)
-        self.keyboard.adjustSize()
-        self.adjustSize()
-        QTimer.singleShot(0, lambda: (
-            self.keyboard.adjustSize(),
-            self._resize_for_layout(layout),
-            self.adjustSize()
-        ))
+        finally:
+            self.setUpdatesEnabled(True)
+        if settle and self.size() != before and not self._resize_timer.isActive():
+            QTimer.singleShot(0, lambda: self._do_deferred_resize(settle=False))
 
     def _resize_for_layout(self, layout):
         """Resize the window to fit the current central widget.
@@ -992,9 +1165,11 @@ class MainWindow(QMainWindow):
         ``columns * 44`` scaled by ``ui_scale``. Pad grid, faders, and
         XY fader widgets are sized to their hint exactly.
         """
+        kb = self.keyboard
+        piano_container = getattr(kb, 'piano_container', None)
         # Prefer the central widget's own size hint; this works for both piano and pad grid.
         try:
-            kb_hint = self.keyboard.sizeHint()
+            kb_hint = kb.sizeHint()
             content_width = int(kb_hint.width())
             content_height = int(kb_hint.height())
         except Exception:
@@ -1004,19 +1179,19 @@ class MainWindow(QMainWindow):
         if content_width is None or content_height is None:
             # Compute content width from piano + optional left panel and controls (whichever is wider)
             content_width = None
-            if hasattr(self, 'keyboard') and hasattr(self.keyboard, 'piano_container'):
+            if piano_container is not None:
                 try:
-                    w_piano = int(self.keyboard.piano_container.width())  # type: ignore[attr-defined]
+                    w_piano = int(piano_container.width())
                 except Exception:
                     w_piano = None
                 # Include left panel (wheels) width when visible
                 try:
-                    left_panel = getattr(self.keyboard, 'left_panel', None)
+                    left_panel = getattr(kb, 'left_panel', None)
                     w_left = int(left_panel.width()) if (left_panel is not None and left_panel.isVisible()) else 0
                 except Exception:
                     w_left = 0
                 try:
-                    controls_widget = getattr(self.keyboard, 'controls_widget', None)
+                    controls_widget = getattr(kb, 'controls_widget', None)
                     w_controls = int(controls_widget.width()) if controls_widget is not None else 0
                 except Exception:
                     w_controls = 0
@@ -1029,13 +1204,13 @@ class MainWindow(QMainWindow):
                     columns = 36
                 # Respect current UI scale as used by KeyboardWidget
                 try:
-                    scale = float(getattr(self.keyboard, 'ui_scale', 1.0))
+                    scale = float(getattr(kb, 'ui_scale', 1.0))
                 except Exception:
                     scale = 1.0
                 content_width = int(columns * 44 * scale)  # matches KeyboardWidget white key base width
             # Height: central widget hint if available
             try:
-                content_height = max(self.keyboard.minimumSizeHint().height(), self.keyboard.sizeHint().height())
+                content_height = max(kb.minimumSizeHint().height(), kb.sizeHint().height())
             except Exception:
                 content_height = 180
 
@@ -1043,36 +1218,25 @@ class MainWindow(QMainWindow):
         target_width = int(content_width + side_padding)
         # Height: add menubar height + margin
         try:
-            menu_h = self.menuBar().sizeHint().height()
+            menu_h = self._menubar.sizeHint().height()
         except Exception:
             menu_h = 0
         # Safety buffer to ensure the menu is never clipped (accounts for DPI/titlebar quirks)
         vertical_padding = 32
         target_height = int(content_height + menu_h + vertical_padding)
 
-        # Update child geometry (piano-specific safe guard)
-        try:
-            if hasattr(self.keyboard, 'piano_container'):
-                self.keyboard.piano_container.updateGeometry()  # type: ignore[attr-defined]
-            self.keyboard.updateGeometry()
-        except Exception:
-            pass
-
         # For piano widgets, we constrain width to content_width to prevent stretching.
         # For pad grid/other fixed widgets, let their sizeHint govern.
-        is_fixed = isinstance(self.keyboard, (PadGridWidget, FadersWidget, XYFaderWidget))
+        is_fixed = isinstance(kb, (PadGridWidget, FadersWidget, XYFaderWidget))
         if not is_fixed:
             try:
-                self.keyboard.setMinimumWidth(int(content_width))
-                self.keyboard.setMaximumWidth(int(content_width))
-                self.keyboard.setFixedWidth(int(content_width))
+                kb.setFixedWidth(int(content_width))
             except Exception:
                 pass
         else:
             try:
                 # Ensure pad grid uses its hint without external constraints
-                self.keyboard.setMinimumSize(self.keyboard.sizeHint())
-                self.keyboard.setMaximumSize(self.keyboard.sizeHint())
+                kb.setFixedSize(kb.sizeHint())
             except Exception:
                 pass
 
@@ -1082,37 +1246,17 @@ class MainWindow(QMainWindow):
         self.resize(target_width, target_height)
         self.setMaximumSize(16777215, 16777215)
     def _get_zoom_presets(self) -> list[float]:
-        """Return the configured zoom presets as scale factors (e.g. ``[0.5, 0.75, ...]``)."""
-        scales: list[float] = []
-        try:
-            acts = getattr(self, 'zoom_actions', [])
-            for act in acts:
-                txt = act.text()
-                sc = 1.0
-                try:
-                    if '%' in txt:
-                        pct = float(txt.split('%')[0].split()[0])
-                        sc = pct / 100.0
-                    elif 'default' in txt.lower():
-                        sc = 1.0
-                except Exception:
-                    sc = 1.0
-                scales.append(sc)
-        except Exception:
-            pass
-        # Fallback
-        if not scales:
-            scales = [0.50, 0.75, 0.90, 1.00, 1.10, 1.25, 1.50, 2.00]
-        return scales
+        """Return the zoom presets as ascending scale factors (e.g. ``[0.5, 0.75, ...]``)."""
+        # Recorded when the Zoom menu is built; fallback if that failed
+        return getattr(self, '_zoom_presets', None) or [0.50, 0.75, 0.90, 1.00, 1.10, 1.25, 1.50, 2.00]
 
+    @Slot()
     def _zoom_in_step(self):
         """Step up to the next preset zoom level (Ctrl++)."""
-        scales = self._get_zoom_presets()
+        scales_sorted = self._get_zoom_presets()
         curr = float(getattr(self, 'current_scale', 1.0))
         # find nearest index >= curr
         try:
-            # ensure ascending
-            scales_sorted = sorted(scales)
             idx = 0
             for i, sc in enumerate(scales_sorted):
                 if sc >= curr - 1e-6:
@@ -1124,12 +1268,12 @@ class MainWindow(QMainWindow):
         except Exception:
             self.set_zoom(min(2.0, curr * 1.1))
 
+    @Slot()
     def _zoom_out_step(self):
         """Step down to the previous preset zoom level (Ctrl+-)."""
-        scales = self._get_zoom_presets()
+        scales_sorted = self._get_zoom_presets()
         curr = float(getattr(self, 'current_scale', 1.0))
         try:
-            scales_sorted = sorted(scales)
             idx = 0
             for i, sc in enumerate(scales_sorted):
                 if sc > curr + 1e-6:
@@ -1140,6 +1284,7 @@ class MainWindow(QMainWindow):
             self.set_zoom(scales_sorted[new_idx])
         except Exception:
             self.set_zoom(max(0.5, curr / 1.1))
+    @Slot()
     def show_keyboard_shortcuts(self):
         """Show a small modal listing the keyboard shortcut bindings."""
         text = (
@@ -1155,6 +1300,7 @@ class MainWindow(QMainWindow):
         )
         QMessageBox.information(self, "Keyboard Shortcuts", text)
     
+    @Slot()
     def show_user_guide(self):
         """Show the rich-text user guide in a scrollable modal dialog."""
         dialog = QDialog(self)
@@ -1258,6 +1404,7 @@ class MainWindow(QMainWindow):
         
         dialog.exec()
     
+    @Slot()
     def show_chord_monitor_help(self):
         """Show Chord Monitor specific help dialog."""
         dialog = QDialog(self)
@@ -1375,18 +1522,11 @@ class MainWindow(QMainWindow):
         
         dialog.exec()
 
+    @Slot()
     def show_about_dialog(self):
         """Show the About dialog with logo, copyright, feature summary, and current port."""
         year = datetime.now().year
-        # Build logo HTML at the top, centered
-        logo_html = ""
-        try:
-            logo_path = Path(__file__).resolve().parent.parent / "Octavium logo.png"
-            if logo_path.exists():
-                logo_url = QUrl.fromLocalFile(str(logo_path)).toString()
-                logo_html = f"<div style='text-align:center; margin-bottom:10px'><img src='{logo_url}' width='320'></div>"
-        except Exception:
-            pass
+        logo_html = _about_logo_html()
         text = (
             f"{logo_html}"
             "<b>Octavium - Virtual MIDI Keyboard</b><br><br>"
@@ -1440,8 +1580,34 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _load_prefs(self) -> dict:
+        """Return the saved menu preferences, falling back to ``_SAVED_PREFS``."""
+        prefs = dict(self._SAVED_PREFS)
+        try:
+            settings = QSettings()
+            for key, default in self._SAVED_PREFS.items():
+                prefs[key] = settings.value(key, default, type=type(default))
+        except Exception:
+            pass
+        return prefs
+
+    def _save_prefs(self):
+        """Write the current menu preferences for the next launch.
+
+        Preferences are app-wide, not per window: with several keyboard
+        windows open, the one closed last decides what the next launch uses.
+        """
+        try:
+            settings = QSettings()
+            for key in self._SAVED_PREFS:
+                if key in self.menu_actions:
+                    settings.setValue(key, self.menu_actions[key])
+        except Exception:
+            pass
+
     def closeEvent(self, event):  # type: ignore[override]
-        """Close the chord monitor and MIDI port before tearing down the window."""
+        """Save preferences, then close the chord monitor and MIDI port before tearing down the window."""
+        self._save_prefs()
         try:
             self._close_chord_monitor_window()
         except Exception:
@@ -1477,6 +1643,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    @Slot()
     def set_pad_grid(self):
         """Switch to a 4x4 beat grid layout/widget."""
         try:
@@ -1518,17 +1685,11 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self._update_window_title()
-            self._resize_for_layout(layout)
-            self.keyboard.adjustSize()
-            self.adjustSize()
-            QTimer.singleShot(0, lambda: (
-                self.keyboard.adjustSize(),
-                self._resize_for_layout(layout),
-                self.adjustSize()
-            ))
+            self._schedule_resize(layout)
         except Exception:
             pass
 
+    @Slot()
     def set_faders(self):
         """Switch to the Faders surface widget."""
         try:
@@ -1566,14 +1727,7 @@ class MainWindow(QMainWindow):
                 pass
             self._update_window_title()
             # use widget sizeHint for window sizing
-            self._resize_for_layout(None)
-            self.keyboard.adjustSize()
-            self.adjustSize()
-            QTimer.singleShot(0, lambda: (
-                self.keyboard.adjustSize(),
-                self._resize_for_layout(None),
-                self.adjustSize()
-            ))
+            self._schedule_resize()
         except Exception:
             pass
 
@@ -1586,6 +1740,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    @Slot()
     def open_faders_cc_dialog(self):
         """Show a modal dialog letting the user assign CC numbers to all eight faders."""
         try:
@@ -1632,8 +1787,9 @@ class MainWindow(QMainWindow):
 
 def run():
     """Module entry point: create the QApplication and show a single keyboard window."""
-    from .faders import FadersWidget
     app = QApplication(sys.argv)
+    app.setOrganizationName("Octavium")
+    app.setApplicationName("Octavium")
     app.setStyleSheet(APP_STYLES)
     # Set application icon as well (project-relative)
     try:
@@ -10,6 +10,9 @@ import pygame.midi
 import sys
 import importlib.util
 import atexit
+import threading
+import weakref
+from collections import deque
 
 # Choose a concrete Mido backend based on availability to avoid noisy ImportErrors
 _has_rtmidi = importlib.util.find_spec('rtmidi') is not None
@@ -50,6 +53,9 @@ except Exception:
 # Track pygame.midi initialization state globally to avoid double-quit
 _pygame_midi_initialized = False
 _active_midi_ports = []
+# Guards backend init, device enumeration and port opening: ports are listed
+# and opened on worker threads, and PortMidi's init is not thread-safe
+_backend_lock = threading.Lock()
 
 def _cleanup_pygame_midi():
     """Cleanup pygame.midi at program exit to prevent __del__ errors.
@@ -98,9 +104,11 @@ class MidiOut:
     Mido is preferred; pygame.midi is used as a fallback when no Mido backend
     is available. Instances marked ``is_shared`` are not closed by
     :meth:`close` so the launcher can manage their lifetime centrally.
+    Sends are serialized per port, so any thread may write to an instance.
     """
 
-    def __init__(self, port_name_contains: str | None = None, is_shared: bool = False):
+    def __init__(self, port_name_contains: str | None = None, is_shared: bool = False,
+                 available_ports: list[str] | None = None):
         """Open the first matching MIDI output port.
 
         Args:
@@ -108,21 +116,34 @@ class MidiOut:
                 found the first available output is used.
             is_shared: If ``True``, :meth:`close` becomes a no-op so the
                 owning process can keep the port open across widgets.
+            available_ports: Mido output names the caller has already
+                enumerated; reused instead of querying the backend again.
 
         Raises:
             RuntimeError: When no MIDI outputs are available on either backend.
         """
         self.use_pygame = False
         self.is_shared = is_shared  # If True, don't close port on cleanup
+        # Serializes writes: a shared port is written from the GUI thread by
+        # some windows and from a send-queue worker by others
+        self._send_lock = threading.Lock()
+        with _backend_lock:
+            self._open(port_name_contains, available_ports)
+
+    def _open(self, port_name_contains: str | None, available_ports: list[str] | None):
+        """Open the port for :meth:`__init__`; the caller holds ``_backend_lock``."""
         try:
             name = None
+            if available_ports is not None:
+                outs = list(available_ports)
+            else:
+                outs = list(mido.get_output_names())  # type: ignore[attr-defined]
             if port_name_contains:
-                for n in mido.get_output_names():  # type: ignore[attr-defined]
+                for n in outs:
                     if port_name_contains.lower() in n.lower():
                         name = n
                         break
             if name is None:
-                outs = mido.get_output_names()  # type: ignore[attr-defined]
                 if not outs:
                     raise RuntimeError("No MIDI outputs found with mido")
                 name = outs[0]
@@ -180,12 +201,13 @@ class MidiOut:
         """Send a Note On message; velocity is clamped to ``[1, 127]``."""
         try:
             velocity = max(1, min(127, velocity))
-            if self.use_pygame:
-                # pygame MIDI format: [status_byte, data1, data2]
-                status = 0x90 + channel  # note on + channel
-                self.port.write_short(status, note, velocity)
-            else:
-                self.port.send(mido.Message("note_on", note=note, velocity=velocity, channel=channel))  # type: ignore[attr-defined]
+            with self._send_lock:
+                if self.use_pygame:
+                    # pygame MIDI format: [status_byte, data1, data2]
+                    status = 0x90 + channel  # note on + channel
+                    self.port.write_short(status, note, velocity)
+                else:
+                    self.port.send(mido.Message("note_on", note=note, velocity=velocity, channel=channel))  # type: ignore[attr-defined]
             if not getattr(self, '_first_note_logged', False):
                 self._first_note_logged = True
                 backend = "pygame" if self.use_pygame else "mido"
@@ -198,12 +220,13 @@ class MidiOut:
     def note_off(self, note: int, channel: int = 0):
         """Send a Note Off message; failures are silently ignored."""
         try:
-            if self.use_pygame:
-                # pygame MIDI format: [status_byte, data1, data2]
-                status = 0x80 + channel  # note off + channel
-                self.port.write_short(status, note, 0)
-            else:
-                self.port.send(mido.Message("note_off", note=note, velocity=0, channel=channel))  # type: ignore[attr-defined]
+            with self._send_lock:
+                if self.use_pygame:
+                    # pygame MIDI format: [status_byte, data1, data2]
+                    status = 0x80 + channel  # note off + channel
+                    self.port.write_short(status, note, 0)
+                else:
+                    self.port.send(mido.Message("note_off", note=note, velocity=0, channel=channel))  # type: ignore[attr-defined]
         except (ValueError, AttributeError, RuntimeError):
             # Port might be closed or unavailable - silently ignore
             pass
@@ -215,12 +238,13 @@ class MidiOut:
         """Send a Control Change message; ``value`` is clamped to ``[0, 127]``."""
         try:
             value = max(0, min(127, value))
-            if self.use_pygame:
-                # pygame MIDI format: [status_byte, data1, data2]
-                status = 0xB0 + channel  # control change + channel
-                self.port.write_short(status, cc, value)
-            else:
-                self.port.send(mido.Message("control_change", control=cc, value=value, channel=channel))  # type: ignore[attr-defined]
+            with self._send_lock:
+                if self.use_pygame:
+                    # pygame MIDI format: [status_byte, data1, data2]
+                    status = 0xB0 + channel  # control change + channel
+                    self.port.write_short(status, cc, value)
+                else:
+                    self.port.send(mido.Message("control_change", control=cc, value=value, channel=channel))  # type: ignore[attr-defined]
         except (ValueError, AttributeError, RuntimeError):
             # Port might be closed or unavailable - silently ignore
             pass
@@ -237,15 +261,16 @@ class MidiOut:
         """
         try:
             v = max(-8192, min(8191, int(value)))
-            if self.use_pygame:
-                # Convert to 14-bit unsigned 0..16383
-                v14 = v + 8192
-                lsb = v14 & 0x7F
-                msb = (v14 >> 7) & 0x7F
-                status = 0xE0 + channel
-                self.port.write_short(status, lsb, msb)
-            else:
-                self.port.send(mido.Message("pitchwheel", pitch=v, channel=channel))  # type: ignore[attr-defined]
+            with self._send_lock:
+                if self.use_pygame:
+                    # Convert to 14-bit unsigned 0..16383
+                    v14 = v + 8192
+                    lsb = v14 & 0x7F
+                    msb = (v14 >> 7) & 0x7F
+                    status = 0xE0 + channel
+                    self.port.write_short(status, lsb, msb)
+                else:
+                    self.port.send(mido.Message("pitchwheel", pitch=v, channel=channel))  # type: ignore[attr-defined]
         except (ValueError, AttributeError, RuntimeError):
             # Port might be closed or unavailable - silently ignore
             pass
@@ -260,13 +285,14 @@ class MidiOut:
             return
         
         try:
-            if hasattr(self, 'port') and self.port is not None:
-                try:
-                    # mido ports have .close(); pygame Output has .close()
-                    self.port.close()
-                except Exception:
-                    pass
-                self.port = None
+            with self._send_lock:
+                if hasattr(self, 'port') and self.port is not None:
+                    try:
+                        # mido ports have .close(); pygame Output has .close()
+                        self.port.close()
+                    except Exception:
+                        pass
+                    self.port = None
         except Exception:
             pass
         # Note: Don't call pygame.midi.quit() here - let it be managed globally
@@ -290,10 +316,213 @@ class MidiOut:
             # Silently ignore any errors during shutdown
             pass
 
+class MidiSendQueue:
+    """Background sender that performs MIDI writes off the calling (GUI) thread.
+
+    Calls are recorded as ``(method_name, args)`` on a deque and replayed
+    against the output by a daemon thread in FIFO order. A wheel message
+    (pitch bend or CC 1) that is still the newest queued entry when another
+    value for the same wheel and channel arrives is replaced by it, so wheel
+    sweeps collapse without ever moving a value across a note. The output is held
+    by weak reference so the queue never keeps a closed port alive, and the
+    worker exits once the output is garbage-collected. Use
+    :func:`send_queue` to get the single queue shared by every widget that
+    writes to the same output.
+    """
+
+    def __init__(self, midi_out):
+        """Start the worker thread for ``midi_out``."""
+        self._out = weakref.ref(midi_out)
+        self._q: deque = deque()
+        self._evt = threading.Event()
+        self._stop = threading.Event()
+        # Wake the worker so it can exit when the output goes away; the
+        # finalizer holds only the two events, never the queue itself
+        weakref.finalize(midi_out, _stop_sender, self._stop, self._evt)
+        self._lock = threading.Lock()  # serializes dequeue+write to the port
+        self._thread = threading.Thread(target=self._run, name="midi-send", daemon=True)
+        self._thread.start()
+
+    def post(self, method: str, *args):
+        """Queue ``midi_out.<method>(*args)`` and wake the worker.
+
+        Called from one thread (the GUI thread); only the worker consumes.
+        """
+        q = self._q
+        key = self._wheel_key(method, args)
+        if key is not None:
+            try:
+                last = q[-1]
+            except IndexError:
+                last = None
+            if last is not None and self._wheel_key(*last) == key:
+                # Superseded by this value. Taking it back off the tail is safe
+                # with a single producer: if the worker got there first, pop()
+                # finds the deque empty and the old value has simply gone out.
+                try:
+                    q.pop()
+                except IndexError:
+                    pass
+        q.append((method, args))
+        self._evt.set()
+
+    @staticmethod
+    def _wheel_key(method: str, args: tuple):
+        """Return the coalescing key for a wheel message, else ``None``.
+
+        Only pitch bend and modulation are continuous: for them the newest
+        value makes any older queued one redundant. Other CCs (sustain,
+        All Notes Off, ...) are switches whose every change must be sent.
+        """
+        if method == 'pitch_bend' and len(args) == 2:
+            return ('pitch_bend', args[1])
+        if method == 'cc' and len(args) == 3 and args[0] == 1:
+            return ('cc', 1, args[2])
+        return None
+
+    def drain(self):
+        """Send everything queued so far on the calling thread."""
+        self._dispatch_pending()
+
+    def _dispatch_pending(self) -> bool:
+        """Dispatch queued calls; return ``False`` once the output is gone."""
+        q = self._q
+        while q:
+            # Pop and write under one lock so a drain() on another thread can
+            # never overtake a message the worker has already dequeued
+            with self._lock:
+                try:
+                    method, args = q.popleft()
+                except IndexError:
+                    break
+                out = self._out()
+                if out is None:
+                    return False
+                try:
+                    getattr(out, method)(*args)
+                except Exception:
+                    pass
+        return True
+
+    def _run(self):
+        """Worker loop: sleep until woken, then send everything queued."""
+        while True:
+            self._evt.wait()
+            self._evt.clear()
+            if self._stop.is_set() or not self._dispatch_pending():
+                return
+
+
+def _stop_sender(stop: threading.Event, wake: threading.Event):
+    """Ask a :class:`MidiSendQueue` worker to exit (output finalizer)."""
+    stop.set()
+    wake.set()
+
+
+_send_queues: "weakref.WeakKeyDictionary[object, MidiSendQueue]" = weakref.WeakKeyDictionary()
+
+
+def send_queue(midi_out) -> "MidiSendQueue | PendingMidiOut":
+    """Return the :class:`MidiSendQueue` for ``midi_out``, creating it on first use.
+
+    A :class:`PendingMidiOut` is returned as is: recording never blocks, and
+    posting to it directly keeps its log on the GUI thread.
+    """
+    if isinstance(midi_out, PendingMidiOut):
+        return midi_out
+    q = _send_queues.get(midi_out)
+    if q is None:
+        q = MidiSendQueue(midi_out)
+        _send_queues[midi_out] = q
+    return q
+
+
+class PendingMidiOut:
+    """Stand-in output that records calls until the real :class:`MidiOut` opens.
+
+    Lets a window come up while the driver is still binding the port; once
+    it is open, :meth:`replay` queues everything recorded, oldest first, and
+    any later call is queued behind it on the real output. The log is
+    capped at ``_MAX_CALLS``; the oldest calls go first, so a Note Off is
+    only ever dropped after its Note On and no note is left hanging.
+
+    It also stands in for its own send queue (see :func:`send_queue`), so
+    it is only ever called from the GUI thread.
+    """
+
+    use_pygame = False
+    is_shared = False
+    _MAX_CALLS = 512
+
+    def __init__(self):
+        """Start with an empty call log."""
+        self._calls: deque = deque(maxlen=self._MAX_CALLS)
+        self._target = None  # real output once replay() has run
+        self._closed = False
+
+    def post(self, method: str, *args):
+        """Queue-compatible entry point: record ``<method>(*args)``."""
+        self._record(method, args)
+
+    def drain(self):
+        """Queue-compatible no-op; recorded calls wait for :meth:`replay`."""
+
+    def _record(self, method: str, args: tuple):
+        """Log a call, or pass it to the real output's queue once known."""
+        target = self._target
+        if target is not None:
+            send_queue(target).post(method, *args)
+        elif not self._closed:
+            self._calls.append((method, args))
+
+    def note_on(self, note: int, velocity: int, channel: int = 0):
+        """Record a Note On."""
+        self._record('note_on', (note, velocity, channel))
+
+    def note_off(self, note: int, channel: int = 0):
+        """Record a Note Off."""
+        self._record('note_off', (note, channel))
+
+    def cc(self, cc: int, value: int, channel: int = 0):
+        """Record a Control Change."""
+        self._record('cc', (cc, value, channel))
+
+    def pitch_bend(self, value: int, channel: int = 0):
+        """Record a pitch bend."""
+        self._record('pitch_bend', (value, channel))
+
+    def close(self):
+        """Discard anything recorded and stop recording; there is no port to close.
+
+        Used when the port failed to open, so nothing is kept for a replay
+        that may never come. A later :meth:`replay` still hands over.
+        """
+        self._closed = True
+        self._calls.clear()
+
+    def replay(self, midi_out):
+        """Queue every recorded call on ``midi_out`` in order, then forward to it.
+
+        Later calls go through the same queue, so they stay behind the log.
+        """
+        q = send_queue(midi_out)
+        calls = self._calls
+        while calls:
+            method, args = calls.popleft()
+            q.post(method, *args)
+        self._target = midi_out
+
+
 def list_output_names() -> list[str]:
     """Return a list of available MIDI output port names.
     Uses mido when available; falls back to pygame.midi device names.
+    Safe to call from any thread.
     """
+    with _backend_lock:
+        return _list_output_names()
+
+def _list_output_names() -> list[str]:
+    """Body of :func:`list_output_names`; the caller holds ``_backend_lock``."""
     global _pygame_midi_initialized
     names: list[str] = []
     
@@ -4,3 +4,149 @@ APP_STYLES = """
 QWidget { font-size: 14px; }
 QPushButton { border-radius: 10px; padding: 8px; }
 """
+
+# Keyboard header toggles, matched by object name so every keyboard window
+# shares one parsed sheet instead of styling each button individually.
+KEYBOARD_HEADER_STYLES = """
+QPushButton#kbSustainBtn, QPushButton#kbLatchBtn, QPushButton#kbAllOffBtn {
+    padding: 1px 4px;
+    min-height: 0px;
+    border-radius: 3px;
+    border: 1px solid #888;
+    background-color: #f3f3f3;
+    color: #222;
+}
+QPushButton#kbSustainBtn:checked, QPushButton#kbLatchBtn:checked {
+    background-color: #3498db; /* blue */
+    color: white;
+    border: 1px solid #2980b9;
+}
+QPushButton#kbSustainBtn:hover, QPushButton#kbLatchBtn:hover { background-color: #e9e9e9; }
+QPushButton#kbSustainBtn:pressed, QPushButton#kbLatchBtn:pressed { background-color: #dcdcdc; }
+QPushButton#kbSustainBtn:checked:hover, QPushButton#kbLatchBtn:checked:hover { background-color: #2f8ccc; }
+QPushButton#kbSustainBtn:checked:pressed, QPushButton#kbLatchBtn:checked:pressed { background-color: #2a7fb8; }
+QPushButton#kbAllOffBtn { background-color: #fafafa; }
+QPushButton#kbAllOffBtn:hover { background-color: #f0f0f0; }
+QPushButton#kbAllOffBtn:pressed { background-color: #e5e5e5; }
+/* Brief blue flash after All Notes Off, matching the checked Sustain/Latch blue */
+QPushButton#kbAllOffBtn[flash="true"] {
+    color: white;
+    background-color: #3498db;
+    border: 1px solid #2980b9;
+}
+QPushButton#kbAllOffBtn[flash="true"]:hover { background-color: #2f8ccc; }
+QPushButton#kbAllOffBtn[flash="true"]:pressed { background-color: #2a7fb8; }
+"""
+
+# Key looks, applied once on the piano container and matched via the keyrole property.
+# Visual states come from the active/held/hovered dynamic properties set by the widget.
+_KEYBOARD_WHITE_KEY_STYLES = """
+QPushButton[keyrole="white"] {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #ffffff, stop:0.25 #fbfbfb, stop:0.55 #f3f3f3, stop:1 #e7e7e7);
+    border-top: 1px solid #d8d8d8;
+    border-left: 1px solid #dadada;
+    border-right: 1px solid #cfcfcf; /* slightly darker right edge */
+    border-bottom: 2px solid #bbbbbb; /* subtle bottom lip */
+    border-radius: 0px;
+}
+/* Explicit hover property, not Qt :hover, so we control it during drag */
+QPushButton[keyrole="white"][hovered="true"] {
+    /* Darken slightly on hover for white keys */
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #f2f2f2, stop:0.5 #e8e8e8, stop:1 #dddddd);
+}
+QPushButton[keyrole="white"][active="true"] {
+    /* Fill entire key with activation blue */
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #6bb8ff, stop:1 #2f82e6);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #1b64c7;
+}
+/* Keep active look even when hovered */
+QPushButton[keyrole="white"][active="true"]:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #6bb8ff, stop:1 #2f82e6);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #1b64c7;
+}
+QPushButton[keyrole="white"][held="true"] {
+    /* Slightly different blue for held to differentiate subtly */
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #5fb1ff, stop:1 #2b7ade);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #1b64c7;
+}
+/* Keep held look even when hovered */
+QPushButton[keyrole="white"][held="true"]:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #5fb1ff, stop:1 #2b7ade);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #1b64c7;
+}
+"""
+
+_KEYBOARD_BLACK_KEY_STYLES = """
+QPushButton[keyrole="black"] {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3a3a3a, stop:0.12 #2a2a2a, stop:0.5 #121212, stop:1 #050505);
+    border-top: 1px solid #3a3a3a;
+    border-left: 1px solid #222;
+    border-right: 1px solid #222;
+    border-bottom: 2px solid #0b0b0b;
+    border-radius: 3px;
+}
+/* Explicit hover property, not Qt :hover */
+QPushButton[keyrole="black"][hovered="true"] {
+    /* Lighten slightly on hover for black keys */
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #484848, stop:0.5 #222222, stop:1 #0a0a0a);
+}
+QPushButton[keyrole="black"][active="true"] {
+    /* Fill entire key with activation blue */
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4aa3ff, stop:1 #2f82e6);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #0a0a0a;
+}
+/* Keep active look even when hovered */
+QPushButton[keyrole="black"][active="true"]:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4aa3ff, stop:1 #2f82e6);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #0a0a0a;
+}
+QPushButton[keyrole="black"][held="true"] {
+    /* Slightly darker blue for held */
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3f9cff, stop:1 #2b7ade);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #0b0b0b;
+}
+/* Keep held look even when hovered */
+QPushButton[keyrole="black"][held="true"]:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3f9cff, stop:1 #2b7ade);
+    border-top: 1px solid #2f82e6;
+    border-left: 1px solid #2f82e6;
+    border-right: 1px solid #2f82e6;
+    border-bottom: 2px solid #0b0b0b;
+}
+"""
+
+# Joined once at import; every keyboard's piano container gets this same string.
+KEYBOARD_KEY_STYLES = _KEYBOARD_WHITE_KEY_STYLES + _KEYBOARD_BLACK_KEY_STYLES